@@ -0,0 +1,62 @@
+# Benchmark du nombre de nœuds par seconde explorés par l'algorithme AlphaBeta.
+import random
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+
+
+def positions_test(taille: int, nombre: int, graine: int | None = 0):
+    """
+    Retourne une liste de plateaux obtenus en jouant des coups aléatoires depuis la position de départ.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            nombre (int) : Le nombre de plateaux à générer.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            list : Une liste de couples (plateau, joueur_actuel).
+    """
+    rng = random.Random(graine)
+    positions = [(Board(taille=taille), 1)]
+    while len(positions) < nombre:
+        plateau = Board(taille=taille)
+        joueur = 1
+        for _ in range(rng.randint(2, 3 * taille)):
+            if plateau.etat() is not None:
+                break
+            plateau.joue(*rng.choice(plateau.get_liste_coups_possible(joueur=joueur)))
+            joueur *= -1
+        if plateau.etat() is None:
+            positions.append((plateau, joueur))
+    return positions
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int):
+    """
+    Évalue des positions de test avec AlphaBeta et affiche le nombre de nœuds par seconde.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions évaluées.
+    """
+    noeuds = 0
+    debut = time.perf_counter()
+    for plateau, joueur in positions_test(taille=taille, nombre=nombre_positions):
+        algo = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur)
+        algo.evaluate()
+        noeuds += algo.noeuds
+    duree = time.perf_counter() - debut
+    print(f"taille={taille:<3} profondeur={profondeur:<3} noeuds={noeuds:<9} temps={duree:7.3f}s "
+          f"noeuds/s={noeuds / duree:,.0f}")
+
+
+if __name__ == "__main__":
+    profondeur_max = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    for taille_plateau in (4, 6, 8, 10):
+        bench(taille=taille_plateau, profondeur=profondeur_max, nombre_positions=10)
@@ -0,0 +1,82 @@
+# Vérification et débit de l'écriture et de la lecture (mmap) d'un fichier de positions.
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import numpy as np
+
+from src.game_engine.base_positions import EcrivainPositions, ObservateurEnregistrement, LecteurPositions
+from src.game_engine.game import GameEngine
+from src.players.bots.algorithms.evaluation import evalue_lot
+from src.players.bots.bot import RandomBot
+
+
+def bench(taille: int, nombre_parties: int, graine: int | None = 0):
+    """
+    Enregistre les positions de parties aléatoires, vérifie que les positions relues sont identiques à celles jouées,
+    puis affiche le débit de l'écriture, d'un parcours séquentiel (évaluation de toutes les positions) et d'accès
+    aléatoires.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            nombre_parties (int) : Le nombre de parties jouées.
+            graine (int | None) : La graine du générateur aléatoire.
+    """
+    random.seed(graine)
+    descripteur, chemin = tempfile.mkstemp(suffix=".bin")
+    os.close(descripteur)
+    os.remove(chemin)
+    ecrivain = EcrivainPositions(chemin=chemin)
+    resultats = []
+    enregistrements = []
+    for _ in range(nombre_parties):
+        partie = GameEngine(joueur_blanc=RandomBot(), joueur_noir=RandomBot(), taille_plateau=taille)
+        observateur = ObservateurEnregistrement(ecrivain=ecrivain)
+        partie.ajoute_observateur(observateur=observateur)
+        resultats.append(partie.run())
+        enregistrements.append(observateur.enregistrements)
+    ecrivain.ferme()
+    # Réécriture des mêmes parties à la fin du fichier, pour mesurer seule la vitesse d'écriture.
+    debut = time.perf_counter()
+    ecrivain = EcrivainPositions(chemin=chemin)
+    for enregistrements_partie in enregistrements:
+        ecrivain.ecrit(enregistrements=enregistrements_partie)
+    ecrivain.ferme()
+    duree_ecriture = time.perf_counter() - debut
+
+    with LecteurPositions(chemin=chemin) as lecteur:
+        nombre = len(lecteur)
+        assert nombre == 2 * sum(resultat.nombre_coups + 1 for resultat in resultats), "Nombre de positions invalide !"
+        i = 0
+        for resultat in resultats[:20]:
+            plateau = lecteur.plateau(indice=i)
+            for coup in resultat.coups + [None]:
+                assert lecteur.coup(indice=i) == coup and lecteur[i]["resultat"] == resultat.gagnant
+                relu = lecteur.plateau(indice=i)
+                assert relu.get_cases() == plateau.get_cases() and relu.cle == plateau.cle == int(lecteur[i]["cle"])
+                if coup is not None:
+                    plateau.joue(*coup)
+                i += 1
+
+        debut = time.perf_counter()
+        valeurs = evalue_lot(cases=lecteur.cases())
+        victoires_blancs = int(np.count_nonzero(lecteur[:]["resultat"] == 1))
+        duree_parcours = time.perf_counter() - debut
+        indices = np.random.default_rng(graine).integers(0, nombre, size=10000)
+        debut = time.perf_counter()
+        cles = [int(lecteur[int(indice)]["cle"]) for indice in indices]
+        duree_aleatoire = time.perf_counter() - debut
+    os.remove(chemin)
+    print(f"taille={taille:<3} positions={nombre:<8} ({victoires_blancs} gagnées par les blancs, "
+          f"valeur moyenne {valeurs.mean():+.1f}) ecriture={nombre / 2 / duree_ecriture:12,.0f}/s "
+          f"parcours+evaluation={nombre / duree_parcours:12,.0f}/s acces_aleatoires={len(cles) / duree_aleatoire:10,.0f}/s")
+
+
+if __name__ == "__main__":
+    nombre_parties_bench = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for taille_plateau in (4, 6, 8, 10):
+        bench(taille=taille_plateau, nombre_parties=nombre_parties_bench)
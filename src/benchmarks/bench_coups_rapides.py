@@ -0,0 +1,122 @@
+# Gain des coups joués et annulés sans vérification ('make_move_rapide') dans les recherches.
+import argparse
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.game_engine.board import Board
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.minmax import MinMax
+
+
+class BoardVerifie(Board):
+    """
+    Classe héritant de Board qui vérifie tous les coups joués et annulés par les recherches, comme 'make_move(...)' et
+    'unmake_move(...)' (comportement précédant 'make_move_rapide(...)').
+    """
+
+    def make_move_rapide(self, coup: tuple):
+        if not self.coup_valide(case_origine=coup[0], case_destination=coup[1]):
+            raise ValueError("Coup invalide !")
+        return super().make_move_rapide(coup=coup)
+
+    def make_move_code(self, code: int):
+        coup = self.tables.coups_codes[code]
+        if coup is None or not self.coup_valide(case_origine=coup[0], case_destination=coup[1]):
+            raise ValueError("Coup invalide !")
+        return super().make_move_code(code=code)
+
+    def unmake_move_rapide(self, enregistrement: list):
+        assert self.historique and self.historique[-1] is enregistrement, "Seul le dernier coup peut être annulé !"
+        super().unmake_move_rapide(enregistrement=enregistrement)
+
+
+def bench_coups(classe_plateau: type, positions: list, repetitions: int):
+    """
+    Mesure le temps moyen d'un coup suivi de son annulation sur tous les coups des positions de test.
+
+        Paramètres :
+            classe_plateau (type) : La classe du plateau utilisée.
+            positions (list) : La liste des couples (plateau, joueur) de test.
+            repetitions (int) : Le nombre de fois que chaque coup est joué et annulé.
+
+        Retourne :
+            float : Le temps moyen en microsecondes.
+    """
+    duree = 0.0
+    coups_joues = 0
+    for plateau, joueur in positions:
+        plateau = classe_plateau.depuis_bitboards(taille=plateau.taille, blancs=plateau.pions[1],
+                                                  noirs=plateau.pions[-1], trait=joueur)
+        coups = plateau.get_liste_coups_possible(joueur=joueur)
+        debut = time.perf_counter()
+        for _ in range(repetitions):
+            for coup in coups:
+                plateau.unmake_move_rapide(enregistrement=plateau.make_move_rapide(coup=coup))
+        duree += time.perf_counter() - debut
+        coups_joues += repetitions * len(coups)
+    return duree / coups_joues * 1e6
+
+
+def bench_recherche(classe, classe_plateau: type, positions: list, profondeur: int):
+    """
+    Recherche les positions de test depuis la racine et retourne leurs valeurs et le nombre de nœuds par seconde.
+
+        Paramètres :
+            classe (type) : La classe de l'algorithme (MinMax ou AlphaBeta).
+            classe_plateau (type) : La classe du plateau utilisée.
+            positions (list) : La liste des couples (plateau, joueur) de test.
+            profondeur (int) : La profondeur de recherche.
+
+        Retourne :
+            tuple : La liste des valeurs et le nombre de nœuds par seconde.
+    """
+    valeurs = []
+    noeuds = 0
+    duree = 0.0
+    for plateau, joueur in positions:
+        plateau = classe_plateau.depuis_bitboards(taille=plateau.taille, blancs=plateau.pions[1],
+                                                  noirs=plateau.pions[-1], trait=joueur)
+        algo = classe(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur)
+        debut = time.perf_counter()
+        valeurs.append(algo.recherche_racine()[1])
+        duree += time.perf_counter() - debut
+        noeuds += algo.noeuds
+    return valeurs, noeuds / duree
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int):
+    """
+    Affiche le temps d'un coup joué puis annulé et le nombre de nœuds par seconde de MinMax et AlphaBeta, avec et sans
+    vérification des coups, et vérifie que les valeurs trouvées sont identiques.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche d'AlphaBeta (MinMax recherche à la profondeur 3).
+            nombre_positions (int) : Le nombre de positions de test.
+    """
+    positions = positions_test(taille=taille, nombre=nombre_positions)
+    verifie = bench_coups(classe_plateau=BoardVerifie, positions=positions, repetitions=50)
+    rapide = bench_coups(classe_plateau=Board, positions=positions, repetitions=50)
+    print(f"taille={taille:<3} coup+annulation verifie={verifie:6.2f}µs rapide={rapide:6.2f}µs "
+          f"gain=x{verifie / rapide:.2f}")
+    for classe, profondeur_recherche in ((MinMax, 3), (AlphaBeta, profondeur)):
+        valeurs_verifie, nps_verifie = bench_recherche(classe=classe, classe_plateau=BoardVerifie,
+                                                       positions=positions, profondeur=profondeur_recherche)
+        valeurs_rapide, nps_rapide = bench_recherche(classe=classe, classe_plateau=Board, positions=positions,
+                                                     profondeur=profondeur_recherche)
+        assert valeurs_verifie == valeurs_rapide, "Valeurs différentes !"
+        print(f"taille={taille:<3} {classe.__name__:<9} profondeur={profondeur_recherche:<3} "
+              f"noeuds/s verifie={nps_verifie:10,.0f} rapide={nps_rapide:10,.0f} gain=x{nps_rapide / nps_verifie:.2f}")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Coups joués avec et sans vérification dans les recherches.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=5, help="Profondeur de recherche d'AlphaBeta")
+    parseur.add_argument("-n", "--positions", type=int, default=10, help="Nombre de positions de test")
+    arguments = parseur.parse_args()
+
+    for taille_plateau in (8, 10):
+        bench(taille=taille_plateau, profondeur=arguments.profondeur, nombre_positions=arguments.positions)
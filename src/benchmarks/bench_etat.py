@@ -0,0 +1,108 @@
+# Vérification et gain de l'état du plateau maintenu à chaque coup ('Board.resultat') dans les recherches.
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.game_engine.board import Board
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.minmax import MinMax
+
+
+class BoardEtatCalcule(Board):
+    """
+    Classe héritant de Board qui recalcule l'état du plateau à chaque appel de 'etat()' à partir des coups possibles
+    et du nombre de pions des deux joueurs (comportement précédant 'Board.resultat').
+    """
+
+    def etat(self):
+        blancs_bloques = not self.a_des_coups(joueur=1)
+        noirs_bloques = not self.a_des_coups(joueur=-1)
+        if blancs_bloques and noirs_bloques:
+            return 0
+        elif self.get_nombre_pions(joueur=1) <= 0 or blancs_bloques:
+            return -1
+        elif self.get_nombre_pions(joueur=-1) <= 0 or noirs_bloques:
+            return 1
+        else:
+            return None
+
+
+def verification_differentielle(nombre_parties: int, graine: int | None = 0):
+    """
+    Joue des parties aléatoires (avec des annulations de coups) et vérifie après chaque coup que l'état maintenu est
+    identique à l'état recalculé.
+
+        Paramètres :
+            nombre_parties (int) : Le nombre de parties aléatoires à jouer.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            int : Le nombre de positions vérifiées.
+    """
+    rng = random.Random(graine)
+    positions = 0
+    for _ in range(nombre_parties):
+        plateau = Board(taille=rng.choice((4, 6, 8, 10)))
+        while True:
+            assert plateau.etat() == BoardEtatCalcule.etat(plateau), "États différents !"
+            positions += 1
+            if plateau.etat() is not None:
+                break
+            enregistrement = plateau.make_move(coup=rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait)))
+            if rng.random() < 0.25:
+                plateau.unmake_move(enregistrement=enregistrement)
+                assert plateau.etat() == BoardEtatCalcule.etat(plateau), "États différents après annulation !"
+    return positions
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int):
+    """
+    Affiche le temps d'un appel de 'etat()' et le nombre de nœuds par seconde de MinMax et AlphaBeta avec l'état
+    recalculé et maintenu, et vérifie que les valeurs trouvées sont identiques.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche d'AlphaBeta (MinMax recherche à la profondeur 3).
+            nombre_positions (int) : Le nombre de positions de test.
+    """
+    positions = positions_test(taille=taille, nombre=nombre_positions)
+    for classe in (MinMax, AlphaBeta):
+        profondeur_recherche = 3 if classe is MinMax else profondeur
+        mesures = {}
+        for classe_plateau in (BoardEtatCalcule, Board):
+            valeurs = []
+            noeuds = 0
+            duree_recherche = duree_etat = 0.0
+            for plateau, joueur in positions:
+                plateau = classe_plateau.depuis_bitboards(taille=taille, blancs=plateau.pions[1],
+                                                          noirs=plateau.pions[-1], trait=joueur)
+                debut = time.perf_counter()
+                for _ in range(10000):
+                    plateau.etat()
+                duree_etat += time.perf_counter() - debut
+                algo = classe(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur_recherche)
+                debut = time.perf_counter()
+                valeurs.append(algo.recherche_racine()[1])
+                duree_recherche += time.perf_counter() - debut
+                noeuds += algo.noeuds
+            mesures[classe_plateau] = (valeurs, duree_etat / (10000 * len(positions)) * 1e9, noeuds / duree_recherche)
+        assert mesures[Board][0] == mesures[BoardEtatCalcule][0], "Valeurs différentes !"
+        print(f"taille={taille:<3} {classe.__name__:<9} profondeur={profondeur_recherche:<3} "
+              f"etat() calcule={mesures[BoardEtatCalcule][1]:6.0f}ns maintenu={mesures[Board][1]:6.0f}ns "
+              f"noeuds/s calcule={mesures[BoardEtatCalcule][2]:10,.0f} maintenu={mesures[Board][2]:10,.0f} "
+              f"gain=x{mesures[Board][2] / mesures[BoardEtatCalcule][2]:.2f}")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="État du plateau recalculé ou maintenu à chaque coup.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=5, help="Profondeur de recherche d'AlphaBeta")
+    parseur.add_argument("-n", "--positions", type=int, default=10, help="Nombre de positions de test")
+    arguments = parseur.parse_args()
+
+    print(f"Vérification différentielle : {verification_differentielle(nombre_parties=300)} positions identiques")
+    for taille_plateau in (8, 10):
+        bench(taille=taille_plateau, profondeur=arguments.profondeur, nombre_positions=arguments.positions)
@@ -0,0 +1,74 @@
+# Vérification et débit de l'évaluation vectorisée d'un lot de plateaux comparée à l'évaluation de référence.
+import random
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import numpy as np
+
+from src.game_engine.board import Board
+from src.game_engine.encodage import encode_plateaux, decode_plateau
+from src.players.bots.algorithms.evaluation import criteres_plateau, evalue_plateau, criteres_lot, evalue_lot
+
+
+def plateaux_aleatoires(taille: int, nombre: int, graine: int | None = 0):
+    """
+    Retourne des plateaux obtenus en jouant un nombre aléatoire de coups aléatoires depuis la position de départ
+    (parties terminées comprises).
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            nombre (int) : Le nombre de plateaux.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            list : La liste des plateaux.
+    """
+    rng = random.Random(graine)
+    plateaux = []
+    while len(plateaux) < nombre:
+        plateau = Board(taille=taille)
+        for _ in range(rng.randint(0, 4 * taille)):
+            if plateau.etat() is not None:
+                break
+            plateau.joue(*rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait)))
+            plateaux.append(Board(taille=taille, cases=plateau.get_cases(), trait=plateau.trait))
+    return plateaux[:nombre]
+
+
+def bench(taille: int, nombre: int):
+    """
+    Vérifie que l'évaluation vectorisée donne les mêmes résultats que l'évaluation de référence, puis affiche le
+    nombre de plateaux évalués par seconde par les deux implémentations.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            nombre (int) : Le nombre de plateaux évalués.
+    """
+    plateaux = plateaux_aleatoires(taille=taille, nombre=nombre)
+
+    debut = time.perf_counter()
+    references = [evalue_plateau(plateau=plateau) for plateau in plateaux]
+    duree_reference = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    cases = encode_plateaux(plateaux=plateaux)
+    duree_encodage = time.perf_counter() - debut
+    debut = time.perf_counter()
+    valeurs = evalue_lot(cases=cases)
+    duree_lot = time.perf_counter() - debut
+
+    assert np.array_equal(criteres_lot(cases=cases), np.array([criteres_plateau(plateau=p) for p in plateaux])), \
+        "Critères différents de la référence !"
+    assert valeurs.tolist() == references, "Évaluation différente de la référence !"
+    assert all(decode_plateau(cases=cases[i]).get_cases() == plateaux[i].get_cases() for i in range(0, nombre, 97)), \
+        "Encodage invalide !"
+    print(f"taille={taille:<3} plateaux={nombre:<7} reference={nombre / duree_reference:12,.0f}/s "
+          f"lot={nombre / duree_lot:12,.0f}/s lot+encodage={nombre / (duree_lot + duree_encodage):12,.0f}/s")
+
+
+if __name__ == "__main__":
+    nombre_plateaux = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for taille_plateau in (4, 6, 8, 10):
+        bench(taille=taille_plateau, nombre=nombre_plateaux)
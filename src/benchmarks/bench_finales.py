@@ -0,0 +1,139 @@
+# Génération, vérification et utilisation par AlphaBeta d'une base de finales.
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.finales import genere_base_finales, BaseFinales
+
+
+def valeur_exhaustive(plateau: Board, joueur: int, memo: dict):
+    """
+    Retourne la valeur d'une position (au format de 'BaseFinales.valeur(...)') par une recherche exhaustive jusqu'à
+    la fin de la partie, utilisant uniquement l'interface de Board.
+
+        Paramètres :
+            plateau (Board) : Le plateau de la position.
+            joueur (int) : Le joueur devant jouer.
+            memo (dict) : Les valeurs des positions déjà calculées.
+
+        Retourne :
+            int : La valeur de la position.
+    """
+    cle = (plateau.pions[1], plateau.pions[-1], joueur)
+    if cle in memo:
+        return memo[cle]
+    resultat = plateau.etat()
+    if resultat is not None:
+        valeur = 0 if resultat == 0 else (1 if resultat == joueur else -1)
+    else:
+        valeurs = []
+        for coup in plateau.get_liste_coups_possible(joueur=joueur):
+            enregistrement = plateau.make_move(coup=coup)
+            valeurs.append(valeur_exhaustive(plateau=plateau, joueur=-joueur, memo=memo))
+            plateau.unmake_move(enregistrement=enregistrement)
+        if any(v < 0 for v in valeurs):
+            valeur = min(-v for v in valeurs if v < 0) + 1
+        elif 0 in valeurs:
+            valeur = 0
+        else:
+            valeur = -(max(valeurs) + 1)
+    memo[cle] = valeur
+    return valeur
+
+
+def finales_aleatoires(base: BaseFinales, nombre: int, pions_max: int, graine: int | None = 0):
+    """
+    Retourne des positions aléatoires sur les cases jouables du plateau de la base, avec au moins un pion de chaque
+    joueur et au plus 'pions_max' pions.
+
+        Paramètres :
+            base (BaseFinales) : La base de finales.
+            nombre (int) : Le nombre de positions.
+            pions_max (int) : Le nombre maximal de pions des positions.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            list : La liste des couples (plateau, joueur devant jouer).
+    """
+    rng = random.Random(graine)
+    positions = []
+    for _ in range(nombre):
+        total = rng.randint(2, pions_max)
+        nombre_blancs = rng.randint(1, total - 1)
+        cases = rng.sample(base.index.cases_jouables, total)
+        joueur = rng.choice((1, -1))
+        plateau = Board.depuis_bitboards(taille=base.taille, blancs=sum(1 << i for i in cases[:nombre_blancs]),
+                                         noirs=sum(1 << i for i in cases[nombre_blancs:]), trait=joueur)
+        positions.append((plateau, joueur))
+    return positions
+
+
+def bench(taille: int, pions_max: int, chemin: str, profondeur: int):
+    """
+    Génère une base de finales, la compare à une recherche exhaustive sur des positions aléatoires, puis affiche la
+    vitesse de génération et de consultation et les nœuds explorés par AlphaBeta avec et sans la base sur des
+    positions ayant jusqu'à deux pions de plus que les positions de la base.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            pions_max (int) : Le nombre maximal de pions des positions de la base.
+            chemin (str) : Le chemin du fichier de la base.
+            profondeur (int) : La profondeur des recherches AlphaBeta.
+    """
+    debut = time.perf_counter()
+    index = genere_base_finales(taille=taille, pions_max=pions_max, chemin=chemin)
+    duree = time.perf_counter() - debut
+    print(f"taille={taille:<3} pions_max={pions_max:<3} positions={index.nombre_positions:<10} "
+          f"generation={duree:7.2f}s ({index.nombre_positions / duree:,.0f} positions/s)")
+
+    base = BaseFinales(chemin=chemin)
+    positions = finales_aleatoires(base=base, nombre=2000, pions_max=pions_max)
+    memo = {}
+    for plateau, joueur in positions:
+        assert base.valeur(plateau=plateau, joueur=joueur) == valeur_exhaustive(plateau=plateau, joueur=joueur,
+                                                                              memo=memo), "Valeur invalide !"
+    debut = time.perf_counter()
+    for plateau, joueur in positions:
+        base.valeur(plateau=plateau, joueur=joueur)
+    duree = time.perf_counter() - debut
+    print(f"    {len(positions)} positions vérifiées, consultation={len(positions) / duree:,.0f} positions/s")
+
+    positions = [(plateau, joueur) for plateau, joueur in
+                 finales_aleatoires(base=base, nombre=400, pions_max=pions_max + 2, graine=1) if plateau.etat() is None]
+    for utilise_base in (False, True):
+        noeuds = 0
+        debut = time.perf_counter()
+        for plateau, joueur in positions:
+            algo = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur,
+                             base_finales=base if utilise_base else None)
+            algo.evaluate()
+            noeuds += algo.noeuds
+        print(f"    AlphaBeta profondeur={profondeur} base={'oui' if utilise_base else 'non'} noeuds={noeuds:<9} "
+              f"temps={time.perf_counter() - debut:7.3f}s")
+    base.ferme()
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Génération et vérification d'une base de finales.")
+    parseur.add_argument("taille", type=int, choices=(4, 6, 8, 10), help="Taille du plateau")
+    parseur.add_argument("pions_max", type=int, help="Nombre maximal de pions des positions")
+    parseur.add_argument("-o", "--sortie", default=None, help="Fichier de la base (conservé après le benchmark)")
+    parseur.add_argument("-p", "--profondeur", type=int, default=6, help="Profondeur des recherches AlphaBeta")
+    arguments = parseur.parse_args()
+
+    fichier = arguments.sortie
+    if fichier is None:
+        descripteur, fichier = tempfile.mkstemp(suffix=".bin")
+        os.close(descripteur)
+    try:
+        bench(taille=arguments.taille, pions_max=arguments.pions_max, chemin=fichier, profondeur=arguments.profondeur)
+    finally:
+        if arguments.sortie is None:
+            os.remove(fichier)
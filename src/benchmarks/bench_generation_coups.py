@@ -0,0 +1,102 @@
+# Vérification différentielle et microbenchmark de la génération incrémentale des coups possibles.
+import random
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board
+
+
+class BoardParcoursComplet(Board):
+    """
+    Classe héritant de Board qui recalcule, après chaque coup, les coups possibles des deux joueurs sur tout le plateau
+    et reconstruit leurs dictionnaires (comportement précédant la génération incrémentale).
+    """
+
+    def update_coups_possible_zone(self, zone: int):
+        self.update_coups_possible(joueur=1)
+        self.update_coups_possible(joueur=-1)
+        self.get_coups_possible(joueur=1)
+        self.get_coups_possible(joueur=-1)
+
+
+def verification_differentielle(nombre_parties: int, graine: int | None = 0):
+    """
+    Joue des parties aléatoires (avec des annulations de coups) et vérifie après chaque coup que les coups possibles
+    obtenus de façon incrémentale sont identiques, ordre compris, à ceux obtenus en parcourant tout le plateau.
+
+        Paramètres :
+            nombre_parties (int) : Le nombre de parties aléatoires à jouer.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            int : Le nombre de positions vérifiées.
+    """
+    rng = random.Random(graine)
+    positions = 0
+    for _ in range(nombre_parties):
+        plateau = Board(taille=rng.choice((4, 6, 8, 10)))
+        historique = []
+        joueur = 1
+        while plateau.etat() is None:
+            coup = rng.choice(plateau.get_liste_coups_possible(joueur=joueur))
+            plateau.joue(case_origine=coup[0], case_destination=coup[1])
+            historique.append(coup)
+            if historique and rng.random() < 0.25:
+                coup = historique.pop()
+                plateau.joue(coup[1], coup[0], True)
+            joueur = -joueur
+            reference = Board(cases=plateau.get_cases(), trait=plateau.trait)
+            assert plateau.hash() == reference.hash(), "Clé de Zobrist incrémentale invalide !"
+            for j in (1, -1):
+                assert list(plateau.get_coups_possible(joueur=j).items()) == \
+                    list(reference.get_coups_possible(joueur=j).items()), "Coups possibles différents !"
+                assert plateau.masques_coups[j] == reference.masques_coups[j], "Bitboards des coups différents !"
+            positions += 1
+    return positions
+
+
+def bench(classe_plateau: type, taille: int, nombre_coups: int, graine: int | None = 0):
+    """
+    Mesure le temps moyen d'un coup suivi de son annulation, avec la génération des coups du joueur suivant comme lors
+    d'une recherche.
+
+        Paramètres :
+            classe_plateau (type) : La classe du plateau utilisée.
+            taille (int) : La taille du plateau.
+            nombre_coups (int) : Le nombre de coups joués et annulés.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            float : Le temps moyen en microsecondes.
+    """
+    rng = random.Random(graine)
+    plateau = classe_plateau(taille=taille)
+    joueur = 1
+    duree = 0
+    coups = 0
+    while coups < nombre_coups:
+        if plateau.etat() is not None:
+            plateau = classe_plateau(taille=taille)
+            joueur = 1
+        liste_coups = plateau.get_liste_coups_possible(joueur=joueur)
+        debut = time.perf_counter()
+        for coup in liste_coups:
+            plateau.joue(case_origine=coup[0], case_destination=coup[1])
+            plateau.get_liste_coups_possible(joueur=-joueur)
+            plateau.joue(coup[1], coup[0], True)
+        duree += time.perf_counter() - debut
+        coups += len(liste_coups)
+        plateau.joue(*rng.choice(liste_coups))
+        joueur = -joueur
+    return duree / coups * 1e6
+
+
+if __name__ == "__main__":
+    print(f"Vérification différentielle : {verification_differentielle(nombre_parties=200)} positions identiques")
+    for taille_plateau in (8, 10):
+        complet = bench(classe_plateau=BoardParcoursComplet, taille=taille_plateau, nombre_coups=20000)
+        incremental = bench(classe_plateau=Board, taille=taille_plateau, nombre_coups=20000)
+        print(f"taille={taille_plateau:<3} parcours complet={complet:7.2f}µs incrémental={incremental:7.2f}µs "
+              f"gain=x{complet / incremental:.2f}")
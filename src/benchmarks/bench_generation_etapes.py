@@ -0,0 +1,281 @@
+# Allocations (tracemalloc) et coût de la génération des coups d'AlphaBeta par étapes (coup de la table et prises, puis
+# déplacements seulement sans coupure), comparée aux listes de coups et aux tampons remplis en une fois.
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.game_engine.board import Board
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.transposition import TableTransposition
+
+
+class BoardEnregistreur(Board):
+    """
+    Classe héritant de Board qui enregistre, pour chaque nœud d'une recherche où des coups sont générés, la position,
+    les paramètres de la génération, le nombre de coups du tampon effectivement joués par la recherche et si les
+    déplacements ont été générés (deuxième étape).
+
+        Attributs :
+            profondeur_recherche (int) : La profondeur de la recherche : les nœuds plus profonds sont ceux de la
+                                         recherche de quiescence, qui ne génère que les prises.
+            noeuds_generes (list) : Les nœuds [blancs, noirs, joueur, coup_prioritaire, quiescence, coups joués,
+                                    déplacements générés].
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profondeur_recherche = 0
+        self.noeuds_generes = []
+        self._noeuds_en_cours = {}
+
+    def remplit_coups(self, joueur: int, tampon: list, coup_prioritaire: tuple | None = None,
+                      prises_seules: bool | None = False):
+        quiescence = bool(prises_seules) and len(self.historique) >= self.profondeur_recherche
+        noeud = [self.pions[1], self.pions[-1], joueur, coup_prioritaire, quiescence, 0, not prises_seules]
+        self.noeuds_generes.append(noeud)
+        self._noeuds_en_cours[len(self.historique)] = noeud
+        return super().remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_prioritaire,
+                                     prises_seules=prises_seules)
+
+    def remplit_deplacements(self, joueur: int, tampon: list, debut: int, exclu: int | None = None):
+        self._noeuds_en_cours[len(self.historique)][6] = True
+        return super().remplit_deplacements(joueur=joueur, tampon=tampon, debut=debut, exclu=exclu)
+
+    def make_move_code(self, code: int):
+        self._noeuds_en_cours[len(self.historique)][5] += 1
+        return super().make_move_code(code=code)
+
+
+class BoardTamponsComplets(Board):
+    """
+    Classe héritant de Board qui écrit tous les coups dès la première étape de la génération d'un nœud d'AlphaBeta
+    (comportement précédant la génération par étapes), la deuxième étape n'écrivant alors plus rien. Les nœuds de la
+    recherche de quiescence (au-delà de 'profondeur_recherche') ne génèrent toujours que les prises.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profondeur_recherche = 0
+
+    def remplit_coups(self, joueur: int, tampon: list, coup_prioritaire: tuple | None = None,
+                      prises_seules: bool | None = False):
+        prises_seules = prises_seules and len(self.historique) >= self.profondeur_recherche
+        return super().remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_prioritaire,
+                                     prises_seules=prises_seules)
+
+    def remplit_deplacements(self, joueur: int, tampon: list, debut: int, exclu: int | None = None):
+        return debut
+
+
+def noeuds_recherche(positions: list, profondeur: int, taille_table: float | None, quiescence: bool | None = True):
+    """
+    Recherche les positions de test avec AlphaBeta et retourne les nœuds de la recherche où des coups ont été générés.
+
+        Paramètres :
+            positions (list) : La liste des couples (plateau, joueur) de test.
+            profondeur (int) : La profondeur de recherche.
+            taille_table (float | None) : La taille de la table de transposition en mégaoctets, ou None.
+            quiescence (bool | None) : Si True, les feuilles sont évaluées par une recherche de quiescence.
+
+        Retourne :
+            list : La liste des nœuds (voir 'BoardEnregistreur.noeuds_generes').
+    """
+    noeuds = []
+    for plateau, joueur in positions:
+        plateau = BoardEnregistreur.depuis_bitboards(taille=plateau.taille, blancs=plateau.pions[1],
+                                                     noirs=plateau.pions[-1], trait=joueur)
+        plateau.profondeur_recherche = profondeur
+        table = TableTransposition(taille_mo=taille_table) if taille_table is not None else None
+        AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur, table=table,
+                  quiescence=quiescence).evaluate()
+        noeuds.extend(plateau.noeuds_generes)
+    return noeuds
+
+
+def genere(generation: str, plateau: Board, tampon: list, noeud: list):
+    """
+    Génère les coups d'un nœud enregistré comme l'aurait fait la recherche avec le mode de génération donné.
+
+        Paramètres :
+            generation (str) : 'listes' (liste de tous les coups), 'tampons' (codes entiers de tous les coups écrits
+                               en une fois dans un tampon préalloué) ou 'etapes' (coup de la table et prises, puis
+                               déplacements seulement si la recherche les a générés).
+            plateau (Board) : Le plateau de la position du nœud.
+            tampon (list) : Le tampon préalloué.
+            noeud (list) : Le nœud enregistré (voir 'BoardEnregistreur.noeuds_generes').
+
+        Retourne :
+            list | int : La liste des coups pour 'listes', sinon le nombre de codes écrits dans le tampon.
+    """
+    _, _, joueur, coup_prioritaire, quiescence, _, deplacements = noeud
+    if generation == "listes":
+        coups = plateau.get_liste_coups_possible(joueur=joueur)
+        if quiescence:
+            coups = [coup for coup in coups if abs(coup[1][0] - coup[0][0]) == 2]
+        return coups
+    if generation == "tampons":
+        return plateau.remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_prioritaire,
+                                     prises_seules=quiescence)
+    nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_prioritaire,
+                                   prises_seules=True)
+    if deplacements:
+        nombre = plateau.remplit_deplacements(joueur=joueur, tampon=tampon, debut=nombre,
+                                              exclu=tampon[0] if coup_prioritaire is not None and nombre else None)
+    return nombre
+
+
+def allocations_generation(generation: str, taille: int, noeuds: list):
+    """
+    Rejoue la génération des coups des nœuds d'une recherche en consommant autant de coups que la recherche, en
+    gardant les objets créés, et mesure avec tracemalloc les blocs et octets alloués par nœud.
+
+        Paramètres :
+            generation (str) : Le mode de génération (voir 'genere(...)').
+            taille (int) : La taille des plateaux.
+            noeuds (list) : Les nœuds retournés par 'noeuds_recherche(...)'.
+
+        Retourne :
+            tuple : Le nombre moyen de blocs et d'octets alloués par nœud.
+    """
+    plateaux = [Board.depuis_bitboards(taille=taille, blancs=blancs, noirs=noirs) for blancs, noirs, *_ in noeuds]
+    tampon = [0] * plateaux[0].tables.coups_max
+    # Les objets créés sont gardés dans une liste allouée avant la mesure pour ne compter que la génération des coups.
+    objets = [None] * len(noeuds)
+    tracemalloc.start()
+    avant = tracemalloc.take_snapshot()
+    for k, (plateau, noeud) in enumerate(zip(plateaux, noeuds)):
+        coups = genere(generation=generation, plateau=plateau, tampon=tampon, noeud=noeud)
+        if generation == "listes":
+            iterateur = iter(coups)
+            for _ in range(noeud[5]):
+                next(iterateur)
+            objets[k] = iterateur
+        else:
+            for i in range(min(noeud[5], coups)):
+                objets[k] = tampon[i]
+    apres = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return difference_snapshots(avant=avant, apres=apres, nombre=len(noeuds))
+
+
+def cout_generation(generation: str, taille: int, noeuds: list, repetitions: int):
+    """
+    Mesure le nombre moyen de codes écrits et le temps moyen de la génération des coups par nœud d'une recherche.
+
+        Paramètres :
+            generation (str) : 'tampons' ou 'etapes' (voir 'genere(...)').
+            taille (int) : La taille des plateaux.
+            noeuds (list) : Les nœuds retournés par 'noeuds_recherche(...)'.
+            repetitions (int) : Le nombre de générations de chaque nœud.
+
+        Retourne :
+            tuple : Le nombre moyen de codes écrits et le temps moyen en microsecondes par nœud.
+    """
+    plateaux = [Board.depuis_bitboards(taille=taille, blancs=blancs, noirs=noirs) for blancs, noirs, *_ in noeuds]
+    tampon = [0] * plateaux[0].tables.coups_max
+    codes = sum(genere(generation=generation, plateau=plateau, tampon=tampon, noeud=noeud)
+                for plateau, noeud in zip(plateaux, noeuds))
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        for plateau, noeud in zip(plateaux, noeuds):
+            genere(generation=generation, plateau=plateau, tampon=tampon, noeud=noeud)
+    duree = time.perf_counter() - debut
+    return codes / len(noeuds), duree / (repetitions * len(noeuds)) * 1e6
+
+
+def recherche(classe_plateau: type, positions: list, profondeur: int, taille_table: float | None):
+    """
+    Recherche les positions de test avec AlphaBeta (avec recherche de quiescence) et retourne les valeurs, le nombre
+    de nœuds et la durée.
+
+        Paramètres :
+            classe_plateau (type) : La classe du plateau utilisée.
+            positions (list) : La liste des couples (plateau, joueur) de test.
+            profondeur (int) : La profondeur de recherche.
+            taille_table (float | None) : La taille de la table de transposition en mégaoctets, ou None.
+
+        Retourne :
+            tuple : La liste des valeurs, le nombre de nœuds et la durée en secondes.
+    """
+    valeurs = []
+    noeuds = 0
+    duree = 0.0
+    for plateau, joueur in positions:
+        plateau = classe_plateau.depuis_bitboards(taille=plateau.taille, blancs=plateau.pions[1],
+                                                  noirs=plateau.pions[-1], trait=joueur)
+        plateau.profondeur_recherche = profondeur
+        table = TableTransposition(taille_mo=taille_table) if taille_table is not None else None
+        algo = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur, table=table, quiescence=True)
+        debut = time.perf_counter()
+        valeurs.append(algo.evaluate())
+        duree += time.perf_counter() - debut
+        noeuds += algo.noeuds
+    return valeurs, noeuds, duree
+
+
+def difference_snapshots(avant: tracemalloc.Snapshot, apres: tracemalloc.Snapshot, nombre: int):
+    """
+    Retourne les blocs et octets alloués entre deux instantanés de tracemalloc (hors allocations de tracemalloc),
+    divisés par le nombre d'opérations mesurées.
+
+        Paramètres :
+            avant (tracemalloc.Snapshot) : L'instantané pris avant la mesure.
+            apres (tracemalloc.Snapshot) : L'instantané pris après la mesure.
+            nombre (int) : Le nombre d'opérations mesurées.
+
+        Retourne :
+            tuple : Le nombre moyen de blocs et d'octets alloués par opération.
+    """
+    filtre = [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+    differences = apres.filter_traces(filtre).compare_to(avant.filter_traces(filtre), "filename")
+    blocs = sum(difference.count_diff for difference in differences)
+    octets = sum(difference.size_diff for difference in differences)
+    return blocs / nombre, octets / nombre
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int, taille_table: float | None):
+    """
+    Affiche, pour les nœuds d'une recherche AlphaBeta (avec recherche de quiescence), les blocs et octets alloués par
+    nœud pour générer les coups avec des listes (avant les tampons), avec des tampons remplis en une fois et avec la
+    génération par étapes, puis le nombre de codes écrits et le temps de génération par nœud, et enfin la durée de la
+    recherche sans et avec la génération par étapes (en vérifiant que les valeurs et les nœuds sont identiques).
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions de test.
+            taille_table (float | None) : La taille de la table de transposition en mégaoctets, ou None.
+    """
+    positions = positions_test(taille=taille, nombre=nombre_positions)
+    noeuds = noeuds_recherche(positions=positions, profondeur=profondeur, taille_table=taille_table)
+    debut = f"taille={taille:<3} profondeur={profondeur:<3} table={str(taille_table is not None):<6}"
+    for generation in ("listes", "tampons", "etapes"):
+        blocs, octets = allocations_generation(generation=generation, taille=taille, noeuds=noeuds)
+        ligne = f"{debut} generation={generation:<8} blocs/noeud={blocs:5.2f} octets/noeud={octets:6.1f}"
+        if generation != "listes":
+            codes, duree = cout_generation(generation=generation, taille=taille, noeuds=noeuds, repetitions=5)
+            ligne += f" codes/noeud={codes:5.2f} generation={duree:5.2f}µs/noeud"
+        print(ligne)
+    resultats = {}
+    for nom, classe_plateau in (("tampons", BoardTamponsComplets), ("etapes", Board)):
+        resultats[nom] = recherche(classe_plateau=classe_plateau, positions=positions, profondeur=profondeur,
+                                   taille_table=taille_table)
+    assert resultats["tampons"][:2] == resultats["etapes"][:2], "Valeurs ou nœuds différents !"
+    print(f"{debut} recherche noeuds={resultats['etapes'][1]:<9} tampons={resultats['tampons'][2]:6.2f}s "
+          f"etapes={resultats['etapes'][2]:6.2f}s")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Génération des coups par étapes contre listes et tampons complets.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=5, help="Profondeur de recherche")
+    parseur.add_argument("-n", "--positions", type=int, default=10, help="Nombre de positions de test")
+    arguments = parseur.parse_args()
+
+    for taille_plateau in (8, 10):
+        for table_mo in (None, 16):
+            bench(taille=taille_plateau, profondeur=arguments.profondeur, nombre_positions=arguments.positions,
+                  taille_table=table_mo)
@@ -0,0 +1,128 @@
+# Latence par coup (médiane, p99, maximum) et pauses du ramasse-miettes d'Albator au cours de parties.
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board
+from src.players.bots.bot import Albator
+
+
+class PausesRamasseMiettes:
+    """
+    Classe mesurant, avec 'gc.callbacks', le nombre de passages du ramasse-miettes par génération et la durée de
+    leurs pauses pendant un bloc 'with'.
+
+        Attributs :
+            passages (list) : Le nombre de passages du ramasse-miettes pour chaque génération (0, 1 et 2).
+            pauses (list) : La durée en secondes de chaque pause.
+    """
+
+    def __init__(self):
+        self.passages = [0, 0, 0]
+        self.pauses = []
+        self._debut = None
+
+    def _rappel(self, phase: str, informations: dict):
+        if phase == "start":
+            self._debut = time.perf_counter()
+        else:
+            self.pauses.append(time.perf_counter() - self._debut)
+            self.passages[informations["generation"]] += 1
+
+    def __enter__(self):
+        gc.callbacks.append(self._rappel)
+        return self
+
+    def __exit__(self, *exception):
+        gc.callbacks.remove(self._rappel)
+
+
+def centile(valeurs: list, rang: float):
+    """
+    Retourne le centile d'une liste de valeurs (valeur de rang 'rang' % dans la liste triée, sans interpolation).
+
+        Paramètres :
+            valeurs (list) : Les valeurs.
+            rang (float) : Le rang du centile, entre 0 et 100.
+
+        Retourne :
+            float : Le centile des valeurs.
+    """
+    valeurs = sorted(valeurs)
+    return valeurs[min(len(valeurs) - 1, int(len(valeurs) * rang / 100))]
+
+
+def parties(taille: int, profondeur: int, nombre_parties: int, taille_table: float | None, graine: int | None = 0):
+    """
+    Fait jouer des parties à deux bots Albator de profondeur fixe, à partir de quelques coups aléatoires pour varier
+    les parties, et retourne la durée de chaque recherche avec le nombre de nœuds explorés.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            profondeur (int) : La profondeur de recherche des bots.
+            nombre_parties (int) : Le nombre de parties.
+            taille_table (float | None) : La taille de la table de transposition de chaque bot en mégaoctets, ou None.
+            graine (int | None) : La graine du générateur aléatoire des coups d'ouverture.
+
+        Retourne :
+            tuple : La liste des durées des recherches en secondes et le nombre total de nœuds.
+    """
+    rng = random.Random(graine)
+    durees = []
+    noeuds = 0
+    for _ in range(nombre_parties):
+        plateau = Board(taille=taille)
+        for _ in range(4):
+            plateau.make_move(coup=rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait)))
+        bots = {joueur: Albator(profondeur=profondeur, taille_table=taille_table) for joueur in (1, -1)}
+        for joueur, bot in bots.items():
+            bot.set_jeu(plateau=plateau, valeur_pion=joueur)
+        while plateau.etat() is None:
+            bot = bots[plateau.trait]
+            debut = time.perf_counter()
+            coup = bot.joue()
+            durees.append(time.perf_counter() - debut)
+            noeuds += bot.derniere_recherche["noeuds"]
+            plateau.make_move(coup=coup)
+        for bot in bots.values():
+            bot.ferme()
+    return durees, noeuds
+
+
+def bench(taille: int, profondeur: int, nombre_parties: int, taille_table: float | None):
+    """
+    Affiche la latence par coup d'Albator (médiane, p99 et maximum), les nœuds par seconde, ainsi que le nombre de
+    passages du ramasse-miettes par génération et la durée de ses pauses au cours des parties.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            profondeur (int) : La profondeur de recherche des bots.
+            nombre_parties (int) : Le nombre de parties.
+            taille_table (float | None) : La taille de la table de transposition de chaque bot en mégaoctets, ou None.
+    """
+    gc.collect()
+    with PausesRamasseMiettes() as ramasse_miettes:
+        durees, noeuds = parties(taille=taille, profondeur=profondeur, nombre_parties=nombre_parties,
+                                 taille_table=taille_table)
+    pauses = ramasse_miettes.pauses
+    print(f"taille={taille:<3} profondeur={profondeur:<3} table={str(taille_table is not None):<6} "
+          f"coups={len(durees):<5} p50={centile(durees, 50) * 1e3:7.1f}ms p99={centile(durees, 99) * 1e3:7.1f}ms "
+          f"max={max(durees) * 1e3:7.1f}ms noeuds/s={noeuds / sum(durees):9,.0f} "
+          f"gc={'/'.join(str(nombre) for nombre in ramasse_miettes.passages)} "
+          f"pauses gc={sum(pauses) * 1e3:6.1f}ms (max {max(pauses, default=0.0) * 1e3:5.2f}ms)")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Latence par coup et pauses du ramasse-miettes d'Albator.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=5, help="Profondeur de recherche des bots")
+    parseur.add_argument("-n", "--parties", type=int, default=4, help="Nombre de parties par configuration")
+    arguments = parseur.parse_args()
+
+    for taille_plateau in (8, 10):
+        for table_mo in (None, 16):
+            bench(taille=taille_plateau, profondeur=arguments.profondeur, nombre_parties=arguments.parties,
+                  taille_table=table_mo)
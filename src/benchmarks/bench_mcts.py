@@ -0,0 +1,108 @@
+# Vitesse des simulations, mémoire par nœud, réutilisation de l'arbre et parallélisation du bot MCTS.
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board
+from src.players.bots.algorithms.mcts import MCTS, simule
+from src.players.bots.bot import MCTSBot, RandomBot
+
+
+def bench_simulations(taille: int, nombre: int):
+    """
+    Affiche le nombre de simulations (parties aléatoires sur les bitboards) par seconde depuis la position initiale.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            nombre (int) : Le nombre de simulations.
+    """
+    plateau = Board(taille=taille)
+    alea = random.Random(0)
+    debut = time.perf_counter()
+    for _ in range(nombre):
+        simule(taille=taille, blancs=plateau.pions[1], noirs=plateau.pions[-1], joueur=1, alea=alea)
+    duree = time.perf_counter() - debut
+    print(f"taille={taille:<3} simulations={nombre:<6} temps={duree:7.3f}s ({nombre / duree:,.0f} simulations/s)")
+
+
+def bench_recherche(taille: int, playouts: int):
+    """
+    Affiche la vitesse d'une recherche MCTS depuis la position initiale et la mémoire par nœud de son arbre,
+    estimée avec 'sys.getsizeof' et mesurée avec 'tracemalloc'.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            playouts (int) : Le nombre de simulations de la recherche.
+    """
+    mcts = MCTS(plateau=Board(taille=taille), joueur_actuel=1, alea=random.Random(0))
+    debut = time.perf_counter()
+    mcts.recherche(playouts=playouts)
+    duree = time.perf_counter() - debut
+    noeuds, octets = mcts.memoire()
+
+    tracemalloc.start()
+    mcts = MCTS(plateau=Board(taille=taille), joueur_actuel=1, alea=random.Random(0))
+    avant = tracemalloc.get_traced_memory()[0]
+    mcts.recherche(playouts=playouts)
+    octets_mesures = tracemalloc.get_traced_memory()[0] - avant
+    tracemalloc.stop()
+    print(f"taille={taille:<3} playouts={playouts:<6} temps={duree:7.3f}s ({playouts / duree:,.0f} playouts/s) "
+          f"noeuds={noeuds:<6} octets/noeud={octets / noeuds:.0f} (tracemalloc : {octets_mesures / noeuds:.0f})")
+
+
+def bench_partie(taille: int, playouts: int, workers: int, reutilise_arbre: bool, graine: int | None = 0):
+    """
+    Fait jouer une partie au bot MCTS contre RandomBot et affiche les simulations par seconde et la part des
+    simulations provenant de l'arbre réutilisé.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            playouts (int) : Le nombre de simulations par coup.
+            workers (int) : Le nombre de processus du bot.
+            reutilise_arbre (bool) : Si True, le bot réutilise l'arbre de la recherche précédente.
+            graine (int | None) : La graine du générateur aléatoire.
+    """
+    random.seed(graine)
+    plateau = Board(taille=taille)
+    bot = MCTSBot(playouts=playouts, workers=workers, reutilise_arbre=reutilise_arbre)
+    adversaire = RandomBot()
+    bot.set_jeu(plateau=plateau, valeur_pion=1)
+    adversaire.set_jeu(plateau=plateau, valeur_pion=-1)
+    total_playouts = reutilises = coups = 0
+    temps = 0.0
+    joueur = 1
+    while plateau.etat() is None:
+        if joueur == 1:
+            coup = bot.joue()
+            total_playouts += bot.derniere_recherche["playouts"]
+            reutilises += bot.derniere_recherche["playouts_reutilises"]
+            temps += bot.derniere_recherche["temps"]
+            coups += 1
+        else:
+            coup = adversaire.joue()
+        plateau.joue(*coup)
+        joueur = -joueur
+    bot.ferme()
+    print(f"taille={taille:<3} workers={workers:<2} reutilisation={'oui' if reutilise_arbre else 'non'} "
+          f"coups={coups:<3} {total_playouts / temps:,.0f} playouts/s, "
+          f"{reutilises / max(coups, 1):.0f} simulations réutilisées par coup en moyenne")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Benchmark du bot MCTS.")
+    parseur.add_argument("-t", "--taille", type=int, default=8, choices=(4, 6, 8, 10), help="Taille du plateau")
+    parseur.add_argument("-p", "--playouts", type=int, default=2000, help="Nombre de simulations par recherche")
+    parseur.add_argument("-w", "--workers", type=int, default=2, help="Nombre de processus de la recherche parallèle")
+    arguments = parseur.parse_args()
+
+    bench_simulations(taille=arguments.taille, nombre=arguments.playouts)
+    bench_recherche(taille=arguments.taille, playouts=arguments.playouts)
+    for reutilise in (False, True):
+        bench_partie(taille=arguments.taille, playouts=arguments.playouts, workers=1, reutilise_arbre=reutilise)
+    if arguments.workers > 1:
+        bench_partie(taille=arguments.taille, playouts=arguments.playouts, workers=arguments.workers,
+                     reutilise_arbre=False)
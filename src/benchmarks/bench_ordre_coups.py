@@ -0,0 +1,55 @@
+# Benchmark du facteur de branchement effectif d'AlphaBeta avec et sans ordonnancement des coups.
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.ordre_coups import OrdonnanceurCoups
+from src.players.bots.algorithms.transposition import TableTransposition
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int, ordonne_coups: bool, taille_table: float | None = None):
+    """
+    Évalue des positions de test avec AlphaBeta par approfondissement itératif et affiche le nombre de nœuds, le
+    facteur de branchement effectif (racine profondeur-ième du nombre de nœuds de la dernière itération) et la
+    proportion de coupures provoquées par le premier coup testé.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions évaluées.
+            ordonne_coups (bool) : Si True, les coups sont triés par un ordonnanceur.
+            taille_table (float | None) : La taille en mégaoctets de la table de transposition, ou None.
+    """
+    noeuds = 0
+    coupures = 0
+    coupures_premier_coup = 0
+    facteurs = []
+    debut = time.perf_counter()
+    for plateau, joueur in positions_test(taille=taille, nombre=nombre_positions):
+        ordonnanceur = OrdonnanceurCoups() if ordonne_coups else None
+        table = TableTransposition(taille_mo=taille_table) if taille_table is not None else None
+        for profondeur_iteration in range(1, profondeur + 1):
+            algo = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur_iteration, table=table,
+                             ordonnanceur=ordonnanceur)
+            algo.evaluate()
+            noeuds += algo.noeuds
+            coupures += algo.coupures
+            coupures_premier_coup += algo.coupures_premier_coup
+        facteurs.append(algo.noeuds ** (1 / profondeur))
+    duree = time.perf_counter() - debut
+    print(f"taille={taille:<3} profondeur={profondeur:<3} ordonnancement={str(ordonne_coups):<6} "
+          f"table={str(taille_table):<5} noeuds={noeuds:<9} temps={duree:6.2f}s "
+          f"branchement effectif={sum(facteurs) / len(facteurs):.2f} "
+          f"coupures au premier coup={100 * coupures_premier_coup / max(coupures, 1):.1f}%")
+
+
+if __name__ == "__main__":
+    profondeur_max = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    for taille_plateau in (8, 10):
+        for table_transposition in (None, 16):
+            for ordonnancement in (False, True):
+                bench(taille=taille_plateau, profondeur=profondeur_max, nombre_positions=10,
+                      ordonne_coups=ordonnancement, taille_table=table_transposition)
@@ -0,0 +1,116 @@
+# Construction, vérification et temps de consultation d'un livre d'ouvertures.
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board
+from src.game_engine.tournament import tournoi
+from src.players.bots.algorithms.ouvertures import construit_livre, LivreOuvertures, MEILLEUR, ALEATOIRE
+from src.players.bots.bot import Albator
+
+
+def statistiques_reference(fichiers: list, coups_max: int):
+    """
+    Retourne les statistiques des coups des parties, calculées en mémoire dans un dictionnaire pour vérifier le livre.
+
+        Paramètres :
+            fichiers (list) : Les chemins des fichiers JSONL des parties.
+            coups_max (int) : Le nombre de demi-coups de chaque partie pris en compte.
+
+        Retourne :
+            dict : Le dictionnaire {clé: [((origine, destination), parties, victoires, nulles), ...], ...}.
+    """
+    statistiques = {}
+    for fichier in fichiers:
+        with open(fichier, encoding="utf-8") as parties:
+            for ligne in parties:
+                partie = json.loads(ligne)
+                plateau = Board(taille=partie["taille"])
+                for case_origine, case_destination in partie["coups"][:coups_max]:
+                    coup = (tuple(case_origine), tuple(case_destination))
+                    coups = statistiques.setdefault(plateau.cle, {})
+                    entree = coups.setdefault(coup, [0, 0, 0])
+                    entree[0] += 1
+                    entree[1] += partie["gagnant"] == plateau.trait
+                    entree[2] += partie["gagnant"] == 0
+                    plateau.joue(*coup)
+    return statistiques
+
+
+def bench(fichiers: list, chemin: str, coups_max: int):
+    """
+    Construit un livre d'ouvertures, vérifie son contenu, puis affiche le temps de consultation et le temps du premier
+    coup d'Albator avec et sans le livre.
+
+        Paramètres :
+            fichiers (list) : Les chemins des fichiers JSONL des parties.
+            chemin (str) : Le chemin du fichier du livre.
+            coups_max (int) : Le nombre de demi-coups de chaque partie ajoutés au livre.
+    """
+    debut = time.perf_counter()
+    nombre_entrees = construit_livre(fichiers=fichiers, chemin=chemin, coups_max=coups_max)
+    print(f"livre : {nombre_entrees} entrées ({os.path.getsize(chemin):,} octets) construit en "
+          f"{time.perf_counter() - debut:.2f}s")
+
+    livre = LivreOuvertures(chemin=chemin)
+    reference = statistiques_reference(fichiers=fichiers, coups_max=coups_max)
+    taille = livre.taille
+    for cle, coups in reference.items():
+        attendus = sorted(((origine[0] * taille + origine[1], destination[0] * taille + destination[1]), *entree)
+                          for (origine, destination), entree in coups.items())
+        assert [(coup, *entree) for coup, *entree in livre.coups(cle=cle)] == attendus, "Entrées invalides !"
+
+    rng = random.Random(0)
+    cles = list(reference) + [rng.getrandbits(64) for _ in range(len(reference))]
+    durees = []
+    for cle in cles:
+        debut = time.perf_counter()
+        livre.coups(cle=cle)
+        durees.append(time.perf_counter() - debut)
+    durees.sort()
+    print(f"consultation : moyenne={sum(durees) / len(durees) * 1e6:.1f}µs "
+          f"p99={durees[int(0.99 * (len(durees) - 1))] * 1e6:.1f}µs max={durees[-1] * 1e6:.1f}µs")
+
+    for choix in (None, MEILLEUR, ALEATOIRE):
+        bot = Albator(profondeur=5, livre=livre if choix is not None else None, choix_livre=choix or MEILLEUR)
+        bot.set_jeu(plateau=Board(taille=taille), valeur_pion=1)
+        debut = time.perf_counter()
+        coup = bot.joue()
+        print(f"premier coup d'Albator (profondeur 5, livre={choix or 'non'}) : {coup} en "
+              f"{(time.perf_counter() - debut) * 1e3:.2f}ms")
+    livre.ferme()
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Construction d'un livre d'ouvertures à partir de parties JSONL.")
+    parseur.add_argument("parties", nargs="*",
+                         help="Fichiers JSONL des parties (sinon, des parties RandomBot contre Albator sont jouées)")
+    parseur.add_argument("-o", "--sortie", default=None, help="Fichier du livre (conservé après le benchmark)")
+    parseur.add_argument("-c", "--coups", type=int, default=12, help="Nombre de demi-coups de chaque partie")
+    arguments = parseur.parse_args()
+
+    fichiers_parties = arguments.parties
+    fichiers_temporaires = []
+    if not fichiers_parties:
+        descripteur, fichier_parties = tempfile.mkstemp(suffix=".jsonl")
+        os.close(descripteur)
+        tournoi(configuration_a=("RandomBot", {}), configuration_b=("Albator", {"profondeur": 2}), nombre_parties=200,
+                fichier=fichier_parties)
+        fichiers_parties = [fichier_parties]
+        fichiers_temporaires.append(fichier_parties)
+    fichier_livre = arguments.sortie
+    if fichier_livre is None:
+        descripteur, fichier_livre = tempfile.mkstemp(suffix=".bin")
+        os.close(descripteur)
+        fichiers_temporaires.append(fichier_livre)
+    try:
+        bench(fichiers=fichiers_parties, chemin=fichier_livre, coups_max=arguments.coups)
+    finally:
+        for fichier_temporaire in fichiers_temporaires:
+            os.remove(fichier_temporaire)
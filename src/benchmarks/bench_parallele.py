@@ -0,0 +1,53 @@
+# Benchmark de la mise à l'échelle de la recherche parallèle d'Albator avec 1, 2, 4, 8 et 16 processus.
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.players.bots.algorithms.parallele import RACINE, LAZY_SMP
+from src.players.bots.bot import Albator
+
+
+def bench(workers: int, mode: str, taille: int, profondeur: int, nombre_positions: int,
+          taille_table: float | None = None):
+    """
+    Cherche le meilleur coup de positions de test avec Albator et retourne le temps total et le nombre de nœuds.
+
+        Paramètres :
+            workers (int) : Le nombre de processus.
+            mode (str) : Le mode de parallélisation.
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions.
+            taille_table (float | None) : La taille en mégaoctets de la table de transposition, ou None.
+
+        Retourne :
+            tuple : Le temps total en secondes et le nombre de nœuds explorés.
+    """
+    duree = 0
+    noeuds = 0
+    for plateau, joueur in positions_test(taille=taille, nombre=nombre_positions):
+        bot = Albator(profondeur=profondeur, workers=workers, mode_parallele=mode, taille_table=taille_table)
+        bot.set_jeu(plateau=plateau, valeur_pion=joueur)
+        bot.joue()  # démarrage de la réserve de processus, non mesuré
+        if bot.table is not None:
+            bot.table.vide()
+        debut = time.perf_counter()
+        bot.joue()
+        duree += time.perf_counter() - debut
+        noeuds += bot.noeuds
+        bot.ferme()
+    return duree, noeuds
+
+
+if __name__ == "__main__":
+    profondeur_max = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for mode_parallele, table in ((RACINE, None), (RACINE, 16), (LAZY_SMP, 16)):
+        reference = None
+        for nombre_workers in (1, 2, 4, 8, 16):
+            temps, nombre_noeuds = bench(workers=nombre_workers, mode=mode_parallele, taille=10,
+                                         profondeur=profondeur_max, nombre_positions=5, taille_table=table)
+            reference = reference or temps
+            print(f"mode={mode_parallele:<9} table={str(table):<5} workers={nombre_workers:<3} temps={temps:7.2f}s "
+                  f"noeuds={nombre_noeuds:<9} accélération=x{reference / temps:.2f}")
@@ -0,0 +1,102 @@
+# Vérification et benchmark de la génération des coups du plateau avec perft (nombre de suites de coups).
+# Les valeurs de référence sont celles des tests ('tests/test_board.py').
+import argparse
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board
+from tests.test_board import REFERENCES_PERFT
+
+
+def verifie(profondeur_max: int | None = None):
+    """
+    Compare les résultats de perft depuis la position de départ aux valeurs de référence de 'REFERENCES_PERFT'.
+
+        Paramètre :
+            profondeur_max (int | None) : La profondeur maximale vérifiée, ou None pour vérifier toutes les références.
+
+        Retourne :
+            bool : True si tous les résultats sont identiques aux références, False sinon.
+    """
+    valide = True
+    for taille, references in REFERENCES_PERFT.items():
+        plateau = Board(taille=taille)
+        for profondeur, reference in enumerate(references, start=1):
+            if profondeur_max is not None and profondeur > profondeur_max:
+                break
+            noeuds = plateau.perft(profondeur=profondeur)
+            if noeuds != reference:
+                valide = False
+                print(f"ERREUR taille={taille} profondeur={profondeur} : {noeuds} au lieu de {reference}")
+    return valide
+
+
+def profondeur_defaut(taille: int):
+    """
+    Retourne la plus grande profondeur de référence dont le nombre de suites de coups n'est pas nul.
+
+        Paramètre :
+            taille (int) : La taille du plateau.
+
+        Retourne :
+            int : La profondeur par défaut de perft pour cette taille.
+    """
+    references = REFERENCES_PERFT[taille]
+    return max(profondeur for profondeur, reference in enumerate(references, start=1) if reference)
+
+
+def bench(taille: int, profondeur: int):
+    """
+    Calcule perft depuis la position de départ et affiche le nombre de suites de coups par seconde.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            profondeur (int) : La profondeur de perft.
+    """
+    plateau = Board(taille=taille)
+    debut = time.perf_counter()
+    noeuds = plateau.perft(profondeur=profondeur)
+    duree = time.perf_counter() - debut
+    references = REFERENCES_PERFT[taille]
+    reference = references[profondeur - 1] if profondeur <= len(references) else None
+    statut = "" if reference is None else (" ok" if noeuds == reference else f" ERREUR (référence {reference})")
+    print(f"taille={taille:<3} profondeur={profondeur:<3} noeuds={noeuds:<10} temps={duree:7.3f}s "
+          f"noeuds/s={noeuds / duree:,.0f}{statut}")
+
+
+def divise(taille: int, profondeur: int):
+    """
+    Affiche le nombre de suites de coups commençant par chacun des coups possibles depuis la position de départ.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            profondeur (int) : La profondeur de perft.
+    """
+    resultats = Board(taille=taille).perft(profondeur=profondeur, divise=True)
+    for (case_origine, case_destination), noeuds in resultats.items():
+        print(f"{case_origine}-->{case_destination} : {noeuds}")
+    print(f"total : {sum(resultats.values())}")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Perft : vérification et vitesse de la génération des coups.")
+    parseur.add_argument("-t", "--taille", type=int, choices=(4, 6, 8, 10), default=None,
+                         help="Taille du plateau (toutes les tailles par défaut)")
+    parseur.add_argument("-p", "--profondeur", type=int, default=None,
+                         help="Profondeur (la plus grande profondeur de référence non nulle par défaut)")
+    parseur.add_argument("-d", "--divise", action="store_true", help="Détaille le résultat par premier coup")
+    parseur.add_argument("-v", "--verifie", action="store_true",
+                         help="Vérifie toutes les valeurs de référence (code de retour 1 en cas d'erreur)")
+    arguments = parseur.parse_args()
+
+    if arguments.verifie:
+        sys.exit(0 if verifie(profondeur_max=arguments.profondeur) else 1)
+    tailles = (arguments.taille,) if arguments.taille is not None else tuple(REFERENCES_PERFT)
+    for taille_plateau in tailles:
+        profondeur_perft = arguments.profondeur or profondeur_defaut(taille=taille_plateau)
+        if arguments.divise:
+            divise(taille=taille_plateau, profondeur=profondeur_perft)
+        else:
+            bench(taille=taille_plateau, profondeur=profondeur_perft)
@@ -0,0 +1,94 @@
+# Benchmark de la recherche PVS et des fenêtres d'aspiration comparées à AlphaBeta à la même profondeur.
+import argparse
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.ordre_coups import OrdonnanceurCoups
+
+
+def recherche_iterative(plateau, joueur: int, profondeur: int, pvs: bool, aspiration: bool, fenetre: int,
+                        ordonne_coups: bool):
+    """
+    Recherche une position par approfondissement itératif jusqu'à la profondeur donnée, chaque itération utilisant
+    éventuellement une fenêtre d'aspiration centrée sur la valeur de l'itération précédente.
+
+        Paramètres :
+            plateau (Board) : Le plateau de la position.
+            joueur (int) : Le joueur devant jouer.
+            profondeur (int) : La profondeur de la dernière itération.
+            pvs (bool) : Si True, les recherches suivent la variante PVS.
+            aspiration (bool) : Si True, les itérations suivant la première utilisent une fenêtre d'aspiration.
+            fenetre (int) : La demi-largeur initiale des fenêtres d'aspiration.
+            ordonne_coups (bool) : Si True, les coups sont triés par un ordonnanceur.
+
+        Retourne :
+            tuple : La valeur de la position et le dictionnaire des compteurs additionnés des itérations.
+    """
+    ordonnanceur = OrdonnanceurCoups() if ordonne_coups else None
+    compteurs = dict.fromkeys(("noeuds", "recherches_nulles", "re_recherches_pvs", "recherches_aspiration",
+                               "re_recherches_aspiration"), 0)
+    valeur = None
+    for profondeur_iteration in range(1, profondeur + 1):
+        algo = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur_iteration,
+                         ordonnanceur=ordonnanceur, pvs=pvs)
+        if aspiration and valeur is not None:
+            valeur = algo.evaluate_aspiration(score_estime=valeur, fenetre=fenetre)
+        else:
+            valeur = algo.evaluate()
+        for compteur in compteurs:
+            compteurs[compteur] += getattr(algo, compteur)
+    return valeur, compteurs
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int, fenetre: int, ordonne_coups: bool):
+    """
+    Recherche des positions de test par approfondissement itératif avec AlphaBeta, PVS et les fenêtres d'aspiration,
+    vérifie que les valeurs trouvées sont identiques et affiche les nœuds explorés (et l'économie par rapport à
+    AlphaBeta) et les taux de nouvelles recherches.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions recherchées.
+            fenetre (int) : La demi-largeur initiale des fenêtres d'aspiration.
+            ordonne_coups (bool) : Si True, les coups sont triés par un ordonnanceur.
+    """
+    positions = positions_test(taille=taille, nombre=nombre_positions)
+    valeurs_reference = None
+    noeuds_reference = None
+    for pvs, aspiration in ((False, False), (True, False), (False, True), (True, True)):
+        valeurs = []
+        totaux = None
+        debut = time.perf_counter()
+        for plateau, joueur in positions:
+            valeur, compteurs = recherche_iterative(plateau=plateau, joueur=joueur, profondeur=profondeur, pvs=pvs,
+                                                    aspiration=aspiration, fenetre=fenetre,
+                                                    ordonne_coups=ordonne_coups)
+            valeurs.append(valeur)
+            totaux = compteurs if totaux is None else {cle: totaux[cle] + compteurs[cle] for cle in totaux}
+        duree = time.perf_counter() - debut
+        if valeurs_reference is None:
+            valeurs_reference, noeuds_reference = valeurs, totaux["noeuds"]
+        assert valeurs == valeurs_reference, "Les valeurs diffèrent de celles d'AlphaBeta !"
+        print(f"taille={taille:<3} profondeur={profondeur:<3} ordonnancement={str(ordonne_coups):<6} "
+              f"pvs={str(pvs):<6} aspiration={str(aspiration):<6} noeuds={totaux['noeuds']:<9} "
+              f"economie={100 * (1 - totaux['noeuds'] / noeuds_reference):5.1f}% temps={duree:6.2f}s "
+              f"re-recherches pvs={100 * totaux['re_recherches_pvs'] / max(totaux['recherches_nulles'], 1):5.1f}% "
+              f"aspiration={100 * totaux['re_recherches_aspiration'] / max(totaux['recherches_aspiration'], 1):5.1f}%")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Benchmark de PVS et des fenêtres d'aspiration.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=6, help="Profondeur de recherche")
+    parseur.add_argument("-n", "--positions", type=int, default=10, help="Nombre de positions recherchées")
+    parseur.add_argument("-f", "--fenetre", type=int, default=2, help="Demi-largeur des fenêtres d'aspiration")
+    arguments = parseur.parse_args()
+
+    for taille_plateau in (8, 10):
+        for ordonnancement in (False, True):
+            bench(taille=taille_plateau, profondeur=arguments.profondeur, nombre_positions=arguments.positions,
+                  fenetre=arguments.fenetre, ordonne_coups=ordonnancement)
@@ -0,0 +1,43 @@
+# Benchmark de la recherche de quiescence : écart des évaluations d'AlphaBeta avec une recherche de référence plus
+# profonde, et nombre de nœuds, avec et sans quiescence.
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.transposition import TableTransposition
+
+
+def bench(taille: int, profondeurs: tuple, profondeur_reference: int, nombre_positions: int):
+    """
+    Évalue des positions de test à différentes profondeurs, avec et sans quiescence, et affiche l'écart moyen avec
+    l'évaluation de référence ainsi que le nombre de nœuds explorés.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeurs (tuple) : Les profondeurs de recherche testées.
+            profondeur_reference (int) : La profondeur de la recherche de référence (sans quiescence).
+            nombre_positions (int) : Le nombre de positions évaluées.
+    """
+    positions = positions_test(taille=taille, nombre=nombre_positions, graine=1)
+    references = [AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur_reference,
+                            table=TableTransposition(taille_mo=16)).evaluate() for plateau, joueur in positions]
+    for profondeur in profondeurs:
+        for quiescence in (False, True):
+            ecart = 0
+            noeuds = 0
+            debut = time.perf_counter()
+            for (plateau, joueur), reference in zip(positions, references):
+                algo = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur, quiescence=quiescence)
+                ecart += abs(algo.evaluate() - reference)
+                noeuds += algo.noeuds
+            duree = time.perf_counter() - debut
+            print(f"taille={taille:<3} profondeur={profondeur:<3} quiescence={str(quiescence):<6} "
+                  f"écart moyen={ecart / len(positions):.3f} noeuds={noeuds:<9} temps={duree:6.2f}s")
+
+
+if __name__ == "__main__":
+    for taille_plateau in (8, 10):
+        bench(taille=taille_plateau, profondeurs=(1, 2, 3, 4), profondeur_reference=8, nombre_positions=20)
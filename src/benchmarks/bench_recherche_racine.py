@@ -0,0 +1,81 @@
+# Nœuds explorés par une recherche de la racine comparée à une recherche indépendante par coup de la racine.
+import argparse
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.minmax import MinMax
+
+
+def recherche_par_coup(classe, plateau, joueur: int, profondeur: int):
+    """
+    Recherche une position comme le faisaient les bots avant la recherche de la racine : chaque coup de la racine est
+    joué puis recherché par un nouvel algorithme, sans borne transmise d'un coup à l'autre.
+
+        Paramètres :
+            classe (type) : La classe de l'algorithme (MinMax ou AlphaBeta).
+            plateau (Board) : Le plateau de la position.
+            joueur (int) : Le joueur devant jouer.
+            profondeur (int) : La profondeur de la recherche (coup de la racine compris).
+
+        Retourne :
+            tuple : La valeur de la position et le nombre de nœuds explorés.
+    """
+    valeurs = []
+    noeuds = 1
+    for coup in plateau.get_liste_coups_possible(joueur=joueur):
+        enregistrement = plateau.make_move(coup=coup)
+        algo = classe(plateau=plateau, joueur_actuel=-joueur, profondeur=profondeur - 1)
+        valeurs.append(algo.evaluate())
+        noeuds += algo.noeuds
+        plateau.unmake_move(enregistrement=enregistrement)
+    return (max(valeurs) if joueur == 1 else min(valeurs)), noeuds
+
+
+def bench(classe, taille: int, profondeur: int, nombre_positions: int):
+    """
+    Recherche des positions de test par coup de la racine et par une recherche de la racine, vérifie que les valeurs
+    trouvées sont identiques et affiche le nombre de nœuds et le temps de chaque méthode.
+
+        Paramètres :
+            classe (type) : La classe de l'algorithme (MinMax ou AlphaBeta).
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions recherchées.
+    """
+    positions = positions_test(taille=taille, nombre=nombre_positions)
+    noeuds_par_coup = noeuds_racine = 0
+    temps_par_coup = temps_racine = 0.0
+    for plateau, joueur in positions:
+        debut = time.perf_counter()
+        valeur_par_coup, noeuds = recherche_par_coup(classe=classe, plateau=plateau, joueur=joueur,
+                                                     profondeur=profondeur)
+        temps_par_coup += time.perf_counter() - debut
+        noeuds_par_coup += noeuds
+        debut = time.perf_counter()
+        algo = classe(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur)
+        _, valeur_racine, variante = algo.recherche_racine()
+        temps_racine += time.perf_counter() - debut
+        noeuds_racine += algo.noeuds
+        assert valeur_racine == valeur_par_coup, "Valeurs différentes !"
+        assert len(variante) >= 1, "Variante principale vide !"
+    print(f"{classe.__name__:<9} taille={taille:<3} profondeur={profondeur:<3} "
+          f"noeuds par coup={noeuds_par_coup:<9} racine={noeuds_racine:<9} "
+          f"reduction={noeuds_par_coup / noeuds_racine:5.2f}x "
+          f"temps par coup={temps_par_coup:6.2f}s racine={temps_racine:6.2f}s")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Recherche de la racine contre recherche par coup de la racine.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=6, help="Profondeur maximale de recherche")
+    parseur.add_argument("-n", "--positions", type=int, default=10, help="Nombre de positions recherchées")
+    arguments = parseur.parse_args()
+
+    for taille_plateau in (8, 10):
+        for profondeur_recherche in range(3, arguments.profondeur + 1):
+            bench(classe=AlphaBeta, taille=taille_plateau, profondeur=profondeur_recherche,
+                  nombre_positions=arguments.positions)
+        bench(classe=MinMax, taille=taille_plateau, profondeur=3, nombre_positions=arguments.positions)
@@ -0,0 +1,86 @@
+# Surcoût des statistiques de recherche (StatistiquesRecherche) pour MinMax et AlphaBeta.
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.minmax import MinMax
+from src.players.bots.algorithms.statistiques import StatistiquesRecherche
+
+
+def recherche(classe, plateau, joueur: int, profondeur: int, statistiques: StatistiquesRecherche | None):
+    """
+    Recherche une position depuis la racine et retourne la valeur trouvée et la durée de la recherche.
+
+        Paramètres :
+            classe (type) : La classe de l'algorithme (MinMax ou AlphaBeta).
+            plateau (Board) : Le plateau recherché.
+            joueur (int) : Le joueur devant jouer.
+            profondeur (int) : La profondeur de recherche.
+            statistiques (StatistiquesRecherche | None) : Les statistiques remplies par la recherche, ou None.
+
+        Retourne :
+            tuple : La valeur et la durée en secondes.
+    """
+    debut = time.perf_counter()
+    algo = classe(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur, statistiques=statistiques)
+    valeur = algo.recherche_racine()[1]
+    return valeur, time.perf_counter() - debut
+
+
+def bench(classe, taille: int, profondeur: int, nombre_positions: int, repetitions: int):
+    """
+    Recherche des positions de test avec et sans statistiques, vérifie que les valeurs trouvées sont identiques et
+    affiche le temps de chaque version et le surcoût des statistiques. Chaque position est recherchée plusieurs fois
+    en alternant les deux versions, et le temps d'une version est la somme des meilleurs temps de chaque position : les
+    interruptions de la machine faussent moins la mesure d'un surcoût de quelques pour cent.
+
+        Paramètres :
+            classe (type) : La classe de l'algorithme (MinMax ou AlphaBeta).
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions recherchées.
+            repetitions (int) : Le nombre de mesures de chaque version pour chaque position.
+
+        Retourne :
+            StatistiquesRecherche : Les statistiques d'une recherche de chaque position.
+    """
+    statistiques = StatistiquesRecherche()
+    temps_sans = temps_avec = 0.0
+    for plateau, joueur in positions_test(taille=taille, nombre=nombre_positions):
+        meilleur_sans = meilleur_avec = float("inf")
+        for repetition in range(repetitions):
+            valeur_sans, duree = recherche(classe=classe, plateau=plateau, joueur=joueur, profondeur=profondeur,
+                                           statistiques=None)
+            meilleur_sans = min(meilleur_sans, duree)
+            valeur_avec, duree = recherche(classe=classe, plateau=plateau, joueur=joueur, profondeur=profondeur,
+                                           statistiques=statistiques if repetition == 0 else StatistiquesRecherche())
+            meilleur_avec = min(meilleur_avec, duree)
+            assert valeur_avec == valeur_sans, "Les statistiques modifient les valeurs !"
+        temps_sans += meilleur_sans
+        temps_avec += meilleur_avec
+    print(f"{classe.__name__:<9} taille={taille:<3} profondeur={profondeur:<3} noeuds={statistiques.noeuds:<9} "
+          f"feuilles={statistiques.feuilles:<9} sans={temps_sans:6.2f}s avec={temps_avec:6.2f}s "
+          f"surcout={100 * (temps_avec / temps_sans - 1):5.1f}%")
+    return statistiques
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Surcoût des statistiques de recherche.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=5, help="Profondeur de recherche d'AlphaBeta")
+    parseur.add_argument("-n", "--positions", type=int, default=20, help="Nombre de positions recherchées")
+    parseur.add_argument("-r", "--repetitions", type=int, default=15,
+                         help="Nombre de mesures de chaque version pour chaque position")
+    arguments = parseur.parse_args()
+
+    exemple = None
+    for taille_plateau in (8, 10):
+        bench(classe=MinMax, taille=taille_plateau, profondeur=3, nombre_positions=arguments.positions,
+              repetitions=arguments.repetitions)
+        exemple = bench(classe=AlphaBeta, taille=taille_plateau, profondeur=arguments.profondeur,
+                        nombre_positions=arguments.positions, repetitions=arguments.repetitions)
+    print(json.dumps(exemple.en_dict(), indent=4))
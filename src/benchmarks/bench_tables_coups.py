@@ -0,0 +1,116 @@
+# Vérification et microbenchmark de la génération des coups à partir des tables de coups précalculées par taille.
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.board import Board, TAILLES_VALIDES
+
+
+class BoardSansTables(Board):
+    """
+    Classe héritant de Board qui construit les listes de coups en calculant les coordonnées des cases de destination
+    et les tuples des coups à chaque appel (comportement précédant les tables de coups précalculées).
+    """
+
+    def get_liste_coups_possible(self, joueur: int):
+        coups_possible = self.get_coups_possible(joueur=joueur)
+        liste_coups_possible = []
+        for case_origine in coups_possible:
+            for case_destination in coups_possible[case_origine]:
+                liste_coups_possible.append((case_origine, case_destination))
+        return liste_coups_possible
+
+    def _construit_coups_possible(self, joueur: int):
+        coordonnees = self.tables.coordonnees
+        decalage_g, decalage_d = self.tables.decalages[joueur]
+        deplacements_g, deplacements_d, prises_g, prises_d = self.masques_coups[joueur]
+        coups_possible = {}
+        origines = deplacements_g | deplacements_d | prises_g | prises_d
+        while origines:
+            bit = origines & -origines
+            origines ^= bit
+            i = bit.bit_length() - 1
+            destinations = []
+            if deplacements_g & bit:
+                destinations.append(coordonnees[i + decalage_g])
+            elif prises_g & bit:
+                destinations.append(coordonnees[i + 2 * decalage_g])
+            if deplacements_d & bit:
+                destinations.append(coordonnees[i + decalage_d])
+            elif prises_d & bit:
+                destinations.append(coordonnees[i + 2 * decalage_d])
+            coups_possible[coordonnees[i]] = destinations
+        return coups_possible
+
+
+def positions_aleatoires(taille: int, nombre: int, graine: int | None = 0):
+    """
+    Retourne les bitboards de positions atteintes au cours de parties aléatoires.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            nombre (int) : Le nombre de positions.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            list : La liste des couples (blancs, noirs) des bitboards des positions.
+    """
+    rng = random.Random(graine)
+    positions = []
+    plateau = Board(taille=taille)
+    while len(positions) < nombre:
+        if plateau.etat() is not None:
+            plateau = Board(taille=taille)
+        positions.append((plateau.pions[1], plateau.pions[-1]))
+        plateau.make_move(coup=rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait)))
+    return positions
+
+
+def bench(taille: int, nombre_positions: int, repetitions: int):
+    """
+    Vérifie que les listes des coups des deux joueurs sont identiques avec et sans les tables de coups sur des
+    positions aléatoires, puis affiche le temps moyen de leur génération (pour les deux joueurs, comme après chaque
+    coup joué).
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            nombre_positions (int) : Le nombre de positions.
+            repetitions (int) : Le nombre de générations de chaque position.
+    """
+    positions = positions_aleatoires(taille=taille, nombre=nombre_positions)
+    durees = {}
+    for classe in (BoardSansTables, Board):
+        plateaux = [classe.depuis_bitboards(taille=taille, blancs=blancs, noirs=noirs) for blancs, noirs in positions]
+        duree = 0.0
+        for plateau in plateaux:
+            debut = time.perf_counter()
+            for _ in range(repetitions):
+                for joueur in (1, -1):
+                    plateau._coups_possible[joueur] = None  # comme après un coup
+                    plateau.get_liste_coups_possible(joueur=joueur)
+            duree += time.perf_counter() - debut
+        durees[classe] = duree / (len(plateaux) * repetitions) * 1e6
+        if classe is Board:
+            for plateau, reference in zip(plateaux, (BoardSansTables.depuis_bitboards(taille=taille, blancs=blancs,
+                                                                                      noirs=noirs)
+                                                     for blancs, noirs in positions)):
+                for joueur in (1, -1):
+                    assert plateau.get_liste_coups_possible(joueur=joueur) == \
+                        reference.get_liste_coups_possible(joueur=joueur), "Coups différents !"
+                    assert plateau.get_coups_possible(joueur=joueur) == reference.get_coups_possible(joueur=joueur), \
+                        "Coups possibles différents !"
+    print(f"taille={taille:<3} sans tables={durees[BoardSansTables]:6.2f}µs tables={durees[Board]:6.2f}µs "
+          f"gain=x{durees[BoardSansTables] / durees[Board]:.2f}")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Génération des coups avec et sans tables de coups précalculées.")
+    parseur.add_argument("-n", "--positions", type=int, default=2000, help="Nombre de positions par taille")
+    parseur.add_argument("-r", "--repetitions", type=int, default=20, help="Nombre de générations par position")
+    arguments = parseur.parse_args()
+
+    for taille_plateau in TAILLES_VALIDES:
+        bench(taille=taille_plateau, nombre_positions=arguments.positions, repetitions=arguments.repetitions)
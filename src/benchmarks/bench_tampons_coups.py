@@ -0,0 +1,295 @@
+# Vérification et allocations (tracemalloc) des coups codés par des entiers dans des tampons préalloués par ply,
+# comparés aux listes de coups, et des enregistrements de coups préalloués par ply, comparés aux tuples.
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.benchmarks.bench_generation_etapes import allocations_generation, noeuds_recherche
+from src.benchmarks.bench_tables_coups import positions_aleatoires
+from src.benchmarks.bench_generation_etapes import difference_snapshots
+from src.game_engine.board import Board
+
+
+def ordre_attendu(plateau: Board, joueur: int, coup_prioritaire: tuple | None = None, prises_seules: bool = False):
+    """
+    Retourne la liste des coups d'un joueur dans l'ordre attendu de 'remplit_coups(...)', construite à partir de
+    'get_liste_coups_possible(...)' : le coup prioritaire s'il est possible, puis les prises, puis les déplacements.
+
+        Paramètres :
+            plateau (Board) : Le plateau.
+            joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
+            coup_prioritaire (tuple | None) : Le couple (indice_origine, indice_destination) du coup prioritaire, ou
+                                              None.
+            prises_seules (bool) : Si True, seules les prises (et le coup prioritaire) sont retournées.
+
+        Retourne :
+            list : La liste des coups (case_origine, case_destination).
+    """
+    taille = plateau.taille
+    coups = plateau.get_liste_coups_possible(joueur=joueur)
+    premiers = [coup for coup in coups if coup_prioritaire == (coup[0][0] * taille + coup[0][1],
+                                                               coup[1][0] * taille + coup[1][1])]
+    prises = [coup for coup in coups if abs(coup[1][0] - coup[0][0]) == 2 and coup not in premiers]
+    deplacements = [] if prises_seules else \
+        [coup for coup in coups if abs(coup[1][0] - coup[0][0]) == 1 and coup not in premiers]
+    return premiers + prises + deplacements
+
+
+class BoardEnregistrementsTuples(Board):
+    """
+    Classe héritant de Board dont chaque coup crée son enregistrement (un tuple gardant les anciennes listes des
+    bitboards des coups possibles) et une nouvelle liste de bitboards par joueur (comportement précédant les
+    enregistrements préalloués par ply).
+    """
+
+    def update_coups_possible_zone(self, zone: int):
+        hors_zone = ~zone
+        for joueur in (1, -1):
+            masques = self._calcule_masques_coups(joueur=joueur, zone=zone)
+            anciens_masques = self.masques_coups[joueur]
+            masques[0] |= anciens_masques[0] & hors_zone
+            masques[1] |= anciens_masques[1] & hors_zone
+            masques[2] |= anciens_masques[2] & hors_zone
+            masques[3] |= anciens_masques[3] & hors_zone
+            self.masques_coups[joueur] = masques
+            self._coups_possible[joueur] = None
+        self.resultat = self._calcule_resultat(blancs_mobiles=self.a_des_coups(joueur=1),
+                                               noirs_mobiles=self.a_des_coups(joueur=-1))
+
+    def _applique_coup(self, coup: tuple, indice_origine: int, indice_destination: int):
+        enregistrement = (coup, self.pions[1], self.pions[-1], self.occupation,
+                          self.masques_coups[1], self.masques_coups[-1],
+                          self._coups_possible[1], self._coups_possible[-1],
+                          self.nombre_pions[1], self.nombre_pions[-1], self.trait, self.resultat, self.cle)
+        joueur = 1 if (self.pions[1] >> indice_origine) & 1 else -1
+        zones_influence = self.tables.zones_influence
+        zobrist = self.tables.zobrist
+        self.pions[joueur] ^= (1 << indice_origine) | (1 << indice_destination)
+        cle = self.cle ^ zobrist[joueur][indice_origine] ^ zobrist[joueur][indice_destination]
+        zone = zones_influence[indice_origine] | zones_influence[indice_destination]
+        if abs(indice_destination - indice_origine) > self.taille + 1:
+            indice_milieu = (indice_origine + indice_destination) // 2
+            self.pions[-joueur] ^= 1 << indice_milieu
+            self.nombre_pions[-joueur] -= 1
+            cle ^= zobrist[-joueur][indice_milieu]
+            zone |= zones_influence[indice_milieu]
+        if self.trait != -joueur:
+            self.trait = -joueur
+            cle ^= self.tables.zobrist_trait
+        self.cle = cle
+        self.occupation = self.pions[1] | self.pions[-1]
+        self.update_coups_possible_zone(zone=zone)
+        self.historique.append(enregistrement)
+        return enregistrement
+
+    def unmake_move_rapide(self, enregistrement: tuple):
+        self.historique.pop()
+        (_, self.pions[1], self.pions[-1], self.occupation,
+         self.masques_coups[1], self.masques_coups[-1],
+         self._coups_possible[1], self._coups_possible[-1],
+         self.nombre_pions[1], self.nombre_pions[-1], self.trait, self.resultat, self.cle) = enregistrement
+
+
+class BoardZoneListes(BoardEnregistrementsTuples):
+    """
+    Classe héritant de BoardEnregistrementsTuples qui recalcule les bitboards des coups possibles d'une zone en créant
+    une liste intermédiaire et la liste de la mobilité des joueurs (comportement précédant les tampons de coups).
+    """
+
+    def update_coups_possible_zone(self, zone: int):
+        hors_zone = ~zone
+        mobiles = []
+        for joueur in (1, -1):
+            masques_zone = self._calcule_masques_coups(joueur=joueur, zone=zone)
+            masques = self.masques_coups[joueur]
+            masques = [(masques[k] & hors_zone) | masques_zone[k] for k in range(4)]
+            self.masques_coups[joueur] = masques
+            self._coups_possible[joueur] = None
+            mobiles.append((masques[0] | masques[1] | masques[2] | masques[3]) != 0)
+        self.resultat = self._calcule_resultat(blancs_mobiles=mobiles[0], noirs_mobiles=mobiles[1])
+
+
+def verification(taille: int, nombre_positions: int, graine: int | None = 0):
+    """
+    Vérifie sur des positions aléatoires que les codes écrits par 'remplit_coups(...)' (avec et sans coup prioritaire,
+    et pour les prises seules) correspondent aux coups de 'get_liste_coups_possible(...)' dans l'ordre attendu (voir
+    'ordre_attendu(...)'), que la génération par étapes ('remplit_deplacements(...)') écrit les mêmes codes, et que
+    les coups joués avec 'make_move_code(...)' et 'make_move_rapide(...)' donnent le même plateau.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            nombre_positions (int) : Le nombre de positions.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            int : Le nombre de générations vérifiées.
+    """
+    rng = random.Random(graine)
+    verifications = 0
+    for blancs, noirs in positions_aleatoires(taille=taille, nombre=nombre_positions, graine=graine):
+        plateau = Board.depuis_bitboards(taille=taille, blancs=blancs, noirs=noirs)
+        tables = plateau.tables
+        tampon = [0] * tables.coups_max
+        for joueur in (1, -1):
+            coups = plateau.get_liste_coups_possible(joueur=joueur)
+            indices = [None, (rng.randrange(taille * taille), rng.randrange(taille * taille))]
+            if coups:
+                (x_origine, y_origine), (x_destination, y_destination) = rng.choice(coups)
+                indices.append((x_origine * taille + y_origine, x_destination * taille + y_destination))
+            for coup_prioritaire in indices:
+                nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_prioritaire)
+                assert [tables.coups_codes[code] for code in tampon[:nombre]] == \
+                    ordre_attendu(plateau=plateau, joueur=joueur, coup_prioritaire=coup_prioritaire), \
+                    "Coups différents !"
+                attendus = tampon[:nombre]
+                nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_prioritaire,
+                                               prises_seules=True)
+                exclu = tampon[0] if coup_prioritaire is not None and nombre else None
+                nombre = plateau.remplit_deplacements(joueur=joueur, tampon=tampon, debut=nombre, exclu=exclu)
+                assert tampon[:nombre] == attendus, "Coups différents avec la génération par étapes !"
+                verifications += 1
+            nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon, prises_seules=True)
+            assert [tables.coups_codes[code] for code in tampon[:nombre]] == \
+                ordre_attendu(plateau=plateau, joueur=joueur, prises_seules=True), "Prises différentes !"
+            for code in tampon[:plateau.remplit_coups(joueur=joueur, tampon=tampon)]:
+                reference = Board.depuis_bitboards(taille=taille, blancs=blancs, noirs=noirs)
+                plateau.make_move_code(code=code)
+                reference.make_move_rapide(coup=tables.coups_codes[code])
+                assert (plateau.pions, plateau.masques_coups, plateau.resultat, plateau.cle) == \
+                    (reference.pions, reference.masques_coups, reference.resultat, reference.cle), "Coups différents !"
+                plateau.unmake_move_rapide(enregistrement=plateau.historique[-1])
+            verifications += 2
+    return verifications
+
+
+def duree_coups(classe_plateau: type, par_code: bool, taille: int, noeuds: list, repetitions: int):
+    """
+    Mesure le temps moyen d'un coup joué puis annulé, pour les coups testés aux nœuds d'une recherche. Les listes
+    temporaires créées à chaque coup n'étant pas visibles dans les instantanés de tracemalloc (elles sont libérées
+    avant la fin du coup), c'est leur coût en temps qui est mesuré.
+
+        Paramètres :
+            classe_plateau (type) : La classe du plateau utilisée.
+            par_code (bool) : Si True, les coups sont joués avec 'make_move_code(...)', sinon avec
+                              'make_move_rapide(...)'.
+            taille (int) : La taille des plateaux.
+            noeuds (list) : Les nœuds retournés par 'noeuds_recherche(...)'.
+            repetitions (int) : Le nombre de fois que chaque coup est joué et annulé.
+
+        Retourne :
+            float : Le temps moyen en microsecondes.
+    """
+    duree = 0.0
+    coups_joues = 0
+    for blancs, noirs, joueur, coup_prioritaire, quiescence, joues, _ in noeuds:
+        plateau = classe_plateau.depuis_bitboards(taille=taille, blancs=blancs, noirs=noirs)
+        tampon = [0] * plateau.tables.coups_max
+        nombre = min(joues, plateau.remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_prioritaire,
+                                                  prises_seules=quiescence))
+        coups = [plateau.tables.coups_codes[code] for code in tampon[:nombre]]
+        debut = time.perf_counter()
+        if par_code:
+            for _ in range(repetitions):
+                for i in range(nombre):
+                    plateau.unmake_move_rapide(enregistrement=plateau.make_move_code(code=tampon[i]))
+        else:
+            for _ in range(repetitions):
+                for coup in coups:
+                    plateau.unmake_move_rapide(enregistrement=plateau.make_move_rapide(coup=coup))
+        duree += time.perf_counter() - debut
+        coups_joues += repetitions * nombre
+    return duree / coups_joues * 1e6
+
+
+def allocations_coups(classe_plateau: type, taille: int, nombre_parties: int, graine: int | None = 0):
+    """
+    Mesure avec tracemalloc les blocs et octets alloués par coup joué. Chaque partie aléatoire est jouée une première
+    fois puis annulée (ce qui crée les enregistrements préalloués de chaque ply), puis rejouée entre deux instantanés
+    sans être annulée : tout ce qu'alloue un coup reste alors référencé par le plateau ou par son historique. Les
+    annulations réécrivent des entiers existants et n'allouent rien.
+
+        Paramètres :
+            classe_plateau (type) : La classe du plateau utilisée.
+            taille (int) : La taille des plateaux.
+            nombre_parties (int) : Le nombre de parties aléatoires.
+            graine (int | None) : La graine du générateur aléatoire.
+
+        Retourne :
+            tuple : Les nombres moyens de blocs et d'octets alloués par coup.
+    """
+    rng = random.Random(graine)
+    blocs = octets = coups_joues = 0
+    for _ in range(nombre_parties):
+        plateau = classe_plateau(taille=taille)
+        tampon = [0] * plateau.tables.coups_max
+        codes = []
+        while plateau.etat() is None:
+            codes.append(tampon[rng.randrange(plateau.remplit_coups(joueur=plateau.trait, tampon=tampon))])
+            plateau.make_move_code(code=codes[-1])
+        while plateau.historique:
+            plateau.unmake_move_rapide(enregistrement=plateau.historique[-1])
+        gc.disable()
+        tracemalloc.start()
+        avant = tracemalloc.take_snapshot()
+        for code in codes:
+            plateau.make_move_code(code=code)
+        apres = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        gc.enable()
+        blocs_partie, octets_partie = difference_snapshots(avant=avant, apres=apres, nombre=1)
+        blocs += blocs_partie
+        octets += octets_partie
+        coups_joues += len(codes)
+    return blocs / coups_joues, octets / coups_joues
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int, taille_table: float | None):
+    """
+    Affiche les blocs et octets alloués par nœud pour générer les coups testés par AlphaBeta avec des listes et avec
+    les tampons, les blocs et octets alloués par coup avec des enregistrements en tuples et préalloués, puis le temps
+    d'un coup joué et annulé avant les tampons, avec des enregistrements en tuples et avec les enregistrements
+    préalloués.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions de test.
+            taille_table (float | None) : La taille de la table de transposition en mégaoctets, ou None.
+    """
+    noeuds = noeuds_recherche(positions=positions_test(taille=taille, nombre=nombre_positions), profondeur=profondeur,
+                              taille_table=taille_table)
+    debut = f"taille={taille:<3} profondeur={profondeur:<3} table={str(taille_table is not None):<6}"
+    for generation in ("listes", "tampons"):
+        blocs, octets = allocations_generation(generation=generation, taille=taille, noeuds=noeuds)
+        print(f"{debut} generation={generation:<8} blocs/noeud={blocs:5.2f} octets/noeud={octets:6.1f}")
+    for classe_plateau in (BoardEnregistrementsTuples, Board):
+        blocs, octets = allocations_coups(classe_plateau=classe_plateau, taille=taille, nombre_parties=20)
+        print(f"{debut} enregistrements={classe_plateau.__name__:<26} blocs/coup={blocs:5.2f} "
+              f"octets/coup={octets:6.1f}")
+    avant = duree_coups(classe_plateau=BoardZoneListes, par_code=False, taille=taille, noeuds=noeuds, repetitions=5)
+    tuples = duree_coups(classe_plateau=BoardEnregistrementsTuples, par_code=True, taille=taille, noeuds=noeuds,
+                         repetitions=5)
+    apres = duree_coups(classe_plateau=Board, par_code=True, taille=taille, noeuds=noeuds, repetitions=5)
+    print(f"{debut} coup+annulation avant={avant:6.2f}µs tuples={tuples:6.2f}µs préalloués={apres:6.2f}µs "
+          f"gain=x{avant / apres:.2f}")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Coups codés par des entiers dans des tampons préalloués.")
+    parseur.add_argument("-p", "--profondeur", type=int, default=5, help="Profondeur de recherche")
+    parseur.add_argument("-n", "--positions", type=int, default=10, help="Nombre de positions de test")
+    arguments = parseur.parse_args()
+
+    for taille_plateau in (4, 6, 8, 10):
+        print(f"taille={taille_plateau:<3} vérification : "
+              f"{verification(taille=taille_plateau, nombre_positions=500)} générations identiques")
+    for taille_plateau in (8, 10):
+        for table_mo in (None, 16):
+            bench(taille=taille_plateau, profondeur=arguments.profondeur, nombre_positions=arguments.positions,
+                  taille_table=table_mo)
@@ -0,0 +1,47 @@
+# Benchmark du nombre de nœuds explorés par AlphaBeta avec et sans table de transposition, à profondeur égale.
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.benchmarks.bench_alpha_beta import positions_test
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.transposition import TableTransposition
+
+
+def bench(taille: int, profondeur: int, nombre_positions: int, taille_table: float | None = None):
+    """
+    Évalue des positions de test avec AlphaBeta et retourne le nombre de nœuds explorés et le temps total.
+
+        Paramètres :
+            taille (int) : La taille des plateaux.
+            profondeur (int) : La profondeur de recherche.
+            nombre_positions (int) : Le nombre de positions évaluées.
+            taille_table (float | None) : La taille en mégaoctets de la table de transposition, ou None.
+
+        Retourne :
+            tuple : Le nombre de nœuds, le temps total en secondes, et la table utilisée.
+    """
+    noeuds = 0
+    table = None
+    debut = time.perf_counter()
+    for plateau, joueur in positions_test(taille=taille, nombre=nombre_positions):
+        if taille_table is not None:
+            table = TableTransposition(taille_mo=taille_table)
+        algo = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur, table=table)
+        algo.evaluate()
+        noeuds += algo.noeuds
+    return noeuds, time.perf_counter() - debut, table
+
+
+if __name__ == "__main__":
+    profondeur_max = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    for taille_plateau in (6, 8, 10):
+        noeuds_sans, temps_sans, _ = bench(taille=taille_plateau, profondeur=profondeur_max, nombre_positions=10)
+        noeuds_avec, temps_avec, table_finale = bench(taille=taille_plateau, profondeur=profondeur_max,
+                                                      nombre_positions=10, taille_table=16)
+        print(f"taille={taille_plateau:<3} profondeur={profondeur_max:<3} "
+              f"sans table : noeuds={noeuds_sans:<8} temps={temps_sans:6.2f}s | "
+              f"avec table : noeuds={noeuds_avec:<8} temps={temps_avec:6.2f}s "
+              f"(-{100 * (1 - noeuds_avec / noeuds_sans):.1f}% de nœuds) | "
+              f"dernière table : {table_finale.statistiques()}")
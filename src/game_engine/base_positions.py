@@ -0,0 +1,263 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from src.game_engine.board import Board
+from src.game_engine.encodage import decompacte_bitboards
+from src.game_engine.game import ObservateurPartie, ResultatPartie
+from src.players.player import BasePlayer
+
+
+# Un fichier de positions commence par un en-tête (signature, version, taille d'un enregistrement) suivi
+# d'enregistrements de taille fixe, ce qui permet d'accéder au i-ème enregistrement sans lire les précédents.
+SIGNATURE = b"DAMESPOS"
+VERSION = 1
+FORMAT_ENTETE = struct.Struct("<8sII")
+
+# Enregistrement de 48 octets, petit-boutiste :
+#   blancs, noirs (2 x uint64 chacun) : les bitboards des pions, mot de poids faible en premier (100 cases au plus)
+#   cle (uint64) : la clé de Zobrist de la position
+#   taille (uint8), trait (int8)
+#   resultat (int8) : le résultat de la partie (1, -1, 0) ou RESULTAT_INCONNU
+#   origine, destination (uint8) : les indices (x * taille + y) du coup joué ou conseillé, ou AUCUN_COUP
+FORMAT_ENREGISTREMENT = struct.Struct("<QQQQQBbbBB3x")
+TYPE_ENREGISTREMENT = np.dtype([("blancs", "<u8", (2,)), ("noirs", "<u8", (2,)), ("cle", "<u8"), ("taille", "u1"),
+                                ("trait", "i1"), ("resultat", "i1"), ("origine", "u1"), ("destination", "u1"),
+                                ("remplissage", "V3")])
+assert TYPE_ENREGISTREMENT.itemsize == FORMAT_ENREGISTREMENT.size
+
+RESULTAT_INCONNU = 2
+AUCUN_COUP = 255
+MASQUE_64 = (1 << 64) - 1
+
+
+def enregistrement(plateau: Board, resultat: int | None = RESULTAT_INCONNU, coup: tuple | None = None):
+    """
+    Retourne l'enregistrement binaire d'une position.
+
+        Paramètres :
+            plateau (Board) : Le plateau à enregistrer.
+            resultat (int | None) : Le résultat de la partie (1, -1, 0) ou RESULTAT_INCONNU.
+            coup (tuple | None) : Le couple (case_origine, case_destination) du coup joué depuis la position, ou None.
+
+        Retourne :
+            bytes : L'enregistrement de 'FORMAT_ENREGISTREMENT.size' octets.
+    """
+    return _enregistrement(taille=plateau.taille, blancs=plateau.pions[1], noirs=plateau.pions[-1], cle=plateau.cle,
+                           trait=plateau.trait, resultat=resultat, coup=coup)
+
+
+def _enregistrement(taille: int, blancs: int, noirs: int, cle: int, trait: int, resultat: int, coup: tuple | None):
+    """
+    Retourne l'enregistrement binaire d'une position à partir de ses bitboards (voir 'enregistrement(...)').
+    """
+    if coup is None:
+        origine = destination = AUCUN_COUP
+    else:
+        origine = coup[0][0] * taille + coup[0][1]
+        destination = coup[1][0] * taille + coup[1][1]
+    return FORMAT_ENREGISTREMENT.pack(blancs & MASQUE_64, blancs >> 64, noirs & MASQUE_64, noirs >> 64, cle, taille,
+                                      trait, resultat, origine, destination)
+
+
+class EcrivainPositions:
+    """
+    Classe permettant d'ajouter des positions à la fin d'un fichier de positions (créé s'il n'existe pas). Chaque appel
+    à 'ecrit(...)' effectue une seule écriture en mode ajout : plusieurs processus peuvent donc ajouter des positions
+    au même fichier.
+
+        Attributs :
+            chemin (str) : Le chemin du fichier.
+            fichier (BufferedWriter) : Le fichier ouvert en mode ajout.
+
+        Interface :
+            ecrit(...) : Ajoute des enregistrements à la fin du fichier.
+            ajoute(...) : Ajoute une position à la fin du fichier.
+            ferme() : Ferme le fichier.
+    """
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+        self.fichier = open(chemin, "ab", buffering=0)
+        if self.fichier.tell() == 0:
+            self.fichier.write(FORMAT_ENTETE.pack(SIGNATURE, VERSION, FORMAT_ENREGISTREMENT.size))
+
+    def ecrit(self, enregistrements: list):
+        """
+        Ajoute des enregistrements à la fin du fichier en une seule écriture.
+
+            Paramètre :
+                enregistrements (list) : La liste des enregistrements (retournés par 'enregistrement(...)').
+        """
+        self.fichier.write(b"".join(enregistrements))
+
+    def ajoute(self, plateau: Board, resultat: int | None = RESULTAT_INCONNU, coup: tuple | None = None):
+        """
+        Ajoute une position à la fin du fichier.
+
+            Paramètres :
+                plateau (Board) : Le plateau à enregistrer.
+                resultat (int | None) : Le résultat de la partie (1, -1, 0) ou RESULTAT_INCONNU.
+                coup (tuple | None) : Le couple (case_origine, case_destination) du coup joué, ou None.
+        """
+        self.ecrit(enregistrements=[enregistrement(plateau=plateau, resultat=resultat, coup=coup)])
+
+    def ferme(self):
+        """
+        Ferme le fichier.
+        """
+        self.fichier.close()
+
+
+class ObservateurEnregistrement(ObservateurPartie):
+    """
+    Observateur enregistrant toutes les positions d'une partie avec le coup joué depuis chacune d'elles. Les
+    enregistrements sont conservés pendant la partie puis écrits en une fois à sa fin, une fois le résultat connu.
+
+        Attributs :
+            ecrivain (EcrivainPositions) : L'écrivain du fichier de positions.
+            enregistrements (list) : Les enregistrements de la partie en cours.
+    """
+
+    def __init__(self, ecrivain: EcrivainPositions):
+        self.ecrivain = ecrivain
+        self.enregistrements = []
+        self._positions = []
+
+    def debut_partie(self, plateau: Board):
+        self.enregistrements = []
+        self._positions = [(plateau.pions[1], plateau.pions[-1], plateau.cle, plateau.trait)]
+
+    def coup_joue(self, plateau: Board, joueur: BasePlayer, case_origine: tuple, case_destination: tuple,
+                  temps_reflexion: float):
+        self._positions.append((plateau.pions[1], plateau.pions[-1], plateau.cle, plateau.trait))
+
+    def fin_partie(self, plateau: Board, resultat: ResultatPartie):
+        taille = plateau.taille
+        self.enregistrements = [_enregistrement(taille=taille, blancs=blancs, noirs=noirs, cle=cle, trait=trait,
+                                                resultat=resultat.gagnant, coup=coup)
+                                for (blancs, noirs, cle, trait), coup in zip(self._positions, resultat.coups + [None])]
+        self.ecrivain.ecrit(enregistrements=self.enregistrements)
+
+
+class LecteurPositions:
+    """
+    Classe permettant de lire un fichier de positions sans le charger en mémoire : le fichier est projeté en mémoire
+    ('mmap') et 'enregistrements' est un tableau NumPy structuré (de type 'TYPE_ENREGISTREMENT') partageant cette
+    mémoire, sans copie. Les accès aléatoires et les parcours séquentiels se font donc directement sur le fichier.
+    Le lecteur s'utilise de préférence dans un bloc 'with', qui le ferme à sa sortie : les enregistrements et les
+    tableaux obtenus sans copie ('lecteur[...]') ne sont plus valides après la fermeture et doivent être copiés
+    ('np.copy(...)') pour être conservés.
+
+        Attributs :
+            chemin (str) : Le chemin du fichier.
+            enregistrements (np.ndarray) : La vue sur les enregistrements du fichier.
+
+        Interface :
+            __len__() : Retourne le nombre d'enregistrements.
+            __getitem__(...) : Retourne un enregistrement ou une tranche d'enregistrements (vues sans copie).
+            plateau(...) : Retourne le plateau d'un enregistrement.
+            coup(...) : Retourne le coup d'un enregistrement.
+            cases(...) : Retourne les cases d'une tranche d'enregistrements de même taille de plateau.
+            ferme() : Libère la vue et ferme le fichier.
+            __enter__() / __exit__(...) : Retourne le lecteur / ferme le lecteur à la sortie d'un bloc 'with'.
+    """
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+        self._fichier = open(chemin, "rb")
+        taille_fichier = os.fstat(self._fichier.fileno()).st_size
+        assert taille_fichier >= FORMAT_ENTETE.size, "Fichier de positions invalide !"
+        self._memoire = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        signature, version, taille_enregistrement = FORMAT_ENTETE.unpack_from(self._memoire, 0)
+        if signature != SIGNATURE or version != VERSION or taille_enregistrement != TYPE_ENREGISTREMENT.itemsize:
+            raise ValueError("Fichier de positions invalide ou de version différente !")
+        nombre = (taille_fichier - FORMAT_ENTETE.size) // taille_enregistrement
+        self.enregistrements = np.frombuffer(self._memoire, dtype=TYPE_ENREGISTREMENT, count=nombre,
+                                             offset=FORMAT_ENTETE.size)
+
+    def __len__(self):
+        return len(self.enregistrements)
+
+    def __getitem__(self, indice):
+        return self.enregistrements[indice]
+
+    def plateau(self, indice: int):
+        """
+        Retourne le plateau d'un enregistrement.
+
+            Paramètre :
+                indice (int) : L'indice de l'enregistrement.
+
+            Retourne :
+                Board : Le plateau de la position enregistrée.
+        """
+        donnees = self.enregistrements[indice]
+        return Board.depuis_bitboards(taille=int(donnees["taille"]),
+                                      blancs=int(donnees["blancs"][0]) | (int(donnees["blancs"][1]) << 64),
+                                      noirs=int(donnees["noirs"][0]) | (int(donnees["noirs"][1]) << 64),
+                                      trait=int(donnees["trait"]))
+
+    def coup(self, indice: int):
+        """
+        Retourne le coup d'un enregistrement.
+
+            Paramètre :
+                indice (int) : L'indice de l'enregistrement.
+
+            Retourne :
+                tuple : Le couple (case_origine, case_destination) du coup enregistré.
+                NoneType : None si aucun coup n'est enregistré.
+        """
+        donnees = self.enregistrements[indice]
+        if donnees["origine"] == AUCUN_COUP:
+            return None
+        taille = int(donnees["taille"])
+        return divmod(int(donnees["origine"]), taille), divmod(int(donnees["destination"]), taille)
+
+    def cases(self, debut: int | None = 0, fin: int | None = None):
+        """
+        Retourne les cases d'une tranche d'enregistrements dont les plateaux sont de même taille, au format de
+        'encode_plateaux(...)' (utilisable par exemple par 'evalue_lot(...)').
+
+            Paramètres :
+                debut (int | None) : L'indice du premier enregistrement.
+                fin (int | None) : L'indice suivant le dernier enregistrement, ou None pour aller jusqu'à la fin.
+
+            Retourne :
+                np.ndarray : Le tableau int8 (N, taille, taille) des cases.
+        """
+        tranche = self.enregistrements[debut:fin]
+        tailles = np.unique(tranche["taille"])
+        assert len(tailles) == 1, "Les plateaux de la tranche doivent être de la même taille !"
+        bitboards = np.stack((tranche["blancs"], tranche["noirs"]), axis=1).view(np.uint8)
+        return decompacte_bitboards(bitboards=bitboards, taille=int(tailles[0]))
+
+    def ferme(self):
+        """
+        Libère la vue sur les enregistrements et ferme le fichier. Les tableaux obtenus depuis le lecteur sans copie
+        ne doivent plus être utilisés. Si certains existent encore, la projection du fichier ne peut pas être fermée
+        immédiatement ('mmap' lève alors une BufferError) : elle est abandonnée au lieu d'être fermée et n'est libérée
+        qu'avec le dernier de ces tableaux. Le lecteur peut être fermé plusieurs fois.
+
+            Retourne :
+                bool : True si la projection du fichier a été fermée, False si des tableaux l'utilisent encore.
+        """
+        self.enregistrements = None
+        memoire, self._memoire = self._memoire, None
+        if memoire is None:
+            return True
+        self._fichier.close()
+        try:
+            memoire.close()
+        except BufferError:
+            return False
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.ferme()
@@ -1,4 +1,169 @@
+import random
 from math import sqrt
+from types import MappingProxyType
+
+
+TAILLES_VALIDES = (4, 6, 8, 10)
+# Un coup est codé par l'entier (indice_origine << BITS_INDICE) | indice_destination (indices de cases < 128).
+BITS_INDICE = 7
+MASQUE_INDICE = (1 << BITS_INDICE) - 1
+# Un enregistrement de coup contient le coup, les bitboards des pions et de l'occupation, les 4 bitboards des coups
+# possibles de chaque joueur, leurs dictionnaires de coups, leurs nombres de pions, le trait, l'état et la clé.
+TAILLE_ENREGISTREMENT = 19
+
+
+def decale(masque: int, decalage: int):
+    """
+    Décale un bitboard de façon à ce que le bit d'indice 'i' du résultat corresponde au bit d'indice 'i + decalage'
+    du masque d'origine.
+
+        Paramètres :
+            masque (int) : Le bitboard à décaler.
+            decalage (int) : Le décalage d'indice à appliquer (positif ou négatif).
+
+        Retourne :
+            int : Le bitboard décalé.
+    """
+    if decalage >= 0:
+        return masque >> decalage
+    return masque << -decalage
+
+
+class TablesPlateau:
+    """
+    Classe regroupant les tables précalculées pour une taille de plateau, utilisées par la représentation en
+    bitboards de 'Board'. La case de coordonnées (x, y) correspond au bit d'indice x * taille + y.
+
+        Attributs :
+            taille (int) : Taille du plateau associé aux tables.
+            coordonnees (list) : La liste des coordonnées (x, y) de chaque indice de case.
+            masque_plateau (int) : Le bitboard contenant toutes les cases du plateau.
+            decalages (dict) : Pour chaque joueur, le couple (gauche, droite) des décalages d'indice d'un déplacement
+                               d'une case en diagonale vers l'avant.
+            masques_deplacement (dict) : Pour chaque joueur, le couple (gauche, droite) des bitboards des cases depuis
+                                         lesquelles un déplacement d'une case dans cette direction reste sur le plateau.
+            masques_prise (dict) : Pour chaque joueur, le couple (gauche, droite) des bitboards des cases depuis
+                                   lesquelles une prise (déplacement de deux cases) reste sur le plateau.
+            coups_deplacement (dict) : Pour chaque joueur et chaque indice de case, le couple (gauche, droite) des coups
+                                       (case_origine, case_destination) de déplacement depuis cette case, ou None si la
+                                       case de destination est hors du plateau.
+            coups_prise (dict) : Pour chaque joueur et chaque indice de case, le couple (gauche, droite) des coups
+                                 (case_origine, case_destination) de prise depuis cette case, ou None si la case
+                                 d'arrivée est hors du plateau.
+            codes_deplacement (dict) : Pour chaque joueur et chaque indice de case, le couple (gauche, droite) des codes
+                                       entiers des coups de 'coups_deplacement' (voir 'BITS_INDICE'), ou None.
+            codes_prise (dict) : Pour chaque joueur et chaque indice de case, le couple (gauche, droite) des codes
+                                 entiers des coups de 'coups_prise', ou None.
+            coups_codes (list) : Pour chaque code entier, le coup (case_origine, case_destination) correspondant des
+                                 tables, ou None.
+            codes_coups (dict) : Le code entier de chaque coup {(case_origine, case_destination): code, ...}.
+            coups_max (int) : Un majorant du nombre de coups possibles d'un joueur, taille des tampons de coups.
+            zones_influence (list) : Pour chaque indice de case, le bitboard des cases dont les coups possibles
+                                     dépendent du contenu de cette case, c'est-à-dire la case elle-même et les cases
+                                     situées à une ou deux cases en diagonale.
+            zobrist (dict) : Pour chaque joueur, la liste des clés de Zobrist (entiers de 64 bits) de chaque case.
+            zobrist_trait (int) : La clé de Zobrist ajoutée lorsque c'est aux noirs de jouer.
+    """
+
+    def __init__(self, taille: int):
+        self.taille = taille
+        self.coordonnees = [(i, j) for i in range(taille) for j in range(taille)]
+        self.masque_plateau = (1 << (taille * taille)) - 1
+        self.decalages = {}
+        self.masques_deplacement = {}
+        self.masques_prise = {}
+        for joueur in (1, -1):
+            # Les blancs (1) montent vers la ligne 0 et les noirs (-1) descendent vers la ligne 'taille - 1'.
+            self.decalages[joueur] = (-joueur * taille - 1, -joueur * taille + 1)
+            masques_deplacement = []
+            masques_prise = []
+            for dy in (-1, 1):
+                masque_deplacement = 0
+                masque_prise = 0
+                for i, (x, y) in enumerate(self.coordonnees):
+                    if 0 <= x - joueur < taille and 0 <= y + dy < taille:
+                        masque_deplacement |= 1 << i
+                    if 0 <= x - 2 * joueur < taille and 0 <= y + 2 * dy < taille:
+                        masque_prise |= 1 << i
+                masques_deplacement.append(masque_deplacement)
+                masques_prise.append(masque_prise)
+            self.masques_deplacement[joueur] = tuple(masques_deplacement)
+            self.masques_prise[joueur] = tuple(masques_prise)
+        # Les coups sont construits une seule fois par taille : la génération des coups ne fait ensuite que lire ces
+        # tables (sans calcul de coordonnées ni création de tuples) pour les cases d'origine données par les bitboards.
+        self.coups_deplacement = {}
+        self.coups_prise = {}
+        for joueur in (1, -1):
+            self.coups_deplacement[joueur] = [self._coups_case(case=case, dx=-joueur)
+                                              for case in self.coordonnees]
+            self.coups_prise[joueur] = [self._coups_case(case=case, dx=-2 * joueur) for case in self.coordonnees]
+        # Les codes entiers sont eux aussi construits une seule fois : les recherches copient ces entiers dans des
+        # tampons préalloués et n'allouent ainsi ni tuple ni entier pour générer leurs coups.
+        self.codes_deplacement = {}
+        self.codes_prise = {}
+        self.coups_codes = [None] * (len(self.coordonnees) << BITS_INDICE)
+        self.codes_coups = {}
+        for coups_tables, codes_tables in ((self.coups_deplacement, self.codes_deplacement),
+                                           (self.coups_prise, self.codes_prise)):
+            for joueur in (1, -1):
+                codes_tables[joueur] = [tuple(self._code_coup(coup=coup) for coup in coups)
+                                        for coups in coups_tables[joueur]]
+        # Chaque pion a au plus deux coups et occupe une case sombre (la moitié des cases).
+        self.coups_max = taille * taille
+        self.zones_influence = []
+        for x, y in self.coordonnees:
+            zone = 0
+            for dx in (-2, -1, 0, 1, 2):
+                for dy in (-abs(dx), abs(dx)):
+                    if 0 <= x + dx < taille and 0 <= y + dy < taille:
+                        zone |= 1 << ((x + dx) * taille + y + dy)
+            self.zones_influence.append(zone)
+        # Générateur initialisé avec la taille pour que les clés soient identiques d'une exécution à l'autre.
+        generateur = random.Random(taille)
+        self.zobrist = {joueur: [generateur.getrandbits(64) for _ in self.coordonnees] for joueur in (1, -1)}
+        self.zobrist_trait = generateur.getrandbits(64)
+
+    def _coups_case(self, case: tuple, dx: int):
+        """
+        Retourne le couple (gauche, droite) des coups depuis une case vers les cases décalées de 'dx' lignes et d'autant
+        de colonnes, None remplaçant les coups dont la case de destination est hors du plateau.
+
+            Paramètres :
+                case (tuple) : Les coordonnées (x, y) de la case d'origine.
+                dx (int) : Le décalage de ligne du coup (-1/1 pour un déplacement, -2/2 pour une prise).
+
+            Retourne :
+                tuple : Le couple des coups (case_origine, case_destination) ou None.
+        """
+        x, y = case
+        coups = []
+        for dy in (-abs(dx), abs(dx)):
+            if 0 <= x + dx < self.taille and 0 <= y + dy < self.taille:
+                coups.append((case, self.coordonnees[(x + dx) * self.taille + y + dy]))
+            else:
+                coups.append(None)
+        return tuple(coups)
+
+    def _code_coup(self, coup: tuple | None):
+        """
+        Retourne le code entier d'un coup des tables et l'enregistre dans 'coups_codes' et 'codes_coups'.
+
+            Paramètre :
+                coup (tuple | None) : Le coup (case_origine, case_destination) des tables, ou None.
+
+            Retourne :
+                int | None : Le code (indice_origine << BITS_INDICE) | indice_destination du coup, ou None.
+        """
+        if coup is None:
+            return None
+        (x_origine, y_origine), (x_destination, y_destination) = coup
+        code = ((x_origine * self.taille + y_origine) << BITS_INDICE) | (x_destination * self.taille + y_destination)
+        self.coups_codes[code] = coup
+        self.codes_coups[coup] = code
+        return code
+
+
+TABLES_PLATEAU = {taille: TablesPlateau(taille=taille) for taille in TAILLES_VALIDES}
 
 
 class Board:
@@ -9,21 +174,46 @@ class Board:
         * 0 pour les cases vides
         * 1 pour les pions blancs
         * -1 pour les pions noirs
-    de la forme suivante dans un dictionnaire : {(x, y): value, ...}.
+    La position est stockée sous forme de bitboards : un entier par couleur dont le bit d'indice x * taille + y indique
+    la présence d'un pion sur la case (x, y), ainsi qu'un entier pour l'occupation du plateau. Le dictionnaire
+    {(x, y): value, ...} des cases reste accessible en lecture seule avec 'cases' et 'get_cases()' (les cases se
+    modifient avec 'set_case(...)').
 
         Attributs :
-            cases (dict) : Un dictionnaire contenant toutes les cases du jeu avec leurs valeurs.
+            cases (MappingProxyType) : Un dictionnaire en lecture seule contenant toutes les cases du jeu avec leurs
+                                       valeurs (reconstruit à partir des bitboards à chaque accès).
             taille (int) : Taille du plateau, c'est-à-dire la taille de sa largeur et de sa hauteur.
-            coups_possible (dict) : Un dictionnaire contenant les coups possible pouvant être joués.
+            tables (TablesPlateau) : Les tables précalculées pour la taille du plateau.
+            pions (dict) : Un dictionnaire contenant le bitboard des pions de chaque joueur.
+            occupation (int) : Le bitboard de toutes les cases occupées.
+            masques_coups (dict) : Pour chaque joueur, la liste des bitboards des cases d'origine de ses coups possibles
+                                   [déplacements à gauche, déplacements à droite, prises à gauche, prises à droite].
+            coups_possible (dict) : Un dictionnaire contenant les coups possible pouvant être joués (construit à partir
+                                    de 'masques_coups' seulement lorsqu'il est demandé).
             nombre_pions (dict) : Un dictionnaire contenant le nombre de pions de chaque joueur.
+            resultat (int | None) : L'état du plateau retourné par 'etat()', mis à jour avec les coups possibles à
+                                    chaque coup et restauré par 'unmake_move(...)'.
+            trait (int) : Le joueur devant jouer le prochain coup, 1 pour les blancs et -1 pour les noirs.
+            cle (int) : La clé de Zobrist de 64 bits de la position, mise à jour à chaque coup.
+            debug (bool) : Si True, vérifie après chaque coup que la clé incrémentale est correcte, et vérifie aussi les
+                           coups joués et annulés par 'make_move_rapide(...)', 'make_move_code(...)' et
+                           'unmake_move_rapide(...)'.
+            historique (list) : La pile des enregistrements des coups joués, permettant de les annuler.
+            enregistrements (list) : Les enregistrements préalloués de chaque ply, réutilisés par les coups joués à
+                                     cette profondeur de 'self.historique'.
 
         Interface :
+            depuis_bitboards(...) : Crée un plateau à partir des bitboards des pions de chaque joueur.
             get_cases() : Retourne les cases du plateau.
             get_case(...) : Retourne la valeur de la case spécifiée si valide.
             set_case(...) : Met à jour la valeur d'une case (si valide) avec la valeur spécifiée.
             get_coups_possible(...) : Retourne les coups possibles pouvant être joués par un joueur.
             get_liste_couops_possible(...) : Retourne les coups possibles d'un joueur sous forme de liste.
-            update_coups_possible(...) : Met à jour les coups possibles.
+            remplit_coups(...) : Écrit les codes entiers des coups possibles d'un joueur dans un tampon préalloué.
+            remplit_deplacements(...) : Écrit à la suite d'un tampon les codes entiers des déplacements d'un joueur.
+            a_des_coups(...) : Retourne si un joueur a au moins un coup possible.
+            update_coups_possible(...) : Met à jour les coups possibles en parcourant tout le plateau.
+            update_coups_possible_zone(...) : Met à jour les coups possibles des cases d'une zone du plateau.
             get_nombre_pions(...) : Retourne le nombre de pions restant d'un joueur sur le plateau.
             update_nombre_pions() : Met à jour le nombre de pions restant sur le plateau de tous les joueurs.
             set_nombre_pions(...) : Met à jour le nombre de pions d'un ou plusieurs joueurs avec la valeur donné.
@@ -34,39 +224,115 @@ class Board:
             coup_valide(...) : Retourne si un coup est valide ou non sur le plateau de jeu.
             etat() : Retourne l'état du plateau, c'est-à-dire si un joueur a gagné ou non.
             joue(...) : Vérifie et applique un coup sur le plateau.
+            make_move(...) : Vérifie et applique un coup, puis retourne l'enregistrement permettant de l'annuler.
+            make_move_rapide(...) : Applique sans vérification un coup issu de la génération des coups.
+            make_move_code(...) : Applique sans vérification un coup donné par son code entier.
+            unmake_move(...) : Annule le dernier coup joué à partir de son enregistrement.
+            unmake_move_rapide(...) : Annule sans vérification le dernier coup joué.
+            hash() : Retourne la clé de Zobrist de la position.
+            calcule_hash() : Recalcule entièrement la clé de Zobrist de la position.
+            perft(...) : Compte les suites de coups d'une profondeur donnée (vérification de la génération des coups).
+            verifie_hash() : Vérifie que la clé incrémentale correspond à la clé recalculée.
             __str__() : Renvoie la représentation en chaîne de caractère du plateau.
     """
 
-    def __init__(self, taille: int | None = 8, cases: dict | None = None):
-        self.coups_possible = {1: {}, -1: {}}
+    def __init__(self, taille: int | None = 8, cases: dict | None = None, trait: int | None = 1,
+                 debug: bool | None = False):
+        self.masques_coups = {1: [0, 0, 0, 0], -1: [0, 0, 0, 0]}
+        self._coups_possible = {1: None, -1: None}
+        self.resultat = 0
+        self.historique = []
+        self.enregistrements = []
         self.nombre_pions = {1: 0, -1: 0}
+        self.pions = {1: 0, -1: 0}
         if cases is None:
-            assert 4 <= taille <= 10 and taille % 2 == 0
+            assert taille in TAILLES_VALIDES
             self.taille = taille
-            self.cases = {}
+            self.tables = TABLES_PLATEAU[self.taille]
             for i in range(self.taille):
                 for j in range(self.taille):
                     if (0 <= i <= (((self.taille - 2) // 2) - 1)) and ((j + (i % 2)) % 2):
-                        self.cases[(i, j)] = -1
+                        self.pions[-1] |= 1 << (i * self.taille + j)
                     elif (i >= ((self.taille // 2) + 1)) and ((j + (i % 2)) % 2):
-                        self.cases[(i, j)] = 1
-                    else:
-                        self.cases[(i, j)] = 0
+                        self.pions[1] |= 1 << (i * self.taille + j)
         else:
-            taille = sqrt(len(self.cases))  # ajouter plus de vérification
+            taille = sqrt(len(cases))  # ajouter plus de vérification
             assert taille % 2 == 0 and 4 <= taille <= 10
             self.taille = int(taille)
-            self.cases = cases
+            self.tables = TABLES_PLATEAU[self.taille]
+            for case, valeur in cases.items():
+                if valeur:
+                    self.pions[valeur] |= 1 << (case[0] * self.taille + case[1])
+        assert self.joueur_valide(joueur=trait), "Joueur invalide !"
+        self.trait = trait
+        self.debug = debug
+        self.occupation = self.pions[1] | self.pions[-1]
+        self.cle = self.calcule_hash()
         self.update_coups_possible(joueur=1)
         self.update_coups_possible(joueur=-1)
         self.update_nombre_pions()
 
+    @classmethod
+    def depuis_bitboards(cls, taille: int, blancs: int, noirs: int, trait: int | None = 1):
+        """
+        Crée un plateau à partir des bitboards des pions de chaque joueur.
+
+            Paramètres :
+                taille (int) : La taille du plateau.
+                blancs (int) : Le bitboard des pions blancs.
+                noirs (int) : Le bitboard des pions noirs.
+                trait (int | None) : Le joueur devant jouer le prochain coup.
+
+            Retourne :
+                Board : Le plateau créé.
+        """
+        plateau = cls(taille=taille, trait=trait)
+        plateau.pions = {1: blancs, -1: noirs}
+        plateau.occupation = blancs | noirs
+        plateau.cle = plateau.calcule_hash()
+        plateau.update_coups_possible(joueur=1)
+        plateau.update_coups_possible(joueur=-1)
+        plateau.update_nombre_pions()
+        return plateau
+
+    @property
+    def cases(self):
+        """
+        Reconstruit le dictionnaire des cases du plateau de la forme {(x, y): valeur, ...} à partir des bitboards.
+        Le dictionnaire est retourné en lecture seule : le modifier lève une TypeError au lieu de modifier une copie
+        sans effet sur le plateau (utiliser 'set_case(...)').
+
+            Retourne :
+                MappingProxyType : Le dictionnaire des cases du plateau en lecture seule.
+        """
+        blancs = self.pions[1]
+        noirs = self.pions[-1]
+        cases = {}
+        for i, case in enumerate(self.tables.coordonnees):
+            if (blancs >> i) & 1:
+                cases[case] = 1
+            elif (noirs >> i) & 1:
+                cases[case] = -1
+            else:
+                cases[case] = 0
+        return MappingProxyType(cases)
+
+    @property
+    def coups_possible(self):
+        """
+        Retourne les coups possibles des deux joueurs sous la forme {1: {...}, -1: {...}}.
+
+            Retourne :
+                dict : Un dictionnaire contenant les coups possibles de chaque joueur.
+        """
+        return {1: self.get_coups_possible(joueur=1), -1: self.get_coups_possible(joueur=-1)}
+
     def get_cases(self):
         """
         Retourne les cases du plateau.
 
             Retourne :
-                dict : Le dictionnaire des cases du plateau, c'est-à-dire 'self.cases'.
+                MappingProxyType : Le dictionnaire des cases du plateau en lecture seule, c'est-à-dire 'self.cases'.
         """
         return self.cases
 
@@ -81,7 +347,12 @@ class Board:
                 int : La valeur de la case étant -1, 0 ou 1.
         """
         assert self.case_valide(case=case), "Case invalide !"
-        return self.cases[case]
+        bit = 1 << (case[0] * self.taille + case[1])
+        if self.pions[1] & bit:
+            return 1
+        if self.pions[-1] & bit:
+            return -1
+        return 0
 
     def set_case(self, case: tuple, valeur: int):
         """
@@ -93,7 +364,18 @@ class Board:
         """
         assert self.case_valide(case=case), "Coordonnées de la case invalide !"
         assert valeur in [-1, 0, 1], "Valeur de la case invalide !"
-        self.cases[case] = valeur
+        indice = case[0] * self.taille + case[1]
+        ancienne_valeur = self.get_case(case=case)
+        if ancienne_valeur:
+            self.cle ^= self.tables.zobrist[ancienne_valeur][indice]
+        if valeur:
+            self.cle ^= self.tables.zobrist[valeur][indice]
+        bit = 1 << indice
+        self.pions[1] &= ~bit
+        self.pions[-1] &= ~bit
+        if valeur:
+            self.pions[valeur] |= bit
+        self.occupation = self.pions[1] | self.pions[-1]
 
     def get_coups_possible(self, joueur: int):
         """
@@ -107,13 +389,19 @@ class Board:
                        case d'origine et comme valeurs une liste des cases de destinations.
         """
         assert self.joueur_valide(joueur=joueur), "Joueur invalide !"
-        return self.coups_possible[joueur]
+        coups_possible = self._coups_possible[joueur]
+        if coups_possible is None:
+            coups_possible = self._construit_coups_possible(joueur=joueur)
+            self._coups_possible[joueur] = coups_possible
+        return coups_possible
 
     def get_liste_coups_possible(self, joueur: int):
         """
         Retourne une liste de tuple des coups possibles d'un joueur sur le plateau actuel de la forme :
         [(case_origine, case_destination), ...] avec 'case_origine' les coordonnées (x, y) de la case d'origine du coup
-        et 'case_destination' les coordonnées (x, y) de la case de destination du coup.
+        et 'case_destination' les coordonnées (x, y) de la case de destination du coup. La liste est construite
+        directement à partir des bitboards et des coups précalculés de 'self.tables', dans l'ordre des coups de
+        'get_coups_possible(...)'.
 
             Paramètre :
                 joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
@@ -122,41 +410,272 @@ class Board:
                 list : La liste des coups possible du joueur en question.
         """
         assert self.joueur_valide(joueur=joueur)
-        coups_possible = self.get_coups_possible(joueur=joueur)
+        coups_deplacement = self.tables.coups_deplacement[joueur]
+        coups_prise = self.tables.coups_prise[joueur]
+        deplacements_g, deplacements_d, prises_g, prises_d = self.masques_coups[joueur]
         liste_coups_possible = []
-        for case_origine in coups_possible:
-            for case_destination in coups_possible[case_origine]:
-                liste_coups_possible.append((case_origine, case_destination))
+        origines = deplacements_g | deplacements_d | prises_g | prises_d
+        while origines:
+            bit = origines & -origines
+            origines ^= bit
+            i = bit.bit_length() - 1
+            if deplacements_g & bit:
+                liste_coups_possible.append(coups_deplacement[i][0])
+            elif prises_g & bit:
+                liste_coups_possible.append(coups_prise[i][0])
+            if deplacements_d & bit:
+                liste_coups_possible.append(coups_deplacement[i][1])
+            elif prises_d & bit:
+                liste_coups_possible.append(coups_prise[i][1])
         return liste_coups_possible
 
     def update_coups_possible(self, joueur: int):
         """
-        Met à jour la liste des coups possible 'self.coups_possible' pour un joueur (-1 : noirs et 1 : blancs).
+        Met à jour les coups possibles d'un joueur (-1 : noirs et 1 : blancs) en recalculant les bitboards
+        'self.masques_coups' sur tout le plateau.
 
             Paramètre :
-                case (tuple) : Tuple de deux entiers contenant les coordonnées de la case.
+                joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
         """
         assert self.joueur_valide(joueur=joueur), "Joueur invalide !"
-        self.coups_possible[joueur] = {}
-        for case, valeur_case in self.cases.items():
-            if valeur_case == joueur:
-                self.coups_possible[joueur][case] = []
-                cg = (case[0] - joueur, case[1] - 1)  # case gauche
-                cd = (case[0] - joueur, case[1] + 1)  # case droite
-                cg_2 = (cg[0] - joueur, cg[1] - 1)  # case gauche de la case gauche
-                cd_2 = (cd[0] - joueur, cd[1] + 1)  # case droite de la case droite
-                etat_cg = self.etat_case(case=cg)
-                etat_cd = self.etat_case(case=cd)
-                if etat_cg == 0:
-                    self.coups_possible[joueur][case].append(cg)
-                elif etat_cg == -joueur and self.etat_case(case=cg_2) == 0:
-                    self.coups_possible[joueur][case].append(cg_2)
-                if etat_cd == 0:
-                    self.coups_possible[joueur][case].append(cd)
-                elif etat_cd == -joueur and self.etat_case(case=cd_2) == 0:
-                    self.coups_possible[joueur][case].append(cd_2)
-                if len(self.coups_possible[joueur][case]) == 0:
-                    self.coups_possible[joueur].pop(case)
+        self.masques_coups[joueur] = self._calcule_masques_coups(joueur=joueur, zone=self.tables.masque_plateau)
+        self._coups_possible[joueur] = None
+        self.resultat = self._calcule_resultat(blancs_mobiles=self.a_des_coups(joueur=1),
+                                               noirs_mobiles=self.a_des_coups(joueur=-1))
+
+    def update_coups_possible_zone(self, zone: int):
+        """
+        Met à jour les coups possibles des deux joueurs en ne recalculant que les cases d'origine appartenant à la
+        zone donnée. Après un coup, il suffit de recalculer l'union des zones d'influence des cases modifiées (origine,
+        destination et case prise) pour obtenir les mêmes coups possibles qu'avec 'update_coups_possible(...)'.
+        L'état du plateau 'self.resultat' est mis à jour à partir des nouveaux coups possibles.
+
+            Paramètre :
+                zone (int) : Le bitboard des cases d'origine à recalculer.
+        """
+        tables = self.tables
+        hors_zone = ~zone
+        vides = tables.masque_plateau & ~self.occupation
+        for joueur in (1, -1):
+            # Les bitboards sont réécrits dans la liste de chaque joueur : leurs anciennes valeurs sont copiées dans
+            # l'enregistrement du coup et réécrites dans la même liste à l'annulation.
+            pions = self.pions[joueur] & zone
+            adverses = self.pions[-joueur]
+            decalage_g, decalage_d = tables.decalages[joueur]
+            masque_deplacement_g, masque_deplacement_d = tables.masques_deplacement[joueur]
+            masque_prise_g, masque_prise_d = tables.masques_prise[joueur]
+            masques = self.masques_coups[joueur]
+            masques[0] = (masques[0] & hors_zone) | (pions & masque_deplacement_g & decale(vides, decalage_g))
+            masques[1] = (masques[1] & hors_zone) | (pions & masque_deplacement_d & decale(vides, decalage_d))
+            masques[2] = ((masques[2] & hors_zone)
+                          | (pions & masque_prise_g & decale(adverses, decalage_g) & decale(vides, 2 * decalage_g)))
+            masques[3] = ((masques[3] & hors_zone)
+                          | (pions & masque_prise_d & decale(adverses, decalage_d) & decale(vides, 2 * decalage_d)))
+            self._coups_possible[joueur] = None
+        self.resultat = self._calcule_resultat(blancs_mobiles=self.a_des_coups(joueur=1),
+                                               noirs_mobiles=self.a_des_coups(joueur=-1))
+
+    @staticmethod
+    def _calcule_resultat(blancs_mobiles: bool, noirs_mobiles: bool):
+        """
+        Retourne l'état du plateau (voir 'etat()') à partir de la mobilité des deux joueurs : un joueur sans coup
+        possible, en particulier sans pion, a perdu, et la partie est nulle si aucun des deux ne peut jouer.
+
+            Paramètres :
+                blancs_mobiles (bool) : True si les blancs ont au moins un coup possible.
+                noirs_mobiles (bool) : True si les noirs ont au moins un coup possible.
+
+            Retourne :
+                int | None : 1/-1 si le joueur blanc/noir gagne, 0 en cas d'égalité et sinon None.
+        """
+        if blancs_mobiles:
+            return None if noirs_mobiles else 1
+        return -1 if noirs_mobiles else 0
+
+    def _calcule_masques_coups(self, joueur: int, zone: int):
+        """
+        Calcule les bitboards des cases d'origine des coups possibles d'un joueur, restreints aux pions de la zone.
+
+            Paramètres :
+                joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
+                zone (int) : Le bitboard des cases d'origine à considérer.
+
+            Retourne :
+                list : Les bitboards [déplacements à gauche, déplacements à droite, prises à gauche, prises à droite].
+        """
+        tables = self.tables
+        pions = self.pions[joueur] & zone
+        adverses = self.pions[-joueur]
+        vides = tables.masque_plateau & ~self.occupation
+        decalage_g, decalage_d = tables.decalages[joueur]
+        masque_deplacement_g, masque_deplacement_d = tables.masques_deplacement[joueur]
+        masque_prise_g, masque_prise_d = tables.masques_prise[joueur]
+        return [pions & masque_deplacement_g & decale(vides, decalage_g),
+                pions & masque_deplacement_d & decale(vides, decalage_d),
+                pions & masque_prise_g & decale(adverses, decalage_g) & decale(vides, 2 * decalage_g),
+                pions & masque_prise_d & decale(adverses, decalage_d) & decale(vides, 2 * decalage_d)]
+
+    def _construit_coups_possible(self, joueur: int):
+        """
+        Construit le dictionnaire des coups possibles d'un joueur à partir des bitboards 'self.masques_coups', avec les
+        cases d'origine dans l'ordre de parcours du plateau.
+
+            Paramètre :
+                joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
+
+            Retourne :
+                dict : Les coups possibles du joueur de la forme {case_origine: [case_destination, ...], ...}.
+        """
+        coordonnees = self.tables.coordonnees
+        coups_deplacement = self.tables.coups_deplacement[joueur]
+        coups_prise = self.tables.coups_prise[joueur]
+        deplacements_g, deplacements_d, prises_g, prises_d = self.masques_coups[joueur]
+        coups_possible = {}
+        origines = deplacements_g | deplacements_d | prises_g | prises_d
+        while origines:
+            bit = origines & -origines
+            origines ^= bit
+            i = bit.bit_length() - 1
+            destinations = []
+            if deplacements_g & bit:
+                destinations.append(coups_deplacement[i][0][1])
+            elif prises_g & bit:
+                destinations.append(coups_prise[i][0][1])
+            if deplacements_d & bit:
+                destinations.append(coups_deplacement[i][1][1])
+            elif prises_d & bit:
+                destinations.append(coups_prise[i][1][1])
+            coups_possible[coordonnees[i]] = destinations
+        return coups_possible
+
+    def remplit_coups(self, joueur: int, tampon: list, coup_prioritaire: tuple | None = None,
+                      prises_seules: bool | None = False):
+        """
+        Écrit les codes entiers (voir 'BITS_INDICE') des coups possibles d'un joueur au début d'un tampon préalloué
+        et retourne leur nombre : le coup prioritaire s'il est possible, puis les prises, puis les déplacements, dans
+        l'ordre de parcours du plateau pour chaque étape. Les codes écrits sont ceux de 'self.tables' : la génération
+        n'alloue ni liste, ni tuple, ni entier, et le tampon d'un ply peut être réutilisé à chaque nœud de ce ply. Avec
+        'prises_seules', les déplacements peuvent être écrits plus tard avec 'remplit_deplacements(...)'.
+
+            Paramètres :
+                joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
+                tampon (list) : Le tampon à remplir, d'au moins 'self.tables.coups_max' éléments.
+                coup_prioritaire (tuple | None) : Le couple (indice_origine, indice_destination) du coup à écrire en
+                                                  premier s'il est possible, ou None.
+                prises_seules (bool | None) : Si True, seules les prises (et le coup prioritaire) sont écrites.
+
+            Retourne :
+                int : Le nombre de codes écrits au début du tampon.
+        """
+        codes_prise = self.tables.codes_prise[joueur]
+        _, _, prises_g, prises_d = self.masques_coups[joueur]
+        nombre = 0
+        premier = None
+        if coup_prioritaire is not None:
+            premier = self._code_tables(joueur=joueur, indices=coup_prioritaire)
+            if premier is not None:
+                tampon[0] = premier
+                nombre = 1
+        origines = prises_g | prises_d
+        while origines:
+            bit = origines & -origines
+            origines ^= bit
+            i = bit.bit_length() - 1
+            if prises_g & bit and codes_prise[i][0] != premier:
+                tampon[nombre] = codes_prise[i][0]
+                nombre += 1
+            if prises_d & bit and codes_prise[i][1] != premier:
+                tampon[nombre] = codes_prise[i][1]
+                nombre += 1
+        if prises_seules:
+            return nombre
+        codes_deplacement = self.tables.codes_deplacement[joueur]
+        deplacements_g, deplacements_d, _, _ = self.masques_coups[joueur]
+        origines = deplacements_g | deplacements_d
+        while origines:
+            bit = origines & -origines
+            origines ^= bit
+            i = bit.bit_length() - 1
+            if deplacements_g & bit and codes_deplacement[i][0] != premier:
+                tampon[nombre] = codes_deplacement[i][0]
+                nombre += 1
+            if deplacements_d & bit and codes_deplacement[i][1] != premier:
+                tampon[nombre] = codes_deplacement[i][1]
+                nombre += 1
+        return nombre
+
+    def remplit_deplacements(self, joueur: int, tampon: list, debut: int, exclu: int | None = None):
+        """
+        Écrit les codes entiers des déplacements (coups sans prise) d'un joueur dans un tampon à partir de l'indice
+        'debut' et retourne le nombre total de codes du tampon. Permet de générer les coups par étapes : une recherche
+        écrit d'abord le coup prioritaire et les prises ('remplit_coups(..., prises_seules=True)'), puis n'écrit les
+        déplacements à leur suite que si aucune prise n'a provoqué de coupure.
+
+            Paramètres :
+                joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
+                tampon (list) : Le tampon à compléter, d'au moins 'self.tables.coups_max' éléments.
+                debut (int) : L'indice du premier code écrit (le nombre de codes déjà écrits).
+                exclu (int | None) : Le code d'un coup déjà écrit à ne pas écrire à nouveau (le coup prioritaire), ou
+                                     None.
+
+            Retourne :
+                int : Le nombre de codes écrits au début du tampon, 'debut' compris.
+        """
+        codes_deplacement = self.tables.codes_deplacement[joueur]
+        deplacements_g, deplacements_d, _, _ = self.masques_coups[joueur]
+        nombre = debut
+        origines = deplacements_g | deplacements_d
+        while origines:
+            bit = origines & -origines
+            origines ^= bit
+            i = bit.bit_length() - 1
+            if deplacements_g & bit and codes_deplacement[i][0] != exclu:
+                tampon[nombre] = codes_deplacement[i][0]
+                nombre += 1
+            if deplacements_d & bit and codes_deplacement[i][1] != exclu:
+                tampon[nombre] = codes_deplacement[i][1]
+                nombre += 1
+        return nombre
+
+    def _code_tables(self, joueur: int, indices: tuple):
+        """
+        Retourne le code entier de 'self.tables' correspondant à un couple d'indices de cases s'il fait partie des
+        coups possibles du joueur, sinon None.
+
+            Paramètres :
+                joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
+                indices (tuple) : Le couple (indice_origine, indice_destination) du coup.
+
+            Retourne :
+                int | None : Le code entier du coup, ou None s'il n'est pas possible.
+        """
+        indice_origine, indice_destination = indices
+        bit = 1 << indice_origine
+        deplacements_g, deplacements_d, prises_g, prises_d = self.masques_coups[joueur]
+        decalage_g, decalage_d = self.tables.decalages[joueur]
+        difference = indice_destination - indice_origine
+        if difference == decalage_g and deplacements_g & bit:
+            return self.tables.codes_deplacement[joueur][indice_origine][0]
+        if difference == decalage_d and deplacements_d & bit:
+            return self.tables.codes_deplacement[joueur][indice_origine][1]
+        if difference == 2 * decalage_g and prises_g & bit:
+            return self.tables.codes_prise[joueur][indice_origine][0]
+        if difference == 2 * decalage_d and prises_d & bit:
+            return self.tables.codes_prise[joueur][indice_origine][1]
+        return None
+
+    def a_des_coups(self, joueur: int):
+        """
+        Retourne si un joueur a au moins un coup possible, sans construire le dictionnaire de ses coups possibles.
+
+            Paramètre :
+                joueur (int) : La valeur du joueur, 1 pour les blancs et -1 pour les noirs.
+
+            Retourne :
+                bool : True si le joueur peut jouer, sinon False.
+        """
+        deplacements_g, deplacements_d, prises_g, prises_d = self.masques_coups[joueur]
+        return (deplacements_g | deplacements_d | prises_g | prises_d) != 0
 
     def get_nombre_pions(self, joueur: int):
         """
@@ -175,11 +694,8 @@ class Board:
         """
         Met à jour le nombre de pions restant sur le plateau de tous les joueurs.
         """
-        self.nombre_pions[1] = 0
-        self.nombre_pions[-1] = 0
-        for valeur_case in self.cases.values():
-            if valeur_case:
-                self.nombre_pions[valeur_case] += 1
+        self.nombre_pions[1] = self.pions[1].bit_count()
+        self.nombre_pions[-1] = self.pions[-1].bit_count()
 
     def set_nombre_pions(self, valeur: int, joueur: int | None = None):
         """
@@ -234,7 +750,7 @@ class Board:
             Retourne :
                 bool : True si les coordonnées de la case sont valides, sinon False.
         """
-        return all(0 <= coord <= (self.taille - 1) for coord in case)
+        return 0 <= case[0] < self.taille and 0 <= case[1] < self.taille
 
     def etat_case(self, case: tuple):
         """
@@ -254,16 +770,9 @@ class Board:
     def etat(self):
         """
         Retourne l'état actuel du plateau, c'est-à-dire 1/-1 si le joueur blanc/noir gagne, 0 en cas d'égalité et
-        sinon None.
+        sinon None. L'état est maintenu à chaque coup avec les coups possibles ('self.resultat'), sans recalcul.
         """
-        if len(self.get_coups_possible(joueur=1)) == 0 and len(self.get_coups_possible(joueur=-1)) == 0:
-            return 0
-        elif self.get_nombre_pions(joueur=1) <= 0 or len(self.get_coups_possible(joueur=1)) == 0:
-            return -1
-        elif self.get_nombre_pions(joueur=-1) <= 0 or len(self.get_coups_possible(joueur=-1)) == 0:
-            return 1
-        else:
-            return None
+        return self.resultat
 
     def coup_valide(self, case_origine: tuple, case_destination: tuple):
         """
@@ -298,30 +807,312 @@ class Board:
             - un coup inverse : il s'agit d'annuler une prise de pièce, ou un déplacement. Se comporte de la même
                                 manière que les deux autres coups possibles, à la différence qu'il n'est pas vérifié
                                 si la case d'origine et de destination sont présente dans les coups possibles.
+                                S'il correspond au dernier coup de 'self.historique', il est annulé avec
+                                'unmake_move(...)' (à privilégier pour annuler un coup).
 
             Paramètres :
                 case_origine (tuple) : Tuple de deux entiers contenant les coordonnées de la case d'origine.
                 case_destination (tuple) : Tuple de deux entiers contenant les coordonnées de la case de destination.
                 coup_inverse (bool | None) : Booléen qui indique s'il s'agit d'un coup inverse ou non.
         """
-        if coup_inverse and not (self.case_valide(case=case_origine) and self.case_valide(case=case_destination)):
+        if not coup_inverse:
+            self.make_move(coup=(case_origine, case_destination))
+            return
+        if self.historique and self.historique[-1][0] == (case_destination, case_origine):
+            self.unmake_move(enregistrement=self.historique[-1])
+            return
+        if not (self.case_valide(case=case_origine) and self.case_valide(case=case_destination)):
             raise ValueError("Coup inverse invalide : case d'origine/destination pas dans le plateau !")
-        if not coup_inverse and not self.coup_valide(case_origine=case_origine, case_destination=case_destination):
-            raise ValueError("Coup invalide : case d'origine/destination non présente dans les coups possibles !")
 
+        zones_influence = self.tables.zones_influence
         valeur_case_origine = self.get_case(case=case_origine)
         self.set_case(case=case_destination, valeur=valeur_case_origine)
         self.set_case(case=case_origine, valeur=0)
+        zone = (zones_influence[case_origine[0] * self.taille + case_origine[1]]
+                | zones_influence[case_destination[0] * self.taille + case_destination[1]])
         if (abs(case_destination[0]-case_origine[0]) == 2) and (abs(case_destination[1]-case_origine[1]) == 2):
             case_milieu = ((case_origine[0]+case_destination[0])//2, (case_origine[1]+case_destination[1])//2)
-            if coup_inverse:
-                self.add_nombre_pions(joueur=valeur_case_origine*-1, valeur=1)
-                self.set_case(case=case_milieu, valeur=valeur_case_origine*-1)
-            else:
-                self.add_nombre_pions(joueur=self.get_case(case=case_milieu), valeur=-1)
-                self.set_case(case=case_milieu, valeur=0)
-        self.update_coups_possible(joueur=1)
-        self.update_coups_possible(joueur=-1)
+            zone |= zones_influence[case_milieu[0] * self.taille + case_milieu[1]]
+            self.add_nombre_pions(joueur=valeur_case_origine*-1, valeur=1)
+            self.set_case(case=case_milieu, valeur=valeur_case_origine*-1)
+        if valeur_case_origine and self.trait != valeur_case_origine:
+            self.trait = valeur_case_origine
+            self.cle ^= self.tables.zobrist_trait
+        self.update_coups_possible_zone(zone=zone)
+        if self.debug:
+            assert self.verifie_hash(), "Clé de Zobrist incrémentale invalide !"
+
+    def make_move(self, coup: tuple):
+        """
+        Vérifie et applique un coup sur le plateau, puis retourne l'enregistrement permettant de l'annuler avec
+        'unmake_move(...)'. L'enregistrement est aussi empilé dans 'self.historique'. Il est réutilisé par le prochain
+        coup joué à la même profondeur après l'annulation de celui-ci.
+
+            Paramètre :
+                coup (tuple) : Le couple (case_origine, case_destination) du coup à jouer.
+
+            Retourne :
+                list : L'enregistrement contenant le coup et l'état du plateau avant le coup.
+        """
+        case_origine, case_destination = coup
+        if not self.coup_valide(case_origine=case_origine, case_destination=case_destination):
+            raise ValueError("Coup invalide : case d'origine/destination non présente dans les coups possibles !")
+        return self.make_move_rapide(coup=coup)
+
+    def make_move_rapide(self, coup: tuple):
+        """
+        Applique un coup sur le plateau sans vérifier qu'il fait partie des coups possibles, puis retourne
+        l'enregistrement permettant de l'annuler (voir 'make_move(...)'). Réservé aux coups provenant de la génération
+        des coups du plateau (recherches des bots) : un coup invalide corromprait le plateau. Si 'self.debug' vaut
+        True, le coup est vérifié comme avec 'make_move(...)'.
+
+            Paramètre :
+                coup (tuple) : Le couple (case_origine, case_destination) du coup à jouer.
+
+            Retourne :
+                list : L'enregistrement contenant le coup et l'état du plateau avant le coup.
+        """
+        (x_origine, y_origine), (x_destination, y_destination) = coup
+        return self._applique_coup(coup=coup, indice_origine=x_origine * self.taille + y_origine,
+                                   indice_destination=x_destination * self.taille + y_destination)
+
+    def make_move_code(self, code: int):
+        """
+        Applique sans vérification un coup donné par son code entier (voir 'BITS_INDICE'), comme
+        'make_move_rapide(...)'. L'enregistrement retourné contient le coup (case_origine, case_destination) des
+        tables correspondant au code.
+
+            Paramètre :
+                code (int) : Le code entier du coup à jouer, écrit par 'remplit_coups(...)'.
+
+            Retourne :
+                list : L'enregistrement contenant le coup et l'état du plateau avant le coup.
+        """
+        return self._applique_coup(coup=self.tables.coups_codes[code], indice_origine=code >> BITS_INDICE,
+                                   indice_destination=code & MASQUE_INDICE)
+
+    def _applique_coup(self, coup: tuple, indice_origine: int, indice_destination: int):
+        """
+        Applique un coup dont les indices des cases sont connus et retourne son enregistrement (voir
+        'make_move_rapide(...)'). L'état du plateau est copié dans l'enregistrement préalloué du ply (créé au premier
+        coup joué à cette profondeur) et les bitboards des coups possibles sont réécrits dans les listes existantes :
+        un coup n'alloue que les entiers des nouveaux bitboards.
+
+            Paramètres :
+                coup (tuple) : Le couple (case_origine, case_destination) du coup à jouer, conservé dans
+                               l'enregistrement.
+                indice_origine (int) : L'indice de la case d'origine.
+                indice_destination (int) : L'indice de la case de destination.
+
+            Retourne :
+                list : L'enregistrement contenant le coup et l'état du plateau avant le coup.
+        """
+        if self.debug and (coup is None or not self.coup_valide(case_origine=coup[0], case_destination=coup[1])):
+            raise ValueError("Coup invalide : case d'origine/destination non présente dans les coups possibles !")
+        historique = self.historique
+        profondeur = len(historique)
+        if profondeur == len(self.enregistrements):
+            self.enregistrements.append([None] * TAILLE_ENREGISTREMENT)
+        enregistrement = self.enregistrements[profondeur]
+        masques_blancs = self.masques_coups[1]
+        masques_noirs = self.masques_coups[-1]
+        enregistrement[0] = coup
+        enregistrement[1] = self.pions[1]
+        enregistrement[2] = self.pions[-1]
+        enregistrement[3] = self.occupation
+        enregistrement[4] = masques_blancs[0]
+        enregistrement[5] = masques_blancs[1]
+        enregistrement[6] = masques_blancs[2]
+        enregistrement[7] = masques_blancs[3]
+        enregistrement[8] = masques_noirs[0]
+        enregistrement[9] = masques_noirs[1]
+        enregistrement[10] = masques_noirs[2]
+        enregistrement[11] = masques_noirs[3]
+        enregistrement[12] = self._coups_possible[1]
+        enregistrement[13] = self._coups_possible[-1]
+        enregistrement[14] = self.nombre_pions[1]
+        enregistrement[15] = self.nombre_pions[-1]
+        enregistrement[16] = self.trait
+        enregistrement[17] = self.resultat
+        enregistrement[18] = self.cle
+
+        taille = self.taille
+        tables = self.tables
+        zones_influence = tables.zones_influence
+        joueur = 1 if (self.pions[1] >> indice_origine) & 1 else -1
+        zobrist = tables.zobrist
+        self.pions[joueur] ^= (1 << indice_origine) | (1 << indice_destination)
+        cle = self.cle ^ zobrist[joueur][indice_origine] ^ zobrist[joueur][indice_destination]
+        zone = zones_influence[indice_origine] | zones_influence[indice_destination]
+        if abs(indice_destination - indice_origine) > taille + 1:  # prise : la case d'arrivée est à deux diagonales
+            indice_milieu = (indice_origine + indice_destination) // 2
+            self.pions[-joueur] ^= 1 << indice_milieu
+            self.nombre_pions[-joueur] -= 1
+            cle ^= zobrist[-joueur][indice_milieu]
+            zone |= zones_influence[indice_milieu]
+        if self.trait != -joueur:
+            self.trait = -joueur
+            cle ^= tables.zobrist_trait
+        self.cle = cle
+        self.occupation = self.pions[1] | self.pions[-1]
+        self.update_coups_possible_zone(zone=zone)
+        historique.append(enregistrement)
+        if self.debug:
+            assert self.verifie_hash(), "Clé de Zobrist incrémentale invalide !"
+        return enregistrement
+
+    def unmake_move(self, enregistrement: list):
+        """
+        Annule le dernier coup joué en restaurant l'état du plateau sauvegardé dans son enregistrement (bitboards,
+        coups possibles, nombre de pions et état), sans rien recalculer.
+
+            Paramètre :
+                enregistrement (list) : L'enregistrement retourné par 'make_move(...)' pour le dernier coup joué.
+        """
+        assert self.historique and self.historique[-1] is enregistrement, "Seul le dernier coup peut être annulé !"
+        self.unmake_move_rapide(enregistrement=enregistrement)
+
+    def unmake_move_rapide(self, enregistrement: list):
+        """
+        Annule le dernier coup joué comme 'unmake_move(...)', sans vérifier que l'enregistrement est celui du dernier
+        coup joué (sauf si 'self.debug' vaut True). Les bitboards des coups possibles sont réécrits dans les listes
+        existantes.
+
+            Paramètre :
+                enregistrement (list) : L'enregistrement retourné par 'make_move_rapide(...)' pour le dernier coup
+                                        joué.
+        """
+        if self.debug:
+            assert self.historique and self.historique[-1] is enregistrement, "Seul le dernier coup peut être annulé !"
+        self.historique.pop()
+        masques_blancs = self.masques_coups[1]
+        masques_noirs = self.masques_coups[-1]
+        (_, self.pions[1], self.pions[-1], self.occupation,
+         masques_blancs[0], masques_blancs[1], masques_blancs[2], masques_blancs[3],
+         masques_noirs[0], masques_noirs[1], masques_noirs[2], masques_noirs[3],
+         self._coups_possible[1], self._coups_possible[-1],
+         self.nombre_pions[1], self.nombre_pions[-1], self.trait, self.resultat, self.cle) = enregistrement
+        if self.debug:
+            assert self.verifie_hash(), "Clé de Zobrist incrémentale invalide !"
+
+    def perft(self, profondeur: int, divise: bool | None = False):
+        """
+        Compte le nombre de suites de coups de longueur 'profondeur' jouables à partir de la position actuelle, le
+        premier coup étant joué par 'self.trait'. Les suites s'arrêtant sur une fin de partie avant la profondeur
+        demandée ne sont pas comptées. Les coups sont générés avec 'get_liste_coups_possible(...)' et joués puis
+        annulés avec 'joue(...)', ce qui permet de comparer ces nombres à des valeurs de référence pour vérifier la
+        génération des coups et mesurer sa vitesse.
+
+            Paramètres :
+                profondeur (int) : Le nombre de coups successifs.
+                divise (bool | None) : Si True, retourne le nombre de suites commençant par chacun des coups possibles.
+
+            Retourne :
+                int : Le nombre de suites de coups.
+                dict : Si 'divise' vaut True, un dictionnaire {coup: nombre de suites commençant par ce coup}.
+        """
+        assert profondeur >= 0, "La profondeur doit être positive !"
+        if not divise:
+            return self._perft(profondeur=profondeur)
+        resultats = {}
+        if profondeur == 0 or self.etat() is not None:
+            return resultats
+        for case_origine, case_destination in self.get_liste_coups_possible(joueur=self.trait):
+            self.joue(case_origine=case_origine, case_destination=case_destination)
+            resultats[(case_origine, case_destination)] = self._perft(profondeur=profondeur - 1)
+            self.joue(case_origine=case_destination, case_destination=case_origine, coup_inverse=True)
+        return resultats
+
+    def _perft(self, profondeur: int):
+        """
+        Fonction récursive de 'perft(...)'.
+
+            Paramètre :
+                profondeur (int) : Le nombre de coups successifs.
+
+            Retourne :
+                int : Le nombre de suites de coups.
+        """
+        if profondeur == 0:
+            return 1
+        if self.etat() is not None:
+            return 0
+        coups = self.get_liste_coups_possible(joueur=self.trait)
+        if profondeur == 1:
+            return len(coups)
+        noeuds = 0
+        for case_origine, case_destination in coups:
+            self.joue(case_origine=case_origine, case_destination=case_destination)
+            noeuds += self._perft(profondeur=profondeur - 1)
+            self.joue(case_origine=case_destination, case_destination=case_origine, coup_inverse=True)
+        return noeuds
+
+    def hash(self):
+        """
+        Retourne la clé de Zobrist de 64 bits de la position, tenant compte des pions de chaque joueur et du joueur
+        devant jouer. Elle est mise à jour de façon incrémentale à chaque coup.
+
+            Retourne :
+                int : La clé de Zobrist de la position.
+        """
+        return self.cle
+
+    def calcule_hash(self):
+        """
+        Recalcule entièrement la clé de Zobrist de la position à partir des bitboards.
+
+            Retourne :
+                int : La clé de Zobrist de la position.
+        """
+        cle = self.tables.zobrist_trait if self.trait == -1 else 0
+        for joueur in (1, -1):
+            zobrist = self.tables.zobrist[joueur]
+            pions = self.pions[joueur]
+            while pions:
+                bit = pions & -pions
+                pions ^= bit
+                cle ^= zobrist[bit.bit_length() - 1]
+        return cle
+
+    def verifie_hash(self):
+        """
+        Vérifie que la clé de Zobrist incrémentale correspond à la clé recalculée entièrement.
+
+            Retourne :
+                bool : True si les deux clés sont identiques, sinon False.
+        """
+        return self.cle == self.calcule_hash()
+
+    def __getstate__(self):
+        """
+        Retourne l'état du plateau utilisé pour le sérialiser (par exemple pour l'envoyer à un autre processus), sans
+        les tables précalculées qui sont retrouvées à partir de la taille.
+
+            Retourne :
+                dict : L'état du plateau.
+        """
+        etat = self.__dict__.copy()
+        del etat["tables"]
+        return etat
+
+    def __setstate__(self, etat: dict):
+        """
+        Restaure l'état d'un plateau sérialisé avec '__getstate__()'.
+
+            Paramètre :
+                etat (dict) : L'état du plateau.
+        """
+        self.__dict__.update(etat)
+        self.tables = TABLES_PLATEAU[self.taille]
+
+    def __hash__(self):
+        """
+        Retourne la clé de Zobrist de la position (voir 'hash()').
+
+            Retourne :
+                int : La clé de Zobrist de la position.
+        """
+        return self.cle
 
     def __str__(self):
         """
@@ -330,6 +1121,7 @@ class Board:
             Retourne :
                 str : Le plateau sous forme d'une chaine de caractère.
         """
+        cases = self.cases
         res = "    "
         for k in range(self.taille):
             res += f" {k} "
@@ -342,9 +1134,9 @@ class Board:
                     res += "\x1b[1;37;40m"
                 else:
                     res += "\x1b[1;37;47m"
-                if self.cases[(i, j)] == 1:
+                if cases[(i, j)] == 1:
                     res += " B "
-                elif self.cases[(i, j)] == -1:
+                elif cases[(i, j)] == -1:
                     res += " N "
                 else:
                     res += "   "
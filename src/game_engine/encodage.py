@@ -0,0 +1,82 @@
+import numpy as np
+
+from src.game_engine.board import Board
+
+
+def octets_bitboard(taille: int):
+    """
+    Retourne le nombre d'octets nécessaires pour stocker un bitboard d'un plateau de la taille donnée.
+
+        Paramètre :
+            taille (int) : La taille du plateau.
+
+        Retourne :
+            int : Le nombre d'octets d'un bitboard.
+    """
+    return (taille * taille + 7) // 8
+
+
+def encode_bitboards(plateaux: list):
+    """
+    Encode les bitboards d'un lot de plateaux de même taille dans un tableau d'octets compacté : chaque bitboard est
+    stocké en petit-boutiste sur 'octets_bitboard(taille)' octets.
+
+        Paramètre :
+            plateaux (list) : La liste des plateaux à encoder, tous de la même taille.
+
+        Retourne :
+            np.ndarray : Le tableau uint8 de forme (N, 2, octets) contenant les bitboards des blancs puis des noirs.
+    """
+    taille = plateaux[0].taille
+    octets = octets_bitboard(taille=taille)
+    donnees = bytearray()
+    for plateau in plateaux:
+        assert plateau.taille == taille, "Les plateaux doivent être de la même taille !"
+        donnees += plateau.pions[1].to_bytes(octets, "little")
+        donnees += plateau.pions[-1].to_bytes(octets, "little")
+    return np.frombuffer(bytes(donnees), dtype=np.uint8).reshape(len(plateaux), 2, octets)
+
+
+def decompacte_bitboards(bitboards: np.ndarray, taille: int):
+    """
+    Convertit un tableau de bitboards compactés (voir 'encode_bitboards(...)') en tableau de cases.
+
+        Paramètres :
+            bitboards (np.ndarray) : Le tableau uint8 de forme (N, 2, octets) des bitboards des blancs et des noirs.
+            taille (int) : La taille des plateaux.
+
+        Retourne :
+            np.ndarray : Le tableau int8 de forme (N, taille, taille) des cases (1, -1 ou 0).
+    """
+    bits = np.unpackbits(bitboards, axis=2, bitorder="little")[:, :, :taille * taille].astype(np.int8)
+    return (bits[:, 0] - bits[:, 1]).reshape(len(bitboards), taille, taille)
+
+
+def encode_plateaux(plateaux: list):
+    """
+    Encode un lot de plateaux de même taille dans un tableau de cases, la case (x, y) du plateau i étant
+    'tableau[i, x, y]'.
+
+        Paramètre :
+            plateaux (list) : La liste des plateaux à encoder, tous de la même taille.
+
+        Retourne :
+            np.ndarray : Le tableau int8 de forme (N, taille, taille) des cases (1, -1 ou 0).
+    """
+    return decompacte_bitboards(bitboards=encode_bitboards(plateaux=plateaux), taille=plateaux[0].taille)
+
+
+def decode_plateau(cases: np.ndarray, trait: int | None = 1):
+    """
+    Retourne le plateau correspondant à un tableau de cases.
+
+        Paramètres :
+            cases (np.ndarray) : Le tableau de forme (taille, taille) des cases (1, -1 ou 0).
+            trait (int | None) : Le joueur devant jouer le prochain coup.
+
+        Retourne :
+            Board : Le plateau correspondant.
+    """
+    taille = cases.shape[0]
+    return Board(taille=taille, cases={(x, y): int(cases[x, y]) for x in range(taille) for y in range(taille)},
+                 trait=trait)
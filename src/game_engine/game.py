@@ -1,30 +1,147 @@
+from time import perf_counter
+
 from src.game_engine.board import Board
 from src.players.player import BasePlayer
 
 
+class ResultatPartie:
+    """
+    Classe regroupant le résultat d'une partie jouée par 'GameEngine.run()'.
+
+        Attributs :
+            gagnant (int) : Le joueur gagnant (1 pour le blanc, -1 pour le noir) ou 0 en cas d'égalité.
+            coups (list) : La liste des coups joués, sous la forme de couples (case_origine, case_destination).
+            temps_reflexion (list) : Le temps de réflexion en secondes de chaque coup joué.
+            duree (float) : La durée totale de la partie en secondes.
+
+        Interface :
+            nombre_coups : Le nombre de coups (demi-coups) joués.
+            en_dict() : Retourne le résultat sous la forme d'un dictionnaire sérialisable en JSON.
+    """
+
+    def __init__(self, gagnant: int, coups: list, temps_reflexion: list, duree: float):
+        self.gagnant = gagnant
+        self.coups = coups
+        self.temps_reflexion = temps_reflexion
+        self.duree = duree
+
+    @property
+    def nombre_coups(self):
+        return len(self.coups)
+
+    def en_dict(self):
+        """
+        Retourne le résultat de la partie sous la forme d'un dictionnaire sérialisable en JSON.
+
+            Retourne :
+                dict : Le gagnant, les coups joués, leur nombre, les temps de réflexion et la durée de la partie.
+        """
+        return {"gagnant": self.gagnant, "nombre_coups": self.nombre_coups,
+                "coups": [[list(case_origine), list(case_destination)] for case_origine, case_destination in self.coups],
+                "temps_reflexion": self.temps_reflexion, "duree": self.duree}
+
+
+class ObservateurPartie:
+    """
+    Classe de base des observateurs d'une partie, prévenus par 'GameEngine' des événements de la partie. Les méthodes ne
+    font rien par défaut et sont redéfinies par les observateurs selon les événements qui les intéressent.
+
+        Interface :
+            debut_partie(...) : Appelée au début de la partie.
+            coup_joue(...) : Appelée après chaque coup joué.
+            fin_partie(...) : Appelée à la fin de la partie.
+    """
+
+    def debut_partie(self, plateau: Board):
+        """
+        Appelée au début de la partie.
+
+            Paramètre :
+                plateau (Board) : Le plateau de la partie.
+        """
+        pass
+
+    def coup_joue(self, plateau: Board, joueur: BasePlayer, case_origine: tuple, case_destination: tuple,
+                  temps_reflexion: float):
+        """
+        Appelée après chaque coup joué.
+
+            Paramètres :
+                plateau (Board) : Le plateau de la partie, après le coup.
+                joueur (BasePlayer) : Le joueur ayant joué le coup.
+                case_origine (tuple) : La case d'origine du pion déplacé.
+                case_destination (tuple) : La case de destination du pion déplacé.
+                temps_reflexion (float) : Le temps de réflexion du joueur en secondes.
+        """
+        pass
+
+    def fin_partie(self, plateau: Board, resultat: ResultatPartie):
+        """
+        Appelée à la fin de la partie.
+
+            Paramètres :
+                plateau (Board) : Le plateau final de la partie.
+                resultat (ResultatPartie) : Le résultat de la partie.
+        """
+        pass
+
+
+class ObservateurConsole(ObservateurPartie):
+    """
+    Observateur affichant la partie dans la console : le plateau est affiché après chaque coup et une touche est
+    attendue entre chaque coup.
+    """
+
+    def debut_partie(self, plateau: Board):
+        print(plateau)
+
+    def coup_joue(self, plateau: Board, joueur: BasePlayer, case_origine: tuple, case_destination: tuple,
+                  temps_reflexion: float):
+        print(f"{joueur.nom} à joué {case_origine}-->{case_destination}")
+        input("Appuyez sur une touche...")
+        print("\n")
+        print(plateau)
+
+    def fin_partie(self, plateau: Board, resultat: ResultatPartie):
+        input("Fin de la partie, appuyez sur une touche...")
+
+
 class GameEngine:
     """
-    Classe utilisée pour modéliser et gérer une partie de Dames.
+    Classe utilisée pour modéliser et gérer une partie de Dames. Sans observateur, la partie est jouée sans affichage.
 
         Attributs :
             joueur_blanc (Joueur) : Le premier joueur.
             joueur_noir (joueur) : Le deuxième joueur.
             joueur_courant (int) : Un entier représentant le joueur courant.
+            observateurs (list) : Les observateurs prévenus des événements de la partie.
 
         Interface :
+            ajoute_observateur(...) : Ajoute un observateur à la partie.
             change_joueur() : Change le joueur courant.
             run() : Fonction principale permettant de joueur une partie.
     """
 
-    def __init__(self, joueur_blanc: BasePlayer, joueur_noir: BasePlayer, taille_plateau: int | None = 8):
+    def __init__(self, joueur_blanc: BasePlayer, joueur_noir: BasePlayer, taille_plateau: int | None = 8,
+                 observateurs: list | None = None):
         self.plateau = Board(taille=taille_plateau)
         self.joueur_blanc = joueur_blanc
         self.joueur_noir = joueur_noir
         self.joueur_courant = 1
         self.joueurs = {1: self.joueur_blanc, -1: self.joueur_noir}
+        self.observateurs = list(observateurs) if observateurs is not None else []
         joueur_blanc.set_jeu(plateau=self.plateau, valeur_pion=1)
         joueur_noir.set_jeu(plateau=self.plateau, valeur_pion=-1)
 
+    def ajoute_observateur(self, observateur: ObservateurPartie):
+        """
+        Ajoute un observateur prévenu des événements de la partie.
+
+            Paramètre :
+                observateur (ObservateurPartie) : L'observateur à ajouter.
+        """
+        self.observateurs.append(observateur)
+
     def change_joueur(self):
         """
         Change le joueur courant, c'est-à-dire la valeur de 'self.joueur_courant'.
@@ -33,19 +150,34 @@ class GameEngine:
 
     def run(self):
         """
-        Fonction principale permettant de jouer une partie en utilisant une boucle attendant la fin de la partie.
+        Fonction principale permettant de jouer une partie en utilisant une boucle attendant la fin de la partie. Les
+        observateurs sont prévenus du début de la partie, de chaque coup joué et de la fin de la partie.
+
+            Retourne :
+                ResultatPartie : Le résultat de la partie (gagnant, coups joués et temps de réflexion).
         """
+        coups = []
+        temps_reflexion = []
+        debut = perf_counter()
+        for observateur in self.observateurs:
+            observateur.debut_partie(plateau=self.plateau)
         while self.plateau.etat() is None:
-            print(self.plateau)
             joueur = self.joueurs[self.joueur_courant]
+            debut_coup = perf_counter()
             coup_origine, coup_destination = joueur.joue()
+            duree_coup = perf_counter() - debut_coup
             self.plateau.joue(case_origine=coup_origine, case_destination=coup_destination)
-            print(f"{joueur.nom} à joué {coup_origine}-->{coup_destination}")
-            input("Appuyez sur une touche...")
-            print("\n")
+            coups.append((coup_origine, coup_destination))
+            temps_reflexion.append(duree_coup)
+            for observateur in self.observateurs:
+                observateur.coup_joue(plateau=self.plateau, joueur=joueur, case_origine=coup_origine,
+                                      case_destination=coup_destination, temps_reflexion=duree_coup)
             self.change_joueur()
-        print(self.plateau)
-        input("Fin de la partie, appuyez sur une touche...")
+        resultat = ResultatPartie(gagnant=self.plateau.etat(), coups=coups, temps_reflexion=temps_reflexion,
+                                  duree=perf_counter() - debut)
+        for observateur in self.observateurs:
+            observateur.fin_partie(plateau=self.plateau, resultat=resultat)
+        return resultat
 
 
 class Rules:
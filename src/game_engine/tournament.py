@@ -0,0 +1,255 @@
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.game_engine.game import GameEngine
+from src.players.bots.bot import RandomBot, MinMaxBot, Albator, MCTSBot
+
+
+JOUEURS = {
+    "RandomBot": RandomBot,
+    "MinMaxBot": MinMaxBot,
+    "Albator": Albator,
+    "MCTSBot": MCTSBot
+}
+
+
+def lit_configuration(texte: str):
+    """
+    Retourne la configuration d'un joueur à partir de sa description de la forme 'Classe:param=valeur,param=valeur',
+    par exemple 'Albator:profondeur=3,taille_table=16'. Les valeurs sont interprétées comme du JSON si possible.
+
+        Paramètre :
+            texte (str) : La description du joueur.
+
+        Retourne :
+            tuple : Le couple (nom de la classe, dictionnaire des paramètres).
+    """
+    nom, _, parametres_texte = texte.partition(":")
+    if nom not in JOUEURS:
+        raise ValueError(f"Joueur inconnu : {nom} !")
+    parametres = {}
+    for parametre in filter(None, parametres_texte.split(",")):
+        cle, _, valeur = parametre.partition("=")
+        try:
+            parametres[cle] = json.loads(valeur)
+        except json.JSONDecodeError:
+            parametres[cle] = valeur
+    return nom, parametres
+
+
+def description(configuration: tuple):
+    """
+    Retourne la description textuelle d'une configuration de joueur (inverse de 'lit_configuration(...)').
+
+        Paramètre :
+            configuration (tuple) : Le couple (nom de la classe, dictionnaire des paramètres).
+
+        Retourne :
+            str : La description du joueur.
+    """
+    nom, parametres = configuration
+    if not parametres:
+        return nom
+    return nom + ":" + ",".join(f"{cle}={json.dumps(valeur)}" for cle, valeur in parametres.items())
+
+
+def cree_joueur(configuration: tuple):
+    """
+    Crée un joueur à partir de sa configuration.
+
+        Paramètre :
+            configuration (tuple) : Le couple (nom de la classe, dictionnaire des paramètres).
+
+        Retourne :
+            BasePlayer : Le joueur créé.
+    """
+    nom, parametres = configuration
+    return JOUEURS[nom](**parametres)
+
+
+def joue_partie(numero: int, configuration_blanc: tuple, configuration_noir: tuple, taille: int, graine: int,
+                fichier_positions: str | None = None):
+    """
+    Joue une partie sans affichage entre deux joueurs et retourne son résultat.
+
+        Paramètres :
+            numero (int) : Le numéro de la partie dans le tournoi.
+            configuration_blanc (tuple) : La configuration du joueur blanc.
+            configuration_noir (tuple) : La configuration du joueur noir.
+            taille (int) : La taille du plateau.
+            graine (int) : La graine du générateur aléatoire utilisée pour la partie.
+            fichier_positions (str | None) : Le fichier auquel ajouter les positions de la partie, ou None (le module
+                                             'base_positions.py', qui utilise NumPy, n'est importé que si un fichier
+                                             est donné).
+
+        Retourne :
+            dict : Le résultat de la partie (joueurs, gagnant 1/-1/0, coups joués, temps de réflexion,
+                  durée).
+    """
+    random.seed(graine)
+    joueur_blanc = cree_joueur(configuration=configuration_blanc)
+    joueur_noir = cree_joueur(configuration=configuration_noir)
+    partie = GameEngine(joueur_blanc=joueur_blanc, joueur_noir=joueur_noir, taille_plateau=taille)
+    ecrivain = None
+    if fichier_positions is not None:
+        from src.game_engine.base_positions import EcrivainPositions, ObservateurEnregistrement
+        ecrivain = EcrivainPositions(chemin=fichier_positions)
+        partie.ajoute_observateur(observateur=ObservateurEnregistrement(ecrivain=ecrivain))
+    try:
+        resultat = partie.run()
+    finally:
+        if ecrivain is not None:
+            ecrivain.ferme()
+        for joueur in (joueur_blanc, joueur_noir):
+            if hasattr(joueur, "ferme"):
+                joueur.ferme()
+    return {"partie": numero, "graine": graine, "taille": taille, "blanc": description(configuration_blanc),
+            "noir": description(configuration_noir), **resultat.en_dict()}
+
+
+def elo(score: float):
+    """
+    Retourne l'écart de classement Elo correspondant à un score moyen.
+
+        Paramètre :
+            score (float) : Le score moyen (1 par victoire, 0.5 par nulle, 0 par défaite).
+
+        Retourne :
+            float : L'écart Elo (infini si le score vaut 0 ou 1).
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def statistiques(scores: list, duree: float):
+    """
+    Retourne les statistiques d'un tournoi à partir des scores du premier joueur : victoires, nulles, défaites, écart
+    Elo et son intervalle de confiance à 95 % (calculé à partir de l'erreur type du score moyen).
+    Pour que l'écart Elo reste fini, le score utilisé est ramené dans [1 / (2n), 1 - 1 / (2n)] (une demi-partie
+    près d'un score parfait ou nul). Une borne de l'intervalle de confiance dont le score atteint 0 ou 1 n'est pas
+    bornée et vaut None. Sans partie, le score et l'écart Elo valent None.
+
+        Paramètres :
+            scores (list) : Les scores du premier joueur à chaque partie (1, 0.5 ou 0).
+            duree (float) : La durée totale du tournoi en secondes.
+
+        Retourne :
+            dict : Les statistiques du tournoi.
+    """
+    n = len(scores)
+    resultats = {"parties": n, "victoires": scores.count(1), "nulles": scores.count(0.5), "defaites": scores.count(0),
+                 "score": None, "elo": None, "elo_min": None, "elo_max": None,
+                 "parties_par_seconde": n / duree if duree > 0 else 0.0}
+    if n == 0:
+        return resultats
+    moyenne = sum(scores) / n
+    ecart_type = math.sqrt(sum((score - moyenne) ** 2 for score in scores) / n)
+    marge = 1.96 * ecart_type / math.sqrt(n)
+    score_min, score_max = 1 / (2 * n), 1 - 1 / (2 * n)
+    resultats["score"] = moyenne
+    resultats["elo"] = elo(score=min(max(moyenne, score_min), score_max))
+    if moyenne - marge > 0:
+        resultats["elo_min"] = elo(score=min(moyenne - marge, score_max))
+    if moyenne + marge < 1:
+        resultats["elo_max"] = elo(score=max(moyenne + marge, score_min))
+    return resultats
+
+
+def texte_elo(valeur: float | None, borne: str):
+    """
+    Retourne le texte d'un écart Elo, ou le texte d'une borne non bornée si l'écart vaut None.
+
+        Paramètres :
+            valeur (float | None) : L'écart Elo, ou None.
+            borne (str) : Le texte affiché si l'écart vaut None (par exemple '-inf' ou '+inf').
+
+        Retourne :
+            str : Le texte de l'écart Elo.
+    """
+    return borne if valeur is None else f"{valeur:+.1f}"
+
+
+def tournoi(configuration_a: tuple, configuration_b: tuple, nombre_parties: int, taille: int | None = 8,
+            workers: int | None = 1, fichier: str | None = None, graine: int | None = 0,
+            fichier_positions: str | None = None):
+    """
+    Joue un tournoi de plusieurs parties entre deux joueurs, réparties sur plusieurs processus. Les couleurs sont
+    alternées à chaque partie (le joueur A a les blancs pour les parties paires) et chaque partie utilise sa propre
+    graine. Les résultats sont écrits au fur et à mesure au format JSONL (une ligne JSON par partie).
+
+        Paramètres :
+            configuration_a (tuple) : La configuration du joueur A.
+            configuration_b (tuple) : La configuration du joueur B.
+            nombre_parties (int) : Le nombre de parties jouées.
+            taille (int | None) : La taille du plateau.
+            workers (int | None) : Le nombre de processus.
+            fichier (str | None) : Le chemin du fichier JSONL des résultats, ou None.
+            graine (int | None) : La graine de la première partie (la partie i utilise 'graine + i').
+            fichier_positions (str | None) : Le fichier de positions auquel ajouter toutes les positions des parties
+                                             (voir 'base_positions.py'), ou None.
+
+        Retourne :
+            dict : Les statistiques du tournoi du point de vue du joueur A.
+    """
+    scores = []
+    debut = time.perf_counter()
+    sortie = open(fichier, "a", encoding="utf-8") if fichier is not None else None
+    if fichier_positions is not None:
+        from src.game_engine.base_positions import EcrivainPositions
+        EcrivainPositions(chemin=fichier_positions).ferme()  # crée le fichier et son en-tête avant les parties
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as reserve:
+            taches = {}
+            for i in range(nombre_parties):
+                blanc, noir = (configuration_a, configuration_b) if i % 2 == 0 else (configuration_b, configuration_a)
+                tache = reserve.submit(joue_partie, i, blanc, noir, taille, graine + i, fichier_positions)
+                taches[tache] = 1 if i % 2 == 0 else -1
+            for tache in as_completed(taches):
+                resultat = tache.result()
+                resultat_a = resultat["gagnant"] * taches[tache]
+                scores.append((resultat_a + 1) / 2)
+                if sortie is not None:
+                    sortie.write(json.dumps(resultat) + "\n")
+                    sortie.flush()
+    finally:
+        if sortie is not None:
+            sortie.close()
+    return statistiques(scores=scores, duree=time.perf_counter() - debut)
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Tournoi sans affichage entre deux joueurs.")
+    parseur.add_argument("joueur_a", help="Joueur A, par exemple 'Albator:profondeur=3'")
+    parseur.add_argument("joueur_b", help="Joueur B, par exemple 'RandomBot'")
+    parseur.add_argument("-n", "--parties", type=int, default=100, help="Nombre de parties")
+    parseur.add_argument("-t", "--taille", type=int, default=8, help="Taille du plateau")
+    parseur.add_argument("-w", "--workers", type=int, default=1, help="Nombre de processus")
+    parseur.add_argument("-o", "--sortie", default=None, help="Fichier JSONL des résultats")
+    parseur.add_argument("-p", "--positions", default=None, help="Fichier binaire des positions jouées")
+    parseur.add_argument("-g", "--graine", type=int, default=0, help="Graine de la première partie")
+    arguments = parseur.parse_args()
+
+    resultats = tournoi(configuration_a=lit_configuration(texte=arguments.joueur_a),
+                        configuration_b=lit_configuration(texte=arguments.joueur_b),
+                        nombre_parties=arguments.parties, taille=arguments.taille, workers=arguments.workers,
+                        fichier=arguments.sortie, graine=arguments.graine,
+                        fichier_positions=arguments.positions)
+    if not resultats["parties"]:
+        print(f"{arguments.joueur_a} contre {arguments.joueur_b} : aucune partie jouée")
+        sys.exit(0)
+    print(f"{arguments.joueur_a} contre {arguments.joueur_b} : {resultats['victoires']} victoires, "
+          f"{resultats['nulles']} nulles, {resultats['defaites']} défaites (score {resultats['score']:.3f})")
+    print(f"Elo : {resultats['elo']:+.1f} "
+          f"[{texte_elo(valeur=resultats['elo_min'], borne='-inf')}, "
+          f"{texte_elo(valeur=resultats['elo_max'], borne='+inf')}] (intervalle de confiance à 95 %)")
+    print(f"{resultats['parties_par_seconde']:.2f} parties par seconde")
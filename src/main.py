@@ -2,9 +2,9 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from src.game_engine.game import GameEngine
+from src.game_engine.game import GameEngine, ObservateurConsole
 from src.players.player import HumanPlayer
-from src.players.bots.bot import RandomBot, MinMaxBot, Albator
+from src.players.bots.bot import RandomBot, MinMaxBot, Albator, MCTSBot
 
 
 def choix_joueur(couleur: str):
@@ -23,13 +23,15 @@ def choix_joueur(couleur: str):
         2. Bot aléatoire (RandomBot)
         3. Bot MinMax (MinMaxBot)
         4. Bot AlphaBeta (Albator)
+        5. Bot Monte-Carlo (MCTSBot)
     --> """
 
     joueurs = {
         "1": HumanPlayer,
         "2": RandomBot,
         "3": MinMaxBot,
-        "4": Albator
+        "4": Albator,
+        "5": MCTSBot
     }
 
     choix = input(menu)
@@ -54,5 +56,5 @@ if __name__ == "__main__":
     joueur2 = choix_joueur(couleur="noir")
 
     print("\n  ───────────────────────────────────────────────────────────────────────────\n")
-    master_game = GameEngine(joueur_blanc=joueur1, joueur_noir=joueur2)
+    master_game = GameEngine(joueur_blanc=joueur1, joueur_noir=joueur2, observateurs=[ObservateurConsole()])
     master_game.run()
@@ -1,6 +1,12 @@
 import math
+from time import perf_counter
 
-from src.game_engine.board import Board
+from src.game_engine.board import Board, BITS_INDICE, MASQUE_INDICE
+from src.utils import TempsEcoule
+from src.players.bots.algorithms.finales import BaseFinales, SCORE_GAIN, SEUIL_GAIN
+from src.players.bots.algorithms.ordre_coups import OrdonnanceurCoups
+from src.players.bots.algorithms.statistiques import StatistiquesRecherche, fonctions_recherche
+from src.players.bots.algorithms.transposition import TableTransposition, EXACTE, INFERIEURE, SUPERIEURE
 
 
 class AlphaBeta:
@@ -14,16 +20,90 @@ class AlphaBeta:
             plateau (Board) : Le plateau de jeu à évaluer.
             joueur_actuel (int) : Le joueur qui doit actuellement jouer sur ce plateau.
             profondeur (int) : La hauteur du graphe des coups testés (le nombre de coups successifs à tester).
+            table (TableTransposition | None) : La table de transposition utilisée, ou None pour ne pas en utiliser.
+            limite_temps (float | None) : L'instant ('time.perf_counter()') après lequel la recherche est interrompue
+                                          en levant 'TempsEcoule', ou None pour ne pas limiter le temps.
+            ordonnanceur (OrdonnanceurCoups | None) : L'ordonnanceur des coups utilisé, ou None pour tester les coups
+                                                      dans l'ordre de leur génération.
+            noeuds (int) : Le nombre de nœuds explorés par la recherche.
+            coupures (int) : Le nombre de coupures alpha-bêta.
+            coupures_premier_coup (int) : Le nombre de coupures provoquées par le premier coup testé.
+            quiescence (bool) : Si True, les feuilles sont évaluées par une recherche de quiescence.
+            noeuds_quiescence_max (int) : Le nombre maximal de nœuds explorés par les recherches de quiescence.
+            noeuds_quiescence (int) : Le nombre de nœuds explorés par les recherches de quiescence.
+            base_finales (BaseFinales | None) : La base de finales consultée lorsque le nombre de pions ne dépasse pas
+                                                'base_finales.pions_max', ou None pour ne pas en utiliser.
+            succes_finales (int) : Le nombre de positions dont la valeur a été trouvée dans la base de finales.
+            pvs (bool) : Si True, la recherche suit la variante PVS (Principal Variation Search) : les coups suivant
+                         le premier sont d'abord recherchés avec une fenêtre nulle, puis à nouveau avec la fenêtre
+                         complète s'ils peuvent améliorer la valeur du nœud.
+            recherches_nulles (int) : Le nombre de recherches avec une fenêtre nulle (PVS).
+            re_recherches_pvs (int) : Le nombre de ces recherches suivies d'une nouvelle recherche.
+            recherches_aspiration (int) : Le nombre de recherches avec une fenêtre d'aspiration.
+            re_recherches_aspiration (int) : Le nombre de nouvelles recherches après un échec de la fenêtre
+                                             d'aspiration.
+            coups_racine (list | None) : Les coups de la racine imposés par 'recherche_racine(...)', ou None.
+            variantes (list) : Pour chaque ply, le tampon préalloué des codes entiers de la meilleure suite de coups
+                               trouvée depuis le nœud en cours de recherche à ce ply (variante principale triangulaire :
+                               celle de la racine est 'variantes[0]').
+            longueurs_variantes (list) : Pour chaque ply, la longueur de la variante écrite dans 'variantes'.
+            statistiques (StatistiquesRecherche | None) : Les statistiques remplies par la recherche (nœuds, feuilles,
+                                                          coupures par indice de coup, temps des fonctions coûteuses
+                                                          et profondeur maximale), ou None pour ne pas en calculer.
+            tampons (list) : Pour chaque ply, le tampon préalloué dans lequel sont écrits les codes entiers des coups
+                             du nœud en cours de recherche à ce ply (prolongé par la recherche de quiescence).
+            limite_atteinte (bool) : True si la recherche a évalué une position non terminale parce que la profondeur
+                                     maximale était atteinte, ou a utilisé une valeur de la table de transposition
+                                     (qui peut provenir d'une telle recherche). Si False, l'arbre de jeu a été
+                                     entièrement exploré et une recherche plus profonde ne changerait rien.
 
         Interface :
             evaluate_node() : Retourne la valeur heuristique du plateau actuel (fonction d'évaluation).
+            _chronometre(...) : Utilise les fonctions de la recherche chronométrées ou non.
+            _cle(...) : Retourne la clé de la position actuelle avec le joueur devant jouer.
+            _copie_coups(...) : Écrit les codes entiers d'une liste de coups dans un tampon.
+            _enregistre_variante(...) : Écrit la variante d'un nœud à partir de son meilleur coup.
+            _score_table(...) : Retourne le score enregistré dans la table de transposition pour le score d'un nœud.
+            _score_recherche(...) : Retourne le score d'un nœud à partir du score de la table de transposition.
+            _quiescence(...) : Retourne la valeur d'une feuille en ne recherchant que les prises.
             _evaluate(...) : Retourne récursivement la valeur d'un plateau en suivant l'algorithme AlphaBeta.
             evaluate(...) : Initialise l'appel de '_evaluate' et retourne sa valeur.
+            evaluate_aspiration(...) : Retourne la valeur du plateau en cherchant d'abord autour d'une valeur estimée.
+            recherche_racine(...) : Retourne le meilleur coup de la racine, sa valeur et la variante principale.
     """
-    def __init__(self, plateau: Board, joueur_actuel: int, profondeur: int):
+    def __init__(self, plateau: Board, joueur_actuel: int, profondeur: int, table: TableTransposition | None = None,
+                 limite_temps: float | None = None, ordonnanceur: OrdonnanceurCoups | None = None,
+                 quiescence: bool | None = False, noeuds_quiescence_max: int | None = 10000,
+                 base_finales: BaseFinales | None = None, pvs: bool | None = False,
+                 statistiques: StatistiquesRecherche | None = None):
         self.plateau = plateau
         self.joueur_actuel = joueur_actuel
         self.profondeur = profondeur
+        self.table = table
+        self.limite_temps = limite_temps
+        self.ordonnanceur = ordonnanceur
+        self.noeuds = 0
+        self.coupures = 0
+        self.coupures_premier_coup = 0
+        self.quiescence = quiescence
+        self.noeuds_quiescence_max = noeuds_quiescence_max
+        self.noeuds_quiescence = 0
+        self.base_finales = base_finales
+        self.succes_finales = 0
+        self.pvs = pvs
+        self.recherches_nulles = 0
+        self.re_recherches_pvs = 0
+        self.recherches_aspiration = 0
+        self.re_recherches_aspiration = 0
+        self.coups_racine = None
+        self.variantes = [[0] * (profondeur - ply) for ply in range(profondeur + 1)]
+        self.longueurs_variantes = [0] * (profondeur + 1)
+        self.statistiques = statistiques
+        self.tampons = [[0] * plateau.tables.coups_max for _ in range(profondeur + 1)]
+        self.limite_atteinte = False
+        self._fonctions, self._fonctions_chronometrees = fonctions_recherche(
+            plateau=plateau, evaluate_node=self.evaluate_node, statistiques=statistiques)
+        self._chronometre(actif=False)
 
     def evaluate_node(self):
         """
@@ -35,11 +115,192 @@ class AlphaBeta:
         """
         return self.plateau.get_nombre_pions(joueur=1) - self.plateau.get_nombre_pions(joueur=-1)
 
+    def _chronometre(self, actif: bool):
+        """
+        Utilise les versions chronométrées des fonctions de la recherche (si 'actif' vaut True) ou les méthodes liées
+        du plateau, jusqu'au prochain changement.
+
+            Paramètre :
+                actif (bool) : Indique si les appels sont chronométrés.
+        """
+        self._chronometre_actif = actif
+        (self._coups_possibles, self._remplit_coups, self._remplit_deplacements, self._make_move, self._unmake_move,
+         self._etat, self._evaluation) = self._fonctions_chronometrees if actif else self._fonctions
+
+    def _cle(self, maximizing_joueur: bool):
+        """
+        Retourne la clé de Zobrist de la position actuelle, le joueur devant jouer étant celui indiqué par
+        'maximizing_joueur' (qui peut différer de 'self.plateau.trait' selon l'appelant).
+
+            Paramètre :
+                maximizing_joueur (bool) : Indique si le joueur devant jouer est le joueur blanc.
+
+            Retourne :
+                int : La clé de la position.
+        """
+        if (self.plateau.trait == 1) == maximizing_joueur:
+            return self.plateau.cle
+        return self.plateau.cle ^ self.plateau.tables.zobrist_trait
+
+    def _copie_coups(self, coups: list, tampon: list):
+        """
+        Écrit les codes entiers d'une liste de coups (coups de la racine ou coups triés par l'ordonnanceur) au début
+        d'un tampon et retourne leur nombre.
+
+            Paramètres :
+                coups (list) : La liste des coups (case_origine, case_destination).
+                tampon (list) : Le tampon à remplir.
+
+            Retourne :
+                int : Le nombre de codes écrits au début du tampon.
+        """
+        codes_coups = self.plateau.tables.codes_coups
+        for i, coup in enumerate(coups):
+            tampon[i] = codes_coups[coup]
+        return len(coups)
+
+    def _enregistre_variante(self, ply: int, code: int):
+        """
+        Écrit dans le tampon de variante du ply le coup donné suivi de la variante du ply suivant, sans allouer de
+        liste (les tampons de 'self.variantes' sont préalloués et seule leur longueur change).
+
+            Paramètres :
+                ply (int) : La distance du nœud à la racine.
+                code (int) : Le code entier du meilleur coup du nœud.
+        """
+        variante = self.variantes[ply]
+        longueur = self.longueurs_variantes[ply + 1]
+        variante[0] = code
+        variante[1:longueur + 1] = self.variantes[ply + 1][:longueur]
+        self.longueurs_variantes[ply] = longueur + 1
+
+    @staticmethod
+    def _score_table(score: int, ply: int):
+        """
+        Retourne le score enregistré dans la table de transposition pour le score d'un nœud. Un score de gain de la base
+        de finales (valeur absolue au moins 'SEUIL_GAIN') compte la distance depuis la racine de la recherche : il est
+        converti en distance depuis le nœud, qui ne dépend ni du ply ni de la racine.
+
+            Paramètres :
+                score (int) : Le score du nœud, relatif à la racine.
+                ply (int) : Le nombre de demi-coups depuis la racine.
+
+            Retourne :
+                int : Le score relatif au nœud.
+        """
+        if score >= SEUIL_GAIN:
+            return score + ply
+        if score <= -SEUIL_GAIN:
+            return score - ply
+        return score
+
+    @staticmethod
+    def _score_recherche(score: int, ply: int):
+        """
+        Retourne le score d'un nœud à partir du score enregistré dans la table de transposition (inverse de
+        '_score_table(...)').
+
+            Paramètres :
+                score (int) : Le score de la table, relatif au nœud.
+                ply (int) : Le nombre de demi-coups depuis la racine.
+
+            Retourne :
+                int : Le score relatif à la racine.
+        """
+        if score >= SEUIL_GAIN:
+            return score - ply
+        if score <= -SEUIL_GAIN:
+            return score + ply
+        return score
+
+    def _quiescence(self, maximizing_joueur: bool, alpha: int, beta: int, ply: int | None = 0):
+        """
+        Recherche de quiescence : prolonge la recherche au-delà de la profondeur maximale en ne testant que les prises,
+        pour ne pas évaluer une position au milieu d'un échange de pions. Aucune prise n'étant obligatoire, le joueur
+        peut toujours refuser de prendre : l'évaluation de la position ('stand pat') est donc une borne de la valeur du
+        nœud, qui provoque une coupure si elle sort de la fenêtre [alpha, beta]. La recherche s'arrête aussi lorsque
+        'noeuds_quiescence_max' nœuds ont été explorés. Si une base de finales est utilisée, une partie terminée vaut
+        ±('SCORE_GAIN' - ply) comme dans '_evaluate(...)'.
+
+            Paramètres :
+                maximizing_joueur (bool) : Indique si le joueur qui doit jouer actuellement est le joueur blanc.
+                alpha (int) : La meilleure valeur que le maximizing_joueur peut actuellement garantir.
+                beta (int) : La meilleure valeur que le minimizing_joueur peut actuellement garantir.
+                ply (int) : Le nombre de demi-coups depuis la racine.
+
+            Retourne :
+                int : La valeur de la feuille.
+        """
+        statistiques = self.statistiques
+        if statistiques is not None:
+            if ply > statistiques.profondeur_max:
+                statistiques.profondeur_max = ply
+            if (not self.noeuds & statistiques.masque) is not self._chronometre_actif:
+                self._chronometre(actif=not self._chronometre_actif)
+            appels = statistiques.appels
+            appels["etat"] += 1
+        resultat = self._etat()
+        if resultat is not None and self.base_finales is not None:
+            return resultat * (SCORE_GAIN - ply)
+        if statistiques is not None:
+            appels["evaluate_node"] += 1
+        stand_pat = self._evaluation()
+        if resultat is not None or self.noeuds_quiescence >= self.noeuds_quiescence_max:
+            return stand_pat
+        if maximizing_joueur:
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+        else:
+            if stand_pat <= alpha:
+                return stand_pat
+            beta = min(beta, stand_pat)
+        best_value = stand_pat
+        if ply >= len(self.tampons):
+            self.tampons.append([0] * self.plateau.tables.coups_max)
+        tampon = self.tampons[ply]
+        nombre_coups = self._remplit_coups(joueur=1 if maximizing_joueur else -1, tampon=tampon, prises_seules=True)
+        if statistiques is not None:
+            appels["generation"] += 1
+        for i in range(nombre_coups):
+            if statistiques is not None:
+                appels["make_move"] += 1
+                appels["unmake_move"] += 1
+            self.noeuds += 1
+            self.noeuds_quiescence += 1
+            enregistrement = self._make_move(code=tampon[i])
+            value = self._quiescence(maximizing_joueur=not maximizing_joueur, alpha=alpha, beta=beta, ply=ply + 1)
+            self._unmake_move(enregistrement=enregistrement)
+            if maximizing_joueur:
+                best_value = max(best_value, value)
+                alpha = max(alpha, best_value)
+            else:
+                best_value = min(best_value, value)
+                beta = min(beta, best_value)
+            if beta <= alpha:
+                break
+        return best_value
+
     def _evaluate(self, profondeur: int, maximizing_joueur: bool, alpha: int = -math.inf, beta: int = math.inf):
         """
         Fonction implémentant l'algorithme AlphaBeta récursivement avec du backtracking. Son exécution est associée à un
         arbre avec comme nœuds un état du plateau en fonction des coups possible de chaque joueur. La valeur de ses
         feuilles est renvoyée par la fonction d'évaluation 'evaluate_node()'.
+        Si une base de finales est utilisée, la valeur exacte des positions qu'elle contient (sauf la racine) est
+        retournée sans recherche, et une partie terminée vaut ±('SCORE_GAIN' - ply) (0 pour une partie nulle), à la
+        même échelle que les scores de la base. La meilleure suite de coups trouvée depuis le nœud est conservée dans
+        'self.variantes'. Si une table de transposition est utilisée, les positions déjà recherchées à une profondeur
+        suffisante ne sont pas recherchées à nouveau (sauf la racine), et le meilleur coup enregistré est testé en
+        premier. Les scores de gain de la base de finales, qui dépendent de la distance depuis la racine, sont
+        enregistrés dans la table relativement au nœud (voir '_score_table(...)') pour rester valables à un autre ply
+        et d'une recherche à l'autre. Si un ordonnanceur est utilisé, les coups sont triés par 'self.ordonnanceur'
+        avant d'être testés, sinon ils sont générés par étapes : le coup de la table et les prises sont écrits et testés
+        d'abord ('Board.remplit_coups(...)'), et les déplacements ne sont écrits à leur suite
+        ('Board.remplit_deplacements(...)') que si aucun de ces coups n'a provoqué de coupure. Les coups sont écrits
+        sous forme de codes entiers dans le tampon préalloué du ply ('self.tampons'), ce qui évite d'allouer une liste
+        de coups à chaque nœud. 'self.limite_atteinte' est mis à True à chaque feuille évaluée à la profondeur maximale
+        et à chaque valeur retournée depuis la table de transposition. Si des statistiques sont remplies, les appels du
+        nœud sont comptés et, pour un nœud sur 'statistiques.periode', chronométrés jusqu'au nœud suivant.
 
             Paramètre :
                 profondeur (int) : La hauteur du graphe d'exécution de la fonction, c'est-à-dire le nombre de coups
@@ -52,36 +313,252 @@ class AlphaBeta:
             Retourne :
                 int : La valeur du plateau calculé avec l'algorithme AlphaBeta.
         """
-        if profondeur == 0 or self.plateau.etat() is not None:
-            return self.evaluate_node()
-        if maximizing_joueur:
-            best_value = -math.inf
-            for coup in self.plateau.get_liste_coups_possible(joueur=1):
-                self.plateau.joue(coup[0], coup[1])
-                value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=False, alpha=alpha, beta=beta)
-                self.plateau.joue(coup[1], coup[0], True)
-                best_value = max(best_value, value)
-                alpha = max(alpha, best_value)
-                if beta <= alpha:
-                    break
-            return best_value
+        self.noeuds += 1
+        if self.limite_temps is not None and not self.noeuds & 1023 and perf_counter() > self.limite_temps:
+            raise TempsEcoule()
+        ply = self.profondeur - profondeur
+        self.longueurs_variantes[ply] = 0
+        statistiques = self.statistiques
+        if statistiques is not None:
+            if ply > statistiques.profondeur_max:
+                statistiques.profondeur_max = ply
+            if (not self.noeuds & statistiques.masque) is not self._chronometre_actif:
+                self._chronometre(actif=not self._chronometre_actif)
+            appels = statistiques.appels
+        base_finales = self.base_finales
+        resultat = self._etat()
+        if resultat is not None:
+            if base_finales is not None:
+                # Même échelle que les scores de la base : les gains les plus rapides sont préférés.
+                return resultat * (SCORE_GAIN - ply)
+            if statistiques is not None:
+                appels["evaluate_node"] += 1
+            return self._evaluation()
+        if (ply > 0 and base_finales is not None
+                and self.plateau.nombre_pions[1] + self.plateau.nombre_pions[-1] <= base_finales.pions_max):
+            score = base_finales.score(plateau=self.plateau, joueur=1 if maximizing_joueur else -1, ply=ply)
+            if score is not None:
+                self.succes_finales += 1
+                return score
+        if profondeur == 0:
+            self.limite_atteinte = True
+            if self.quiescence:
+                return self._quiescence(maximizing_joueur=maximizing_joueur, alpha=alpha, beta=beta, ply=ply)
+            if statistiques is not None:
+                appels["evaluate_node"] += 1
+            return self._evaluation()
+
+        joueur = 1 if maximizing_joueur else -1
+        coup_table = None
+        table = self.table
+        if table is not None:
+            cle = self._cle(maximizing_joueur=maximizing_joueur)
+            entree = table.sonde(cle=cle)
+            if entree is not None:
+                profondeur_entree, borne, score, coup_table = entree
+                if profondeur_entree >= profondeur and ply > 0:
+                    score = self._score_recherche(score=score, ply=ply)
+                    if borne == EXACTE:
+                        self.limite_atteinte = True
+                        return score
+                    elif borne == INFERIEURE:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+                    if beta <= alpha:
+                        self.limite_atteinte = True
+                        return score
+        tampon = self.tampons[ply]
+        deplacements_restants = False
+        if ply == 0 and self.coups_racine is not None:
+            # Les coups de la racine donnés par l'appelant sont testés dans l'ordre donné.
+            nombre_coups = self._copie_coups(coups=self.coups_racine, tampon=tampon)
+        elif self.ordonnanceur is not None:
+            if coup_table is not None:
+                coordonnees = self.plateau.tables.coordonnees
+                coup_table = (coordonnees[coup_table[0]], coordonnees[coup_table[1]])
+            coups = self.ordonnanceur.ordonne(coups=self._coups_possibles(joueur=joueur), ply=ply,
+                                              coup_table=coup_table)
+            nombre_coups = self._copie_coups(coups=coups, tampon=tampon)
         else:
-            best_value = math.inf
-            for coup in self.plateau.get_liste_coups_possible(joueur=-1):
-                self.plateau.joue(coup[0], coup[1])
-                value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=False, alpha=alpha, beta=beta)
-                self.plateau.joue(coup[1], coup[0], True)
-                best_value = min(best_value, value)
-                alpha = min(alpha, best_value)
-                if beta <= alpha:
-                    break
-            return best_value
+            # Génération par étapes : le coup de la table et les prises d'abord, les déplacements seulement si aucune
+            # prise ne provoque de coupure.
+            nombre_coups = self._remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=coup_table,
+                                               prises_seules=True)
+            deplacements_restants = True
+        if statistiques is not None and not (ply == 0 and self.coups_racine is not None):
+            appels["generation"] += 1
+        coups_codes = self.plateau.tables.coups_codes
+        alpha_initial, beta_initial = alpha, beta
 
-    def evaluate(self):
+        best_code = None
+        best_value = -math.inf if maximizing_joueur else math.inf
+        coupure = False
+        debut = 0
+        while True:
+            if maximizing_joueur:
+                for i in range(debut, nombre_coups):
+                    code = tampon[i]
+                    enregistrement = self._make_move(code=code)
+                    if self.pvs and i > 0:
+                        self.recherches_nulles += 1
+                        value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=False, alpha=alpha,
+                                               beta=alpha + 1)
+                        if alpha < value < beta:
+                            self.re_recherches_pvs += 1
+                            value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=False, alpha=value,
+                                                   beta=beta)
+                    else:
+                        value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=False, alpha=alpha,
+                                               beta=beta)
+                    self._unmake_move(enregistrement=enregistrement)
+                    if value > best_value:
+                        best_value = value
+                        best_code = code
+                        self._enregistre_variante(ply=ply, code=code)
+                    alpha = max(alpha, best_value)
+                    if beta <= alpha:
+                        coupure = True
+                        break
+            else:
+                for i in range(debut, nombre_coups):
+                    code = tampon[i]
+                    enregistrement = self._make_move(code=code)
+                    if self.pvs and i > 0:
+                        self.recherches_nulles += 1
+                        value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=True, alpha=beta - 1,
+                                               beta=beta)
+                        if alpha < value < beta:
+                            self.re_recherches_pvs += 1
+                            value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=True, alpha=alpha,
+                                                   beta=value)
+                    else:
+                        value = self._evaluate(profondeur=profondeur-1, maximizing_joueur=True, alpha=alpha,
+                                               beta=beta)
+                    self._unmake_move(enregistrement=enregistrement)
+                    if value < best_value:
+                        best_value = value
+                        best_code = code
+                        self._enregistre_variante(ply=ply, code=code)
+                    beta = min(beta, best_value)
+                    if beta <= alpha:
+                        coupure = True
+                        break
+            if coupure or not deplacements_restants:
+                break
+            # Le premier code est le coup de la table s'il était possible (sinon une prise, qui n'est jamais un
+            # déplacement) : il n'est pas écrit une seconde fois.
+            deplacements_restants = False
+            debut = nombre_coups
+            nombre_coups = self._remplit_deplacements(joueur=joueur, tampon=tampon, debut=debut,
+                                                      exclu=tampon[0] if coup_table is not None and debut else None)
+            if statistiques is not None:
+                appels["generation"] += 1
+
+        if statistiques is not None:
+            essais = i + 1 if coupure else nombre_coups
+            appels["make_move"] += essais
+            appels["unmake_move"] += essais
+        if coupure:
+            self.coupures += 1
+            if i == 0:
+                self.coupures_premier_coup += 1
+            if statistiques is not None:
+                statistiques.coupure(indice=i)
+            if self.ordonnanceur is not None:
+                self.ordonnanceur.enregistre_coupure(coup=coups_codes[best_code], ply=ply, profondeur=profondeur)
+        if table is not None:
+            if best_value <= alpha_initial:
+                borne = SUPERIEURE
+            elif best_value >= beta_initial:
+                borne = INFERIEURE
+            else:
+                borne = EXACTE
+            table.enregistre(cle=cle, profondeur=profondeur, borne=borne,
+                             score=self._score_table(score=best_value, ply=ply),
+                             coup=(best_code >> BITS_INDICE, best_code & MASQUE_INDICE))
+        return best_value
+
+    def evaluate(self, alpha: int = -math.inf, beta: int = math.inf):
         """
         Initialise l'appel de la fonction '_evaluate(...)' avec les paramètres correspondants et retourne sa valeur.
 
+            Paramètres :
+                alpha (int) : La borne inférieure de la fenêtre de recherche.
+                beta (int) : La borne supérieure de la fenêtre de recherche.
+
+            Retourne :
+                int : La valeur du plateau retourné par '_evaluate(...)'.
+        """
+        if self.statistiques is None:
+            return self._evaluate(profondeur=self.profondeur,
+                                  maximizing_joueur=(lambda x: x*1 == 1)(self.joueur_actuel), alpha=alpha, beta=beta)
+        noeuds_avant = self.noeuds
+        noeuds_quiescence_avant = self.noeuds_quiescence
+        debut = perf_counter()
+        try:
+            return self._evaluate(profondeur=self.profondeur,
+                                  maximizing_joueur=(lambda x: x*1 == 1)(self.joueur_actuel), alpha=alpha, beta=beta)
+        finally:
+            self.statistiques.noeuds += self.noeuds - noeuds_avant
+            # Chaque nœud de '_evaluate(...)' appelle 'etat()' une fois (ceux de la quiescence sont comptés par
+            # '_quiescence(...)').
+            self.statistiques.appels["etat"] += ((self.noeuds - noeuds_avant)
+                                                 - (self.noeuds_quiescence - noeuds_quiescence_avant))
+            self.statistiques.temps_total += perf_counter() - debut
+
+    def evaluate_aspiration(self, score_estime: int, fenetre: int):
+        """
+        Retourne la valeur du plateau en recherchant d'abord dans la fenêtre d'aspiration
+        [score_estime - fenetre, score_estime + fenetre] (par exemple autour de la valeur trouvée à la profondeur
+        précédente). Si la valeur sort de la fenêtre, la recherche est refaite en élargissant la fenêtre du côté de
+        l'échec, la largeur de l'élargissement doublant à chaque échec.
+
+            Paramètres :
+                score_estime (int) : La valeur estimée du plateau.
+                fenetre (int) : La demi-largeur initiale de la fenêtre d'aspiration.
+
             Retourne :
                 int : La valeur du plateau retourné par '_evaluate(...)'.
         """
-        return self._evaluate(profondeur=self.profondeur, maximizing_joueur=(lambda x: x*1 == 1)(self.joueur_actuel))
+        alpha, beta = score_estime - fenetre, score_estime + fenetre
+        self.recherches_aspiration += 1
+        while True:
+            value = self.evaluate(alpha=alpha, beta=beta)
+            if value <= alpha:
+                fenetre *= 2
+                alpha = value - fenetre
+            elif value >= beta:
+                fenetre *= 2
+                beta = value + fenetre
+            else:
+                return value
+            self.re_recherches_aspiration += 1
+
+    def recherche_racine(self, coups: list | None = None, score_estime: int | None = None,
+                         fenetre: int | None = None):
+        """
+        Recherche la position de la racine en une seule fois : les bornes alpha et bêta trouvées avec les premiers
+        coups de la racine élaguent la recherche des coups suivants. Si 'score_estime' est donné, la recherche utilise
+        une fenêtre d'aspiration (voir 'evaluate_aspiration(...)').
+
+            Paramètres :
+                coups (list | None) : Les coups de la racine à rechercher, dans l'ordre où ils sont testés, ou None pour
+                                      tous les coups possibles triés comme ceux des autres nœuds.
+                score_estime (int | None) : La valeur estimée de la racine, ou None pour une fenêtre complète.
+                fenetre (int | None) : La demi-largeur initiale de la fenêtre d'aspiration.
+
+            Retourne :
+                tuple : Le meilleur coup, sa valeur et la variante principale (liste des coups successifs).
+        """
+        self.coups_racine = coups
+        try:
+            if score_estime is None:
+                score = self.evaluate()
+            else:
+                score = self.evaluate_aspiration(score_estime=score_estime, fenetre=fenetre)
+        finally:
+            self.coups_racine = None
+        coups_codes = self.plateau.tables.coups_codes
+        variante = [coups_codes[code] for code in self.variantes[0][:self.longueurs_variantes[0]]]
+        return (variante[0] if variante else None), score, variante
@@ -0,0 +1,140 @@
+import numpy as np
+
+from src.game_engine.board import Board
+from src.game_engine.encodage import encode_plateaux
+
+
+# Poids des critères de l'évaluation, dans l'ordre des colonnes retournées par 'criteres_lot(...)'.
+CRITERES = ("materiel", "avancement", "centre", "mobilite")
+POIDS = np.array([100, 2, 5, 1], dtype=np.int64)
+
+
+def bornes_centre(taille: int):
+    """
+    Retourne les bornes des lignes et colonnes du centre du plateau, c'est-à-dire des cases (x, y) avec
+    debut <= x < fin et debut <= y < fin.
+
+        Paramètre :
+            taille (int) : La taille du plateau.
+
+        Retourne :
+            tuple : Le couple (debut, fin).
+    """
+    return taille // 4, taille - taille // 4
+
+
+def criteres_plateau(plateau: Board):
+    """
+    Implémentation de référence (un plateau à la fois, à partir des cases et des coups possibles du plateau) des
+    critères de l'évaluation, chacun étant la différence entre la valeur du joueur blanc et celle du joueur noir :
+        * materiel : le nombre de pions
+        * avancement : la somme du nombre de lignes parcourues par chaque pion depuis le bord de départ
+        * centre : le nombre de pions au centre du plateau
+        * mobilite : le nombre de coups possibles
+
+        Paramètre :
+            plateau (Board) : Le plateau à évaluer.
+
+        Retourne :
+            list : La liste des valeurs des critères, dans l'ordre de 'CRITERES'.
+    """
+    taille = plateau.taille
+    debut, fin = bornes_centre(taille=taille)
+    criteres = [0, 0, 0, 0]
+    for (x, y), valeur in plateau.get_cases().items():
+        if valeur == 0:
+            continue
+        criteres[0] += valeur
+        criteres[1] += valeur * (taille - 1 - x if valeur == 1 else x)
+        if debut <= x < fin and debut <= y < fin:
+            criteres[2] += valeur
+    criteres[3] = (len(plateau.get_liste_coups_possible(joueur=1))
+                   - len(plateau.get_liste_coups_possible(joueur=-1)))
+    return criteres
+
+
+def evalue_plateau(plateau: Board):
+    """
+    Implémentation de référence de l'évaluation d'un plateau : la somme pondérée par 'POIDS' de ses critères.
+
+        Paramètre :
+            plateau (Board) : Le plateau à évaluer.
+
+        Retourne :
+            int : La valeur du plateau (positive si le joueur blanc est avantagé).
+    """
+    return sum(int(poids) * critere for poids, critere in zip(POIDS, criteres_plateau(plateau=plateau)))
+
+
+def _nombre_coups(pions: np.ndarray, adverses: np.ndarray, vides: np.ndarray, sens: int):
+    """
+    Retourne le nombre de coups possibles d'un joueur sur chaque plateau d'un lot.
+
+        Paramètres :
+            pions (np.ndarray) : Le tableau booléen (N, taille, taille) des pions du joueur.
+            adverses (np.ndarray) : Le tableau booléen (N, taille, taille) des pions adverses.
+            vides (np.ndarray) : Le tableau booléen (N, taille, taille) des cases vides.
+            sens (int) : Le sens de déplacement des pions, -1 pour les blancs (vers la ligne 0) et 1 pour les noirs.
+
+        Retourne :
+            np.ndarray : Le tableau (N,) du nombre de coups de chaque plateau.
+    """
+    if sens == 1:  # retourne les lignes pour que les pions se déplacent toujours vers la ligne 0
+        pions, adverses, vides = pions[:, ::-1], adverses[:, ::-1], vides[:, ::-1]
+    total = np.zeros(len(pions), dtype=np.int64)
+    total += (pions[:, 1:, 1:] & vides[:, :-1, :-1]).sum(axis=(1, 2))
+    total += (pions[:, 1:, :-1] & vides[:, :-1, 1:]).sum(axis=(1, 2))
+    total += (pions[:, 2:, 2:] & adverses[:, 1:-1, 1:-1] & vides[:, :-2, :-2]).sum(axis=(1, 2))
+    total += (pions[:, 2:, :-2] & adverses[:, 1:-1, 1:-1] & vides[:, :-2, 2:]).sum(axis=(1, 2))
+    return total
+
+
+def criteres_lot(cases: np.ndarray):
+    """
+    Calcule les critères de l'évaluation (voir 'criteres_plateau(...)') pour tout un lot de plateaux à la fois.
+
+        Paramètre :
+            cases (np.ndarray) : Le tableau int8 (N, taille, taille) des cases des plateaux (voir 'encode_plateaux').
+
+        Retourne :
+            np.ndarray : Le tableau int64 (N, 4) des critères de chaque plateau, dans l'ordre de 'CRITERES'.
+    """
+    taille = cases.shape[1]
+    debut, fin = bornes_centre(taille=taille)
+    blancs = cases == 1
+    noirs = cases == -1
+    vides = cases == 0
+    lignes = np.arange(taille, dtype=np.int64)
+    criteres = np.empty((len(cases), 4), dtype=np.int64)
+    criteres[:, 0] = cases.sum(axis=(1, 2), dtype=np.int64)
+    criteres[:, 1] = (blancs.sum(axis=2) @ (taille - 1 - lignes)) - (noirs.sum(axis=2) @ lignes)
+    criteres[:, 2] = cases[:, debut:fin, debut:fin].sum(axis=(1, 2), dtype=np.int64)
+    criteres[:, 3] = (_nombre_coups(pions=blancs, adverses=noirs, vides=vides, sens=-1)
+                      - _nombre_coups(pions=noirs, adverses=blancs, vides=vides, sens=1))
+    return criteres
+
+
+def evalue_lot(cases: np.ndarray):
+    """
+    Évalue tout un lot de plateaux à la fois, avec des résultats identiques à 'evalue_plateau(...)'.
+
+        Paramètre :
+            cases (np.ndarray) : Le tableau int8 (N, taille, taille) des cases des plateaux (voir 'encode_plateaux').
+
+        Retourne :
+            np.ndarray : Le tableau int64 (N,) des valeurs des plateaux.
+    """
+    return criteres_lot(cases=cases) @ POIDS
+
+
+def evalue_plateaux(plateaux: list):
+    """
+    Encode puis évalue un lot de plateaux de même taille.
+
+        Paramètre :
+            plateaux (list) : La liste des plateaux à évaluer.
+
+        Retourne :
+            np.ndarray : Le tableau int64 (N,) des valeurs des plateaux.
+    """
+    return evalue_lot(cases=encode_plateaux(plateaux=plateaux))
@@ -0,0 +1,344 @@
+import mmap
+import os
+import struct
+from array import array
+from itertools import combinations
+from math import comb
+
+from src.game_engine.board import Board, TABLES_PLATEAU, decale
+
+
+# Un fichier de base de finales commence par un en-tête (signature, version, taille du plateau, nombre maximal de
+# pions) suivi d'une valeur signée d'un octet par position, les positions étant rangées par tranches (nombre de pions
+# blancs, nombre de pions noirs) dans l'ordre de 'IndexFinales.tranches'.
+SIGNATURE = b"DAMESFIN"
+VERSION = 1
+FORMAT_ENTETE = struct.Struct("<8sIII")
+
+# Valeur d'une position du point de vue du joueur devant jouer : 0 pour une partie nulle, d + 1 si le joueur gagne en
+# d demi-coups et -(d + 1) s'il perd en d demi-coups (d = 0 pour une partie terminée).
+NON_CALCULEE = -128
+SCORE_GAIN = 1000
+# Les scores de valeur absolue au moins 'SEUIL_GAIN' sont des gains ou des pertes trouvés dans la base, dont la valeur
+# dépend de la distance depuis la racine de la recherche (l'évaluation heuristique doit rester en dessous).
+SEUIL_GAIN = SCORE_GAIN // 2
+
+
+class IndexFinales:
+    """
+    Classe implémentant le hachage parfait des positions d'une base de finales : chaque position d'au plus
+    'pions_max' pions (au moins un de chaque couleur) sur les cases jouables du plateau, avec le joueur devant jouer,
+    correspond à un unique indice entre 0 et 'nombre_positions' - 1. Les positions sont rangées par tranches (nombre de
+    pions blancs, nombre de pions noirs) ; dans une tranche, l'indice est calculé à partir du rang de l'ensemble des
+    cases des pions blancs parmi les cases jouables et du rang de l'ensemble des cases des pions noirs parmi les cases
+    restantes (système combinatoire de numération).
+
+        Attributs :
+            taille (int) : La taille du plateau.
+            pions_max (int) : Le nombre maximal de pions des positions.
+            cases_jouables (list) : Les indices des cases jouables (cases noires, sur lesquelles sont les pions).
+            tranches (list) : Les couples (nombre de pions blancs, nombre de pions noirs) dans l'ordre du fichier.
+            debuts (dict) : Pour chaque tranche, l'indice de sa première position.
+            nombre_positions (int) : Le nombre total de positions.
+
+        Interface :
+            indice(...) : Retourne l'indice d'une position, ou None si elle n'est pas dans la base.
+    """
+
+    def __init__(self, taille: int, pions_max: int):
+        assert pions_max >= 2, "Une finale contient au moins un pion de chaque joueur !"
+        self.taille = taille
+        self.pions_max = pions_max
+        self.cases_jouables = [x * taille + y for x in range(taille) for y in range(taille) if (x + y) % 2]
+        self.masque_jouable = sum(1 << i for i in self.cases_jouables)
+        nombre_cases = len(self.cases_jouables)
+        self._rangs = [0] * (taille * taille)
+        for rang, i in enumerate(self.cases_jouables):
+            self._rangs[i] = rang
+        self._combinaisons = [[comb(n, r) for r in range(pions_max + 1)] for n in range(nombre_cases + 1)]
+        self.tranches = [(nombre_blancs, total - nombre_blancs)
+                         for total in range(2, pions_max + 1) for nombre_blancs in range(1, total)]
+        self.debuts = {}
+        self.nombre_positions = 0
+        for nombre_blancs, nombre_noirs in self.tranches:
+            self.debuts[(nombre_blancs, nombre_noirs)] = self.nombre_positions
+            self.nombre_positions += 2 * comb(nombre_cases, nombre_blancs) * comb(nombre_cases - nombre_blancs,
+                                                                                  nombre_noirs)
+
+    def indice(self, blancs: int, noirs: int, joueur: int):
+        """
+        Retourne l'indice d'une position.
+
+            Paramètres :
+                blancs (int) : Le bitboard des pions blancs.
+                noirs (int) : Le bitboard des pions noirs.
+                joueur (int) : Le joueur devant jouer.
+
+            Retourne :
+                int : L'indice de la position.
+                NoneType : None si la position n'est pas dans la base (trop de pions, joueur sans pion, ou pion sur
+                           une case non jouable).
+        """
+        nombre_blancs = blancs.bit_count()
+        nombre_noirs = noirs.bit_count()
+        if (not nombre_blancs or not nombre_noirs or nombre_blancs + nombre_noirs > self.pions_max
+                or (blancs | noirs) & ~self.masque_jouable):
+            return None
+        rangs = self._rangs
+        combinaisons = self._combinaisons
+        rang_blancs = 0
+        k = 1
+        masque = blancs
+        while masque:
+            bit = masque & -masque
+            masque ^= bit
+            rang_blancs += combinaisons[rangs[bit.bit_length() - 1]][k]
+            k += 1
+        rang_noirs = 0
+        k = 1
+        masque = noirs
+        while masque:
+            bit = masque & -masque
+            masque ^= bit
+            rang_noirs += combinaisons[rangs[bit.bit_length() - 1] - (blancs & (bit - 1)).bit_count()][k]
+            k += 1
+        nombre_restantes = len(self.cases_jouables) - nombre_blancs
+        return (self.debuts[(nombre_blancs, nombre_noirs)]
+                + ((rang_blancs * combinaisons[nombre_restantes][nombre_noirs] + rang_noirs) << 1) + (joueur == -1))
+
+
+def coups_bitboards(taille: int, blancs: int, noirs: int, joueur: int):
+    """
+    Retourne les positions atteintes par les coups possibles d'un joueur, calculées directement sur les bitboards
+    (mêmes coups que 'Board.get_liste_coups_possible(...)').
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            blancs (int) : Le bitboard des pions blancs.
+            noirs (int) : Le bitboard des pions noirs.
+            joueur (int) : Le joueur qui joue.
+
+        Retourne :
+            list : La liste des couples (blancs, noirs) des positions après chaque coup.
+    """
+    tables = TABLES_PLATEAU[taille]
+    pions, adverses = (blancs, noirs) if joueur == 1 else (noirs, blancs)
+    vides = tables.masque_plateau & ~(blancs | noirs)
+    positions = []
+    for decalage, masque_deplacement, masque_prise in zip(tables.decalages[joueur], tables.masques_deplacement[joueur],
+                                                          tables.masques_prise[joueur]):
+        deplacements = pions & masque_deplacement & decale(vides, decalage)
+        while deplacements:
+            bit = deplacements & -deplacements
+            deplacements ^= bit
+            positions.append((pions ^ bit ^ decale(bit, -decalage), adverses))
+        prises = pions & masque_prise & decale(adverses, decalage) & decale(vides, 2 * decalage)
+        while prises:
+            bit = prises & -prises
+            prises ^= bit
+            positions.append((pions ^ bit ^ decale(bit, -2 * decalage), adverses ^ decale(bit, -decalage)))
+    if joueur == 1:
+        return positions
+    return [(blancs_apres, noirs_apres) for noirs_apres, blancs_apres in positions]
+
+
+def resultat_bitboards(taille: int, blancs: int, noirs: int):
+    """
+    Retourne l'état d'une position calculé directement sur les bitboards (même résultat que 'Board.etat()').
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            blancs (int) : Le bitboard des pions blancs.
+            noirs (int) : Le bitboard des pions noirs.
+
+        Retourne :
+            int : 1/-1 si le joueur blanc/noir gagne, 0 en cas d'égalité.
+            NoneType : None si la partie n'est pas terminée.
+    """
+    tables = TABLES_PLATEAU[taille]
+    vides = tables.masque_plateau & ~(blancs | noirs)
+    bloques = {}
+    for joueur, pions, adverses in ((1, blancs, noirs), (-1, noirs, blancs)):
+        bloques[joueur] = True
+        for decalage, masque_deplacement, masque_prise in zip(tables.decalages[joueur],
+                                                              tables.masques_deplacement[joueur],
+                                                              tables.masques_prise[joueur]):
+            if ((pions & masque_deplacement & decale(vides, decalage))
+                    or (pions & masque_prise & decale(adverses, decalage) & decale(vides, 2 * decalage))):
+                bloques[joueur] = False
+                break
+    if bloques[1] and bloques[-1]:
+        return 0
+    elif not blancs or bloques[1]:
+        return -1
+    elif not noirs or bloques[-1]:
+        return 1
+    return None
+
+
+def _valeur(taille: int, blancs: int, noirs: int, joueur: int, index: IndexFinales, valeurs: array):
+    """
+    Calcule la valeur d'une position (du point de vue de 'joueur') à partir des valeurs déjà calculées des positions
+    atteintes par ses coups.
+    """
+    resultat = resultat_bitboards(taille=taille, blancs=blancs, noirs=noirs)
+    if resultat is not None:
+        return 0 if resultat == 0 else (1 if resultat == joueur else -1)
+    gain = None
+    nulle = False
+    perte = 0
+    for blancs_apres, noirs_apres in coups_bitboards(taille=taille, blancs=blancs, noirs=noirs, joueur=joueur):
+        resultat = resultat_bitboards(taille=taille, blancs=blancs_apres, noirs=noirs_apres)
+        if resultat is not None:
+            valeur = 0 if resultat == 0 else (1 if resultat == -joueur else -1)
+        else:
+            valeur = valeurs[index.indice(blancs=blancs_apres, noirs=noirs_apres, joueur=-joueur)]
+            assert valeur != NON_CALCULEE, "Position suivante non calculée !"
+        if valeur < 0:
+            if gain is None or -valeur < gain:
+                gain = -valeur
+        elif valeur == 0:
+            nulle = True
+        elif valeur > perte:
+            perte = valeur
+    if gain is not None:
+        return gain + 1
+    if nulle:
+        return 0
+    return -(perte + 1)
+
+
+def genere_base_finales(taille: int, pions_max: int, chemin: str):
+    """
+    Génère par analyse rétrograde la base de finales de toutes les positions d'au plus 'pions_max' pions et l'écrit
+    dans un fichier. Les pions n'avançant jamais en arrière, chaque coup augmente strictement la somme des avancées des
+    pions et le graphe des positions est sans cycle : les tranches sont calculées par nombre de pions croissant (une
+    prise mène à une tranche déjà calculée), et dans chaque tranche les positions sont calculées par avancée
+    décroissante, de sorte que les positions atteintes par leurs coups sont toujours déjà calculées.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            pions_max (int) : Le nombre maximal de pions des positions.
+            chemin (str) : Le chemin du fichier créé.
+
+        Retourne :
+            IndexFinales : L'index de la base générée.
+    """
+    assert pions_max * (taille - 1) < 126, "Distance de gain trop grande pour être stockée sur un octet !"
+    index = IndexFinales(taille=taille, pions_max=pions_max)
+    valeurs = array("b", [NON_CALCULEE]) * index.nombre_positions
+    for nombre_blancs, nombre_noirs in index.tranches:
+        groupes = []
+        for joueur, nombre in ((1, nombre_blancs), (-1, nombre_noirs)):
+            groupe = {}
+            for cases in combinations(index.cases_jouables, nombre):
+                avancee = sum(taille - 1 - i // taille if joueur == 1 else i // taille for i in cases)
+                groupe.setdefault(avancee, []).append(sum(1 << i for i in cases))
+            groupes.append(groupe)
+        groupe_blancs, groupe_noirs = groupes
+        for avancee in range(max(groupe_blancs) + max(groupe_noirs), -1, -1):
+            for avancee_blancs, liste_blancs in groupe_blancs.items():
+                liste_noirs = groupe_noirs.get(avancee - avancee_blancs)
+                if liste_noirs is None:
+                    continue
+                for blancs in liste_blancs:
+                    for noirs in liste_noirs:
+                        if blancs & noirs:
+                            continue
+                        for joueur in (1, -1):
+                            valeurs[index.indice(blancs=blancs, noirs=noirs, joueur=joueur)] = _valeur(
+                                taille=taille, blancs=blancs, noirs=noirs, joueur=joueur, index=index,
+                                valeurs=valeurs)
+    with open(chemin, "wb") as fichier:
+        fichier.write(FORMAT_ENTETE.pack(SIGNATURE, VERSION, taille, pions_max))
+        fichier.write(valeurs.tobytes())
+    return index
+
+
+class BaseFinales:
+    """
+    Classe permettant de consulter une base de finales générée par 'genere_base_finales(...)'. Le fichier est projeté
+    en mémoire ('mmap') : seules les pages consultées sont lues, et la base peut être partagée entre processus
+    (chaque processus la projette à nouveau lorsqu'elle lui est transmise).
+
+        Attributs :
+            chemin (str) : Le chemin du fichier de la base.
+            taille (int) : La taille du plateau.
+            pions_max (int) : Le nombre maximal de pions des positions de la base.
+            index (IndexFinales) : Le hachage parfait des positions de la base.
+
+        Interface :
+            valeur(...) : Retourne la valeur d'une position du point de vue du joueur devant jouer.
+            score(...) : Retourne le score d'une position utilisable par la recherche AlphaBeta.
+            ferme() : Ferme le fichier de la base.
+    """
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+        self._fichier = open(chemin, "rb")
+        self._memoire = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        signature, version, taille, pions_max = FORMAT_ENTETE.unpack_from(self._memoire, 0)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Fichier de base de finales invalide ou de version différente !")
+        self.taille = taille
+        self.pions_max = pions_max
+        self.index = IndexFinales(taille=taille, pions_max=pions_max)
+        if os.fstat(self._fichier.fileno()).st_size != FORMAT_ENTETE.size + self.index.nombre_positions:
+            raise ValueError("Fichier de base de finales tronqué !")
+        self._valeurs = memoryview(self._memoire)[FORMAT_ENTETE.size:].cast("b")
+
+    def valeur(self, plateau: Board, joueur: int):
+        """
+        Retourne la valeur d'une position du point de vue du joueur devant jouer : 0 pour une partie nulle, d + 1 si
+        le joueur gagne en d demi-coups et -(d + 1) s'il perd en d demi-coups.
+
+            Paramètres :
+                plateau (Board) : Le plateau de la position.
+                joueur (int) : Le joueur devant jouer.
+
+            Retourne :
+                int : La valeur de la position.
+                NoneType : None si la position n'est pas dans la base.
+        """
+        if plateau.taille != self.taille:
+            return None
+        indice = self.index.indice(blancs=plateau.pions[1], noirs=plateau.pions[-1], joueur=joueur)
+        if indice is None:
+            return None
+        return self._valeurs[indice]
+
+    def score(self, plateau: Board, joueur: int, ply: int | None = 0):
+        """
+        Retourne le score d'une position du point de vue du joueur blanc, utilisable par la recherche AlphaBeta :
+        0 pour une partie nulle et ±('SCORE_GAIN' - distance du gain depuis la racine de la recherche) sinon, de
+        sorte que les gains les plus rapides (et les pertes les plus lentes) soient préférés.
+
+            Paramètres :
+                plateau (Board) : Le plateau de la position.
+                joueur (int) : Le joueur devant jouer.
+                ply (int | None) : Le nombre de demi-coups entre la racine de la recherche et la position.
+
+            Retourne :
+                int : Le score de la position.
+                NoneType : None si la position n'est pas dans la base.
+        """
+        valeur = self.valeur(plateau=plateau, joueur=joueur)
+        if not valeur:
+            return valeur
+        if valeur > 0:
+            return joueur * (SCORE_GAIN - ply - (valeur - 1))
+        return -joueur * (SCORE_GAIN - ply - (-valeur - 1))
+
+    def ferme(self):
+        """
+        Ferme le fichier de la base.
+        """
+        self._valeurs.release()
+        self._memoire.close()
+        self._fichier.close()
+
+    def __getstate__(self):
+        return {"chemin": self.chemin}
+
+    def __setstate__(self, etat: dict):
+        self.__init__(chemin=etat["chemin"])
@@ -0,0 +1,282 @@
+import math
+import random
+import sys
+from time import perf_counter
+
+from src.game_engine.board import Board, TABLES_PLATEAU
+
+
+class NoeudMCTS:
+    """
+    Classe modélisant un nœud de l'arbre de recherche MCTS, c'est-à-dire la position atteinte par un coup. Les
+    attributs sont déclarés dans '__slots__' pour limiter la mémoire utilisée par nœud.
+
+        Attributs :
+            coup (tuple | None) : Le coup (case_origine, case_destination) menant au nœud (None pour la racine).
+            joueur (int) : Le joueur ayant joué ce coup.
+            enfants (list) : Les nœuds des coups déjà essayés depuis cette position.
+            coups_restants (list) : Les coups possibles pas encore essayés, dans un ordre aléatoire.
+            visites (int) : Le nombre de simulations passées par le nœud.
+            score (float) : La somme des résultats de ces simulations pour 'joueur' (1 par victoire, 0.5 par nulle).
+    """
+
+    __slots__ = ("coup", "joueur", "enfants", "coups_restants", "visites", "score")
+
+    def __init__(self, coup: tuple | None, joueur: int, coups_restants: list):
+        self.coup = coup
+        self.joueur = joueur
+        self.enfants = []
+        self.coups_restants = coups_restants
+        self.visites = 0
+        self.score = 0.0
+
+
+def simule(taille: int, blancs: int, noirs: int, joueur: int, alea: random.Random):
+    """
+    Joue une partie aléatoire jusqu'à sa fin directement sur les bitboards, sans construire de liste de coups : le
+    coup joué est tiré parmi les bits des bitboards des cases d'origine des coups possibles.
+
+        Paramètres :
+            taille (int) : La taille du plateau.
+            blancs (int) : Le bitboard des pions blancs.
+            noirs (int) : Le bitboard des pions noirs.
+            joueur (int) : Le joueur devant jouer.
+            alea (random.Random) : Le générateur aléatoire utilisé.
+
+        Retourne :
+            int : Le résultat de la partie, 1/-1 si le joueur blanc/noir gagne et 0 en cas d'égalité (même règle que
+                  'Board.etat()').
+    """
+    tables = TABLES_PLATEAU[taille]
+    masque_plateau = tables.masque_plateau
+    # Les blancs se déplacent vers les indices décroissants (décalages -taille - 1 et -taille + 1 à gauche et à
+    # droite), les noirs vers les indices croissants (décalages taille - 1 et taille + 1).
+    g, d = taille + 1, taille - 1
+    blanc_g, blanc_d = tables.masques_deplacement[1]
+    blanc_prise_g, blanc_prise_d = tables.masques_prise[1]
+    noir_g, noir_d = tables.masques_deplacement[-1]
+    noir_prise_g, noir_prise_d = tables.masques_prise[-1]
+    randrange = alea.randrange
+    while True:
+        vides = masque_plateau & ~(blancs | noirs)
+        if joueur == 1:
+            pions, adverses = blancs, noirs
+            deplacements_g = pions & blanc_g & (vides << g)
+            deplacements_d = pions & blanc_d & (vides << d)
+            prises_g = pions & blanc_prise_g & (adverses << g) & (vides << 2 * g)
+            prises_d = pions & blanc_prise_d & (adverses << d) & (vides << 2 * d)
+            adverses_bloques = not ((noirs & noir_g & (vides >> d)) or (noirs & noir_d & (vides >> g))
+                                    or (noirs & noir_prise_g & (blancs >> d) & (vides >> 2 * d))
+                                    or (noirs & noir_prise_d & (blancs >> g) & (vides >> 2 * g)))
+        else:
+            pions, adverses = noirs, blancs
+            deplacements_g = pions & noir_g & (vides >> d)
+            deplacements_d = pions & noir_d & (vides >> g)
+            prises_g = pions & noir_prise_g & (adverses >> d) & (vides >> 2 * d)
+            prises_d = pions & noir_prise_d & (adverses >> g) & (vides >> 2 * g)
+            adverses_bloques = not ((blancs & blanc_g & (vides << g)) or (blancs & blanc_d & (vides << d))
+                                    or (blancs & blanc_prise_g & (noirs << g) & (vides << 2 * g))
+                                    or (blancs & blanc_prise_d & (noirs << d) & (vides << 2 * d)))
+        nombres = (deplacements_g.bit_count(), deplacements_d.bit_count(), prises_g.bit_count(), prises_d.bit_count())
+        total = nombres[0] + nombres[1] + nombres[2] + nombres[3]
+        if not total:
+            return 0 if adverses_bloques else -joueur
+        if adverses_bloques:
+            return joueur
+        r = randrange(total)
+        for k, masque in enumerate((deplacements_g, deplacements_d, prises_g, prises_d)):
+            if r < nombres[k]:
+                break
+            r -= nombres[k]
+        for _ in range(r):
+            masque &= masque - 1
+        bit = masque & -masque
+        decalage = g if k % 2 == 0 else d
+        if joueur == 1:
+            if k < 2:
+                pions ^= bit | (bit >> decalage)
+            else:
+                pions ^= bit | (bit >> 2 * decalage)
+                adverses ^= bit >> decalage
+            blancs, noirs = pions, adverses
+        else:
+            decalage = d if k % 2 == 0 else g
+            if k < 2:
+                pions ^= bit | (bit << decalage)
+            else:
+                pions ^= bit | (bit << 2 * decalage)
+                adverses ^= bit << decalage
+            blancs, noirs = adverses, pions
+        joueur = -joueur
+
+
+class MCTS:
+    """
+    Classe implémentant la recherche arborescente Monte-Carlo avec la formule de sélection UCT. Chaque itération
+    descend l'arbre en choisissant l'enfant maximisant score / visites + constante * sqrt(ln(visites parent) / visites),
+    ajoute un nœud pour un coup pas encore essayé, termine la partie par une simulation aléatoire ('simule(...)') puis
+    remonte son résultat le long du chemin. L'arbre d'une recherche précédente peut être réutilisé comme racine.
+
+        Attributs :
+            plateau (Board) : Le plateau de jeu à évaluer.
+            joueur_actuel (int) : Le joueur qui doit actuellement jouer sur ce plateau.
+            constante_uct (float) : La constante d'exploration de la formule UCT.
+            racine (NoeudMCTS) : La racine de l'arbre de recherche.
+            alea (random.Random) : Le générateur aléatoire utilisé.
+            playouts (int) : Le nombre de simulations effectuées par la recherche.
+
+        Interface :
+            recherche(...) : Effectue des itérations jusqu'à atteindre un nombre de simulations ou un instant limite.
+            statistiques_racine() : Retourne le nombre de visites et le score de chaque coup de la racine.
+            meilleur_coup() : Retourne le coup de la racine le plus visité.
+            enfant(...) : Retourne le nœud d'un coup de la racine (pour réutiliser l'arbre).
+            memoire() : Retourne le nombre de nœuds de l'arbre et la mémoire qu'ils occupent.
+    """
+
+    def __init__(self, plateau: Board, joueur_actuel: int, constante_uct: float = math.sqrt(2),
+                 racine: NoeudMCTS | None = None, alea: random.Random | None = None):
+        self.plateau = plateau
+        self.joueur_actuel = joueur_actuel
+        self.constante_uct = constante_uct
+        self.alea = alea if alea is not None else random.Random(random.getrandbits(64))
+        if racine is None:
+            racine = self._cree_noeud(coup=None, joueur=-joueur_actuel)
+        self.racine = racine
+        self.playouts = 0
+
+    def _cree_noeud(self, coup: tuple | None, joueur: int):
+        """
+        Crée le nœud de la position actuelle du plateau, atteinte par le coup 'coup' du joueur 'joueur'.
+        """
+        if self.plateau.etat() is not None:
+            return NoeudMCTS(coup=coup, joueur=joueur, coups_restants=[])
+        coups = self.plateau.get_liste_coups_possible(joueur=-joueur)
+        self.alea.shuffle(coups)
+        return NoeudMCTS(coup=coup, joueur=joueur, coups_restants=coups)
+
+    def _iteration(self):
+        """
+        Effectue une itération de la recherche (sélection, expansion, simulation et rétropropagation).
+        """
+        plateau = self.plateau
+        constante = self.constante_uct
+        noeud = self.racine
+        chemin = [noeud]
+        enregistrements = []
+        while not noeud.coups_restants and noeud.enfants:
+            log_visites = math.log(noeud.visites)
+            noeud = max(noeud.enfants, key=lambda enfant: enfant.score / enfant.visites
+                        + constante * math.sqrt(log_visites / enfant.visites))
+            enregistrements.append(plateau.make_move_rapide(coup=noeud.coup))
+            chemin.append(noeud)
+        if noeud.coups_restants:
+            coup = noeud.coups_restants.pop()
+            enregistrements.append(plateau.make_move_rapide(coup=coup))
+            enfant = self._cree_noeud(coup=coup, joueur=-noeud.joueur)
+            noeud.enfants.append(enfant)
+            chemin.append(enfant)
+            noeud = enfant
+        resultat = simule(taille=plateau.taille, blancs=plateau.pions[1], noirs=plateau.pions[-1],
+                          joueur=-noeud.joueur, alea=self.alea)
+        for noeud in chemin:
+            noeud.visites += 1
+            if resultat == noeud.joueur:
+                noeud.score += 1.0
+            elif resultat == 0:
+                noeud.score += 0.5
+        for enregistrement in reversed(enregistrements):
+            plateau.unmake_move_rapide(enregistrement=enregistrement)
+        self.playouts += 1
+
+    def recherche(self, playouts: int | None = None, limite_temps: float | None = None):
+        """
+        Effectue des itérations jusqu'à avoir effectué 'playouts' simulations ou jusqu'à l'instant 'limite_temps'
+        (la première limite atteinte arrête la recherche, au moins une itération est effectuée).
+
+            Paramètres :
+                playouts (int | None) : Le nombre de simulations à effectuer, ou None pour ne pas le limiter.
+                limite_temps (float | None) : L'instant ('time.perf_counter()') de fin de la recherche, ou None.
+        """
+        assert playouts is not None or limite_temps is not None, "La recherche doit être limitée !"
+        while True:
+            self._iteration()
+            if playouts is not None and self.playouts >= playouts:
+                break
+            if limite_temps is not None and perf_counter() >= limite_temps:
+                break
+
+    def statistiques_racine(self):
+        """
+        Retourne le nombre de visites et le score de chaque coup essayé depuis la racine.
+
+            Retourne :
+                dict : Le dictionnaire {coup: (visites, score), ...}.
+        """
+        return {enfant.coup: (enfant.visites, enfant.score) for enfant in self.racine.enfants}
+
+    def meilleur_coup(self):
+        """
+        Retourne le coup de la racine le plus visité.
+
+            Retourne :
+                tuple : Le coup (case_origine, case_destination).
+        """
+        return max(self.racine.enfants, key=lambda enfant: enfant.visites).coup
+
+    def enfant(self, coup: tuple):
+        """
+        Retourne le nœud d'un coup essayé depuis la racine.
+
+            Paramètre :
+                coup (tuple) : Le coup (case_origine, case_destination).
+
+            Retourne :
+                NoeudMCTS | None : Le nœud du coup, ou None s'il n'a pas été essayé.
+        """
+        for enfant in self.racine.enfants:
+            if enfant.coup == coup:
+                return enfant
+        return None
+
+    def memoire(self):
+        """
+        Retourne le nombre de nœuds de l'arbre et la mémoire qu'ils occupent (nœud, listes des enfants et des coups
+        restants et tuples des coups).
+
+            Retourne :
+                tuple : Le couple (nombre de nœuds, nombre d'octets).
+        """
+        nombre = 0
+        octets = 0
+        a_parcourir = [self.racine]
+        while a_parcourir:
+            noeud = a_parcourir.pop()
+            nombre += 1
+            octets += (sys.getsizeof(noeud) + sys.getsizeof(noeud.enfants) + sys.getsizeof(noeud.coups_restants)
+                       + sys.getsizeof(noeud.coup))
+            a_parcourir.extend(noeud.enfants)
+        return nombre, octets
+
+
+def recherche_processus(plateau: Board, joueur: int, playouts: int | None, duree_max: float | None,
+                        constante_uct: float, graine: int):
+    """
+    Fonction exécutée par un processus de la réserve : effectue une recherche MCTS indépendante sur sa propre copie
+    du plateau et retourne les statistiques des coups de la racine (parallélisation à la racine).
+
+        Paramètres :
+            plateau (Board) : La copie du plateau reçue par le processus.
+            joueur (int) : Le joueur devant jouer.
+            playouts (int | None) : Le nombre de simulations à effectuer, ou None.
+            duree_max (float | None) : La durée de la recherche en secondes, ou None.
+            constante_uct (float) : La constante d'exploration de la formule UCT.
+            graine (int) : La graine du générateur aléatoire du processus.
+
+        Retourne :
+            tuple : Le dictionnaire {coup: (visites, score), ...}, le nombre de simulations, le nombre de nœuds de
+                    l'arbre et la mémoire qu'ils occupent en octets.
+    """
+    limite_temps = perf_counter() + duree_max if duree_max is not None else None
+    mcts = MCTS(plateau=plateau, joueur_actuel=joueur, constante_uct=constante_uct, alea=random.Random(graine))
+    mcts.recherche(playouts=playouts, limite_temps=limite_temps)
+    return mcts.statistiques_racine(), mcts.playouts, *mcts.memoire()
@@ -1,6 +1,9 @@
 import math
+from time import perf_counter
 
 from src.game_engine.board import Board
+from src.players.bots.algorithms.statistiques import StatistiquesRecherche, fonctions_recherche
+from src.utils import TempsEcoule
 
 
 class MinMax:
@@ -14,16 +17,44 @@ class MinMax:
             plateau (Board) : Le plateau de jeu à évaluer.
             joueur_actuel (int) : Le joueur qui doit actuellement jouer sur ce plateau.
             profondeur (int) : La hauteur du graphe des coups testés (le nombre de coups successifs à tester).
+            limite_temps (float | None) : L'instant ('time.perf_counter()') après lequel la recherche est interrompue
+                                          en levant 'TempsEcoule', ou None pour ne pas limiter le temps.
+            noeuds (int) : Le nombre de nœuds explorés par la recherche.
+            coups_racine (list | None) : Les coups de la racine imposés par 'recherche_racine(...)', ou None.
+            variantes (list) : Pour chaque ply, le tampon préalloué des codes entiers de la meilleure suite de coups
+                               trouvée depuis le nœud en cours de recherche à ce ply (variante principale triangulaire :
+                               celle de la racine est 'variantes[0]').
+            longueurs_variantes (list) : Pour chaque ply, la longueur de la variante écrite dans 'variantes'.
+            statistiques (StatistiquesRecherche | None) : Les statistiques remplies par la recherche, ou None.
+            tampons (list) : Pour chaque ply, le tampon préalloué dans lequel sont écrits les codes entiers des coups
+                             du nœud en cours de recherche à ce ply.
+            limite_atteinte (bool) : True si la recherche a évalué une position non terminale parce que la profondeur
+                                     maximale était atteinte. Si False, l'arbre de jeu a été entièrement exploré.
 
         Interface :
             evaluate_node() : Retourne la valeur heuristique du plateau actuel (fonction d'évaluation).
+            _chronometre(...) : Utilise les fonctions de la recherche chronométrées ou non.
+            _enregistre_variante(...) : Écrit la variante d'un nœud à partir de son meilleur coup.
             _evaluate(...) : Retourne récursivement la valeur d'un plateau en suivant l'algorithme MinMax.
             evaluate(...) : Initialise l'appel de '_evaluate' et retourne sa valeur.
+            recherche_racine(...) : Retourne le meilleur coup de la racine, sa valeur et la variante principale.
     """
-    def __init__(self, plateau: Board, joueur_actuel: int, profondeur: int):
+    def __init__(self, plateau: Board, joueur_actuel: int, profondeur: int, limite_temps: float | None = None,
+                 statistiques: StatistiquesRecherche | None = None):
         self.plateau = plateau
         self.joueur_actuel = joueur_actuel
         self.profondeur = profondeur
+        self.limite_temps = limite_temps
+        self.noeuds = 0
+        self.coups_racine = None
+        self.variantes = [[0] * (profondeur - ply) for ply in range(profondeur + 1)]
+        self.longueurs_variantes = [0] * (profondeur + 1)
+        self.statistiques = statistiques
+        self.tampons = [[0] * plateau.tables.coups_max for _ in range(profondeur + 1)]
+        self.limite_atteinte = False
+        self._fonctions, self._fonctions_chronometrees = fonctions_recherche(
+            plateau=plateau, evaluate_node=self.evaluate_node, statistiques=statistiques)
+        self._chronometre(actif=False)
 
     def evaluate_node(self):
         """
@@ -35,11 +66,42 @@ class MinMax:
         """
         return self.plateau.get_nombre_pions(joueur=1) - self.plateau.get_nombre_pions(joueur=-1)
 
+    def _chronometre(self, actif: bool):
+        """
+        Utilise les versions chronométrées des fonctions de la recherche (si 'actif' vaut True) ou les méthodes liées
+        du plateau, jusqu'au prochain changement.
+
+            Paramètre :
+                actif (bool) : Indique si les appels sont chronométrés.
+        """
+        self._chronometre_actif = actif
+        (_, self._remplit_coups, _, self._make_move, self._unmake_move, self._etat,
+         self._evaluation) = self._fonctions_chronometrees if actif else self._fonctions
+
+    def _enregistre_variante(self, ply: int, code: int):
+        """
+        Écrit dans le tampon de variante du ply le coup donné suivi de la variante du ply suivant, sans allouer de
+        liste (les tampons de 'self.variantes' sont préalloués et seule leur longueur change).
+
+            Paramètres :
+                ply (int) : La distance du nœud à la racine.
+                code (int) : Le code entier du meilleur coup du nœud.
+        """
+        variante = self.variantes[ply]
+        longueur = self.longueurs_variantes[ply + 1]
+        variante[0] = code
+        variante[1:longueur + 1] = self.variantes[ply + 1][:longueur]
+        self.longueurs_variantes[ply] = longueur + 1
+
     def _evaluate(self, profondeur: int, maximizing_joueur: bool):
         """
         Fonction implémentant l'algorithme MinMax récursivement avec du backtracking. Son exécution est associée à un
         arbre avec comme nœuds un état du plateau en fonction des coups possible de chaque joueur. La valeur de ses
-        feuilles est renvoyée par la fonction d'évaluation 'evaluate_node()'.
+        feuilles est renvoyée par la fonction d'évaluation 'evaluate_node()'. La meilleure suite de coups trouvée depuis
+        le nœud est conservée dans 'self.variantes'. Les coups d'un nœud sont écrits sous forme de codes entiers dans
+        le tampon préalloué de son ply ('self.tampons'). 'self.limite_atteinte' est mis à True à chaque feuille non
+        terminale évaluée à la profondeur maximale. Si des statistiques sont remplies, les appels du nœud sont comptés
+        et, pour un nœud sur 'statistiques.periode', chronométrés jusqu'au nœud suivant.
 
             Paramètre :
                 profondeur (int) : La hauteur du graphe d'exécution de la fonction, c'est-à-dire le nombre de coups
@@ -50,23 +112,59 @@ class MinMax:
             Retourne :
                 int : La valeur du plateau calculé avec l'algorithme MinMax.
         """
-        if profondeur == 0 or self.plateau.etat() is not None:
-            return self.evaluate_node()
+        self.noeuds += 1
+        if self.limite_temps is not None and not self.noeuds & 1023 and perf_counter() > self.limite_temps:
+            raise TempsEcoule()
+        ply = self.profondeur - profondeur
+        self.longueurs_variantes[ply] = 0
+        statistiques = self.statistiques
+        if statistiques is not None:
+            if ply > statistiques.profondeur_max:
+                statistiques.profondeur_max = ply
+            if (not self.noeuds & statistiques.masque) is not self._chronometre_actif:
+                self._chronometre(actif=not self._chronometre_actif)
+            appels = statistiques.appels
+        if self._etat() is not None:
+            if statistiques is not None:
+                appels["evaluate_node"] += 1
+            return self._evaluation()
+        if profondeur == 0:
+            self.limite_atteinte = True
+            if statistiques is not None:
+                appels["evaluate_node"] += 1
+            return self._evaluation()
+        tampon = self.tampons[ply]
+        if ply == 0 and self.coups_racine is not None:
+            codes_coups = self.plateau.tables.codes_coups
+            for i, coup in enumerate(self.coups_racine):
+                tampon[i] = codes_coups[coup]
+            nombre_coups = len(self.coups_racine)
+        else:
+            nombre_coups = self._remplit_coups(joueur=1 if maximizing_joueur else -1, tampon=tampon)
+            if statistiques is not None:
+                appels["generation"] += 1
+        if statistiques is not None:
+            appels["make_move"] += nombre_coups
+            appels["unmake_move"] += nombre_coups
         if maximizing_joueur:
             max_valeur = -math.inf
-            for coup in self.plateau.get_liste_coups_possible(joueur=1):
-                self.plateau.joue(coup[0], coup[1])
+            for i in range(nombre_coups):
+                enregistrement = self._make_move(code=tampon[i])
                 ev = self._evaluate(profondeur=profondeur-1, maximizing_joueur=False)
-                self.plateau.joue(coup[1], coup[0], True)
-                max_valeur = max(max_valeur, ev)
+                self._unmake_move(enregistrement=enregistrement)
+                if ev > max_valeur:
+                    max_valeur = ev
+                    self._enregistre_variante(ply=ply, code=tampon[i])
             return max_valeur
         else:
             min_valeur = math.inf
-            for coup in self.plateau.get_liste_coups_possible(joueur=-1):
-                self.plateau.joue(coup[0], coup[1])
+            for i in range(nombre_coups):
+                enregistrement = self._make_move(code=tampon[i])
                 ev = self._evaluate(profondeur=profondeur-1, maximizing_joueur=True)
-                self.plateau.joue(coup[1], coup[0], True)
-                min_valeur = min(min_valeur, ev)
+                self._unmake_move(enregistrement=enregistrement)
+                if ev < min_valeur:
+                    min_valeur = ev
+                    self._enregistre_variante(ply=ply, code=tampon[i])
             return min_valeur
 
     def evaluate(self):
@@ -76,4 +174,34 @@ class MinMax:
             Retourne :
                 int : La valeur du plateau retourné par '_evaluate(...)'.
         """
-        return self._evaluate(profondeur=self.profondeur, maximizing_joueur=(lambda x: x*1 == 1)(self.joueur_actuel))
+        if self.statistiques is None:
+            return self._evaluate(profondeur=self.profondeur,
+                                  maximizing_joueur=(lambda x: x*1 == 1)(self.joueur_actuel))
+        noeuds_avant = self.noeuds
+        debut = perf_counter()
+        try:
+            return self._evaluate(profondeur=self.profondeur,
+                                  maximizing_joueur=(lambda x: x*1 == 1)(self.joueur_actuel))
+        finally:
+            self.statistiques.noeuds += self.noeuds - noeuds_avant
+            self.statistiques.appels["etat"] += self.noeuds - noeuds_avant  # un appel de 'etat()' par nœud
+            self.statistiques.temps_total += perf_counter() - debut
+
+    def recherche_racine(self, coups: list | None = None):
+        """
+        Recherche la position de la racine et retourne son meilleur coup.
+
+            Paramètre :
+                coups (list | None) : Les coups de la racine à rechercher, ou None pour tous les coups possibles.
+
+            Retourne :
+                tuple : Le meilleur coup, sa valeur et la variante principale (liste des coups successifs).
+        """
+        self.coups_racine = coups
+        try:
+            score = self.evaluate()
+        finally:
+            self.coups_racine = None
+        coups_codes = self.plateau.tables.coups_codes
+        variante = [coups_codes[code] for code in self.variantes[0][:self.longueurs_variantes[0]]]
+        return (variante[0] if variante else None), score, variante
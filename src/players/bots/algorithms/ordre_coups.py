@@ -0,0 +1,92 @@
+class OrdonnanceurCoups:
+    """
+    Classe implémentant l'ordonnancement des coups utilisé par AlphaBeta pour tester en premier les coups ayant le plus
+    de chances de provoquer une coupure. Les coups sont triés dans l'ordre suivant :
+        1. le meilleur coup enregistré dans la table de transposition
+        2. les prises
+        3. les coups meurtriers ('killer moves') : deux coups non-prises par profondeur ayant provoqué une coupure
+        4. les autres coups, triés selon l'heuristique de l'historique
+    Les prises et les autres coups sont départagés par leur score d'historique, qui augmente à chaque coupure
+    provoquée par le coup (indexé par le couple (case_origine, case_destination)).
+
+        Attributs :
+            coups_meurtriers (dict) : Pour chaque profondeur depuis la racine, la liste des deux derniers coups
+                                      non-prises ayant provoqué une coupure.
+            historique (dict) : Le score d'historique de chaque coup {(case_origine, case_destination): score, ...}.
+
+        Interface :
+            est_prise(...) : Retourne si un coup est une prise.
+            ordonne(...) : Retourne la liste des coups triée.
+            enregistre_coupure(...) : Met à jour les coups meurtriers et l'historique après une coupure.
+            nouvelle_recherche() : Prépare l'ordonnanceur pour la recherche d'un nouveau coup.
+    """
+
+    def __init__(self):
+        self.coups_meurtriers = {}
+        self.historique = {}
+
+    @staticmethod
+    def est_prise(coup: tuple):
+        """
+        Retourne si un coup est une prise, c'est-à-dire si le pion se déplace de deux lignes.
+
+            Paramètre :
+                coup (tuple) : Le couple (case_origine, case_destination) du coup.
+
+            Retourne :
+                bool : True si le coup est une prise, sinon False.
+        """
+        return abs(coup[1][0] - coup[0][0]) == 2
+
+    def ordonne(self, coups: list, ply: int, coup_table: tuple | None = None):
+        """
+        Retourne la liste des coups triée du plus prometteur au moins prometteur. Le tri est stable : les coups de même
+        score gardent l'ordre de la génération des coups.
+
+            Paramètres :
+                coups (list) : La liste des coups (case_origine, case_destination) à trier.
+                ply (int) : La profondeur du nœud depuis la racine de la recherche.
+                coup_table (tuple | None) : Le meilleur coup enregistré dans la table de transposition, ou None.
+
+            Retourne :
+                list : La liste des coups triée.
+        """
+        historique = self.historique
+        coups_meurtriers = self.coups_meurtriers.get(ply, ())
+
+        def score(coup: tuple):
+            if coup == coup_table:
+                return 1 << 62
+            if abs(coup[1][0] - coup[0][0]) == 2:
+                return (1 << 61) + historique.get(coup, 0)
+            if coup in coups_meurtriers:
+                return (1 << 60) - coups_meurtriers.index(coup)
+            return historique.get(coup, 0)
+
+        return sorted(coups, key=score, reverse=True)
+
+    def enregistre_coupure(self, coup: tuple, ply: int, profondeur: int):
+        """
+        Met à jour les coups meurtriers et l'historique après une coupure provoquée par un coup.
+
+            Paramètres :
+                coup (tuple) : Le coup ayant provoqué la coupure.
+                ply (int) : La profondeur du nœud depuis la racine de la recherche.
+                profondeur (int) : La profondeur restant à rechercher sous le nœud.
+        """
+        self.historique[coup] = self.historique.get(coup, 0) + profondeur * profondeur
+        if self.est_prise(coup=coup):
+            return
+        coups_meurtriers = self.coups_meurtriers.setdefault(ply, [])
+        if coup in coups_meurtriers:
+            coups_meurtriers.remove(coup)
+        coups_meurtriers.insert(0, coup)
+        del coups_meurtriers[2:]
+
+    def nouvelle_recherche(self):
+        """
+        Prépare l'ordonnanceur pour la recherche d'un nouveau coup : les coups meurtriers sont oubliés et les scores
+        d'historique divisés par deux pour favoriser les coupures récentes.
+        """
+        self.coups_meurtriers = {}
+        self.historique = {coup: score // 2 for coup, score in self.historique.items() if score > 1}
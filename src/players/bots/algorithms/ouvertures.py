@@ -0,0 +1,176 @@
+import json
+import mmap
+import os
+import random
+import struct
+
+from src.game_engine.board import Board
+
+
+# Un fichier de livre d'ouvertures commence par un en-tête (signature, version, taille du plateau, nombre d'entrées)
+# suivi d'entrées de taille fixe triées par clé de Zobrist, puis par coup : toutes les entrées d'une position sont donc
+# consécutives et trouvées par recherche dichotomique directement dans le fichier.
+SIGNATURE = b"DAMESLIV"
+VERSION = 1
+FORMAT_ENTETE = struct.Struct("<8sIII")
+
+# Entrée de 24 octets : clé de la position (avec le joueur devant jouer), indices (x * taille + y) des cases d'origine
+# et de destination du coup, nombre de parties où le coup a été joué, et parmi elles le nombre de parties gagnées par
+# le joueur ayant joué le coup et le nombre de parties nulles.
+FORMAT_ENTREE = struct.Struct("<QBB2xIII")
+
+MEILLEUR = "meilleur"
+ALEATOIRE = "aleatoire"
+
+
+def construit_livre(fichiers: list, chemin: str, coups_max: int | None = 12):
+    """
+    Construit un livre d'ouvertures à partir de parties enregistrées au format JSONL par le tournoi
+    ('tournament.py'), en rejouant les 'coups_max' premiers coups de chaque partie.
+
+        Paramètres :
+            fichiers (list) : Les chemins des fichiers JSONL des parties.
+            chemin (str) : Le chemin du fichier du livre créé.
+            coups_max (int | None) : Le nombre de demi-coups de chaque partie ajoutés au livre.
+
+        Retourne :
+            int : Le nombre d'entrées du livre.
+    """
+    statistiques = {}
+    taille_livre = None
+    for fichier in fichiers:
+        with open(fichier, encoding="utf-8") as parties:
+            for ligne in parties:
+                partie = json.loads(ligne)
+                taille = partie["taille"]
+                if taille_livre is None:
+                    taille_livre = taille
+                assert taille == taille_livre, "Les parties du livre doivent être de la même taille de plateau !"
+                plateau = Board(taille=taille)
+                for case_origine, case_destination in partie["coups"][:coups_max]:
+                    joueur = plateau.trait
+                    cle = (plateau.cle, case_origine[0] * taille + case_origine[1],
+                           case_destination[0] * taille + case_destination[1])
+                    entree = statistiques.setdefault(cle, [0, 0, 0])
+                    entree[0] += 1
+                    if partie["gagnant"] == joueur:
+                        entree[1] += 1
+                    elif partie["gagnant"] == 0:
+                        entree[2] += 1
+                    plateau.joue(case_origine=tuple(case_origine), case_destination=tuple(case_destination))
+    with open(chemin, "wb") as livre:
+        livre.write(FORMAT_ENTETE.pack(SIGNATURE, VERSION, taille_livre or 0, len(statistiques)))
+        for (cle, origine, destination), (parties, victoires, nulles) in sorted(statistiques.items()):
+            livre.write(FORMAT_ENTREE.pack(cle, origine, destination, parties, victoires, nulles))
+    return len(statistiques)
+
+
+class LivreOuvertures:
+    """
+    Classe permettant de consulter un livre d'ouvertures construit par 'construit_livre(...)'. Le fichier est projeté
+    en mémoire ('mmap') et les entrées d'une position sont trouvées par recherche dichotomique sur la clé de Zobrist,
+    sans charger le livre.
+
+        Attributs :
+            chemin (str) : Le chemin du fichier du livre.
+            taille (int) : La taille du plateau des parties du livre.
+            nombre_entrees (int) : Le nombre d'entrées du livre.
+            parties_min (int) : Le nombre minimal de parties d'un coup pour qu'il soit choisi.
+
+        Interface :
+            coups(...) : Retourne les coups du livre pour une position avec leurs statistiques.
+            choisit(...) : Retourne le coup du livre à jouer dans une position, ou None.
+            ferme() : Ferme le fichier du livre.
+    """
+
+    def __init__(self, chemin: str, parties_min: int | None = 1):
+        self.chemin = chemin
+        self.parties_min = parties_min
+        self._fichier = open(chemin, "rb")
+        self._memoire = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        signature, version, taille, nombre_entrees = FORMAT_ENTETE.unpack_from(self._memoire, 0)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Fichier de livre d'ouvertures invalide ou de version différente !")
+        if os.fstat(self._fichier.fileno()).st_size != FORMAT_ENTETE.size + nombre_entrees * FORMAT_ENTREE.size:
+            raise ValueError("Fichier de livre d'ouvertures tronqué !")
+        self.taille = taille
+        self.nombre_entrees = nombre_entrees
+
+    def _cle(self, i: int):
+        """
+        Retourne la clé de la i-ème entrée du livre.
+        """
+        return struct.unpack_from("<Q", self._memoire, FORMAT_ENTETE.size + i * FORMAT_ENTREE.size)[0]
+
+    def coups(self, cle: int):
+        """
+        Retourne les coups du livre pour une position.
+
+            Paramètre :
+                cle (int) : La clé de Zobrist de la position.
+
+            Retourne :
+                list : La liste des tuples ((origine, destination), parties, victoires, nulles), avec 'origine' et
+                       'destination' les indices des cases du coup.
+        """
+        debut, fin = 0, self.nombre_entrees
+        while debut < fin:
+            milieu = (debut + fin) // 2
+            if self._cle(milieu) < cle:
+                debut = milieu + 1
+            else:
+                fin = milieu
+        coups = []
+        for i in range(debut, self.nombre_entrees):
+            cle_entree, origine, destination, parties, victoires, nulles = FORMAT_ENTREE.unpack_from(
+                self._memoire, FORMAT_ENTETE.size + i * FORMAT_ENTREE.size)
+            if cle_entree != cle:
+                break
+            coups.append(((origine, destination), parties, victoires, nulles))
+        return coups
+
+    def choisit(self, plateau: Board, joueur: int, choix: str | None = MEILLEUR):
+        """
+        Retourne le coup du livre à jouer dans une position, parmi les coups possibles joués dans au moins
+        'parties_min' parties : le coup de meilleur score moyen (une victoire compte 1 et une nulle 1/2) si 'choix'
+        vaut MEILLEUR, ou un coup tiré au hasard proportionnellement à son nombre de parties si 'choix' vaut
+        ALEATOIRE.
+
+            Paramètres :
+                plateau (Board) : Le plateau de la position.
+                joueur (int) : Le joueur devant jouer.
+                choix (str | None) : Le mode de choix du coup, MEILLEUR ou ALEATOIRE.
+
+            Retourne :
+                tuple : Le coup (case_origine, case_destination) choisi.
+                NoneType : None si la position n'est pas dans le livre.
+        """
+        if plateau.taille != self.taille:
+            return None
+        cle = plateau.cle if plateau.trait == joueur else plateau.cle ^ plateau.tables.zobrist_trait
+        coordonnees = plateau.tables.coordonnees
+        coups_possibles = plateau.get_liste_coups_possible(joueur=joueur)
+        candidats = []
+        for (origine, destination), parties, victoires, nulles in self.coups(cle=cle):
+            coup = (coordonnees[origine], coordonnees[destination])
+            if parties >= self.parties_min and coup in coups_possibles:
+                candidats.append((coup, parties, (victoires + nulles / 2) / parties))
+        if not candidats:
+            return None
+        if choix == MEILLEUR:
+            return max(candidats, key=lambda candidat: (candidat[2], candidat[1]))[0]
+        return random.choices([candidat[0] for candidat in candidats],
+                              weights=[candidat[1] for candidat in candidats])[0]
+
+    def ferme(self):
+        """
+        Ferme le fichier du livre.
+        """
+        self._memoire.close()
+        self._fichier.close()
+
+    def __getstate__(self):
+        return {"chemin": self.chemin, "parties_min": self.parties_min}
+
+    def __setstate__(self, etat: dict):
+        self.__init__(chemin=etat["chemin"], parties_min=etat["parties_min"])
@@ -0,0 +1,95 @@
+from time import perf_counter
+
+from src.game_engine.board import Board
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.ordre_coups import OrdonnanceurCoups
+from src.players.bots.algorithms.statistiques import StatistiquesRecherche
+from src.players.bots.algorithms.transposition import TableTransposition
+from src.utils import TempsEcoule
+
+
+RACINE = "racine"
+LAZY_SMP = "lazy_smp"
+
+# Tables de transposition partagées déjà attachées par le processus, indexées par le nom du segment de mémoire.
+_tables_attachees = {}
+
+
+def _table_processus(nom_table: str | None, taille_table: float | None):
+    """
+    Retourne la table de transposition partagée attachée par le processus courant, en l'attachant au premier appel.
+
+        Paramètres :
+            nom_table (str | None) : Le nom du segment de mémoire partagée de la table, ou None.
+            taille_table (float | None) : La taille de la table en mégaoctets.
+
+        Retourne :
+            TableTransposition | None : La table attachée, ou None si aucune table n'est partagée.
+    """
+    if nom_table is None:
+        return None
+    if nom_table not in _tables_attachees:
+        _tables_attachees[nom_table] = TableTransposition.attache(nom=nom_table, taille_mo=taille_table)
+    return _tables_attachees[nom_table]
+
+
+def recherche_coups_racine(plateau: Board, coups: list, profondeur: int, joueur: int,
+                           duree_max: float | None = None, nom_table: str | None = None,
+                           taille_table: float | None = None, ordonne_coups: bool | None = False,
+                           options: dict | None = None, statistiques: bool | None = False):
+    """
+    Fonction exécutée par un processus de la réserve : recherche avec AlphaBeta, en une seule recherche de la racine,
+    les coups donnés sur sa propre copie du plateau.
+
+        Paramètres :
+            plateau (Board) : La copie du plateau reçue par le processus.
+            coups (list) : La liste des coups de la racine à rechercher, dans l'ordre où ils sont testés.
+            profondeur (int) : La profondeur de la recherche.
+            joueur (int) : Le joueur devant jouer (la valeur du pion du bot).
+            duree_max (float | None) : Le temps restant en secondes, ou None pour ne pas limiter le temps.
+            nom_table (str | None) : Le nom du segment de mémoire partagée de la table de transposition, ou None.
+            taille_table (float | None) : La taille de la table de transposition en mégaoctets.
+            ordonne_coups (bool | None) : Si True, les coups sont triés par un ordonnanceur propre au processus.
+            options (dict | None) : Les autres paramètres nommés passés à AlphaBeta.
+            statistiques (bool | None) : Si True, la recherche remplit un objet StatistiquesRecherche propre au
+                                         processus.
+
+        Retourne :
+            tuple : Le triplet (meilleur coup, valeur, variante principale) de 'AlphaBeta.recherche_racine(...)' (None
+                    si le temps est écoulé), le nombre de nœuds explorés, les statistiques de la recherche (None si
+                    elles ne sont pas calculées) et 'AlphaBeta.limite_atteinte'.
+    """
+    limite_temps = perf_counter() + duree_max if duree_max is not None else None
+    table = _table_processus(nom_table=nom_table, taille_table=taille_table)
+    ordonnanceur = OrdonnanceurCoups() if ordonne_coups else None
+    statistiques_processus = StatistiquesRecherche() if statistiques else None
+    algorithme = AlphaBeta(plateau=plateau, profondeur=profondeur, joueur_actuel=joueur, table=table,
+                           limite_temps=limite_temps, ordonnanceur=ordonnanceur, statistiques=statistiques_processus,
+                           **(options or {}))
+    try:
+        resultat = algorithme.recherche_racine(coups=coups)
+    except TempsEcoule:
+        return None, algorithme.noeuds, statistiques_processus, True
+    return resultat, algorithme.noeuds, statistiques_processus, algorithme.limite_atteinte
+
+
+def repartit_coups(coups: list, workers: int, mode: str):
+    """
+    Retourne les listes de coups recherchées par chaque processus :
+        * RACINE : les coups de la racine sont répartis entre les processus, chacun recherchant une partie des coups
+        * LAZY_SMP : chaque processus recherche tous les coups dans un ordre différent, les processus s'aidant
+                     mutuellement à travers la table de transposition partagée
+
+        Paramètres :
+            coups (list) : La liste des coups de la racine.
+            workers (int) : Le nombre de processus.
+            mode (str) : Le mode de parallélisation, RACINE ou LAZY_SMP.
+
+        Retourne :
+            list : La liste des listes de coups, une par processus (les listes vides sont omises).
+    """
+    if mode == RACINE:
+        return [coups[i::workers] for i in range(min(workers, len(coups)))]
+    if mode == LAZY_SMP:
+        return [coups[i % len(coups):] + coups[:i % len(coups)] for i in range(workers)]
+    raise ValueError(f"Mode de parallélisation inconnu : {mode} !")
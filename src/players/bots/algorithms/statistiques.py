@@ -0,0 +1,145 @@
+from time import perf_counter
+
+
+# Les fonctions chronométrées pendant une recherche : génération des listes de coups, application d'un coup (avec la
+# mise à jour incrémentale des coups possibles), annulation d'un coup, état du plateau et fonction d'évaluation.
+FONCTIONS_CHRONOMETREES = ("generation", "make_move", "unmake_move", "etat", "evaluate_node")
+
+
+class StatistiquesRecherche:
+    """
+    Classe regroupant les statistiques d'une ou plusieurs recherches (MinMax, AlphaBeta) : nombre de nœuds et de
+    feuilles, coupures selon l'indice du coup qui les provoque, nombre d'appels et temps passé dans les fonctions
+    coûteuses et profondeur maximale atteinte (recherche de quiescence comprise). Les algorithmes ne remplissent ces
+    statistiques que si elles leur sont données. Pour qu'elles restent peu coûteuses, les appels sont comptés
+    directement par les algorithmes (un seul test par nœud lorsque les statistiques sont absentes) et les fonctions ne
+    sont remplacées par leurs versions chronométrées ('chronometre(...)') que pendant un nœud sur 'periode' : les
+    temps sont estimés en multipliant les durées mesurées par 'periode' (1 pour des temps exacts).
+
+        Attributs :
+            noeuds (int) : Le nombre de nœuds explorés.
+            feuilles (int) : Le nombre de feuilles, c'est-à-dire d'appels de 'evaluate_node()' (propriété).
+            coupures (list) : Le nombre de coupures provoquées par le coup d'indice i (0 pour le premier coup testé).
+            appels (dict) : Le nombre d'appels de chaque fonction de 'FONCTIONS_CHRONOMETREES'.
+            temps (dict) : Le temps estimé en secondes passé dans chaque fonction de 'FONCTIONS_CHRONOMETREES'.
+            profondeur_max (int) : La profondeur maximale atteinte (en demi-coups depuis la racine).
+            temps_total (float) : La durée totale des recherches en secondes.
+            periode (int) : Le nombre de nœuds pour un nœud dont les appels sont chronométrés (une puissance de 2).
+            masque (int) : Le masque 'periode - 1' : les appels sont chronométrés jusqu'au nœud suivant lorsque
+                           'noeuds & masque' est nul.
+
+        Interface :
+            chronometre(...) : Retourne une fonction ajoutant le temps passé dans une fonction.
+            coupure(...) : Compte une coupure provoquée par le coup d'indice donné.
+            fusionne(...) : Ajoute les statistiques d'une autre recherche (par exemple d'un autre processus).
+            en_dict() : Retourne les statistiques sous forme d'un dictionnaire sérialisable en JSON.
+    """
+
+    def __init__(self, periode: int | None = 64):
+        assert periode > 0 and periode & (periode - 1) == 0, "La période doit être une puissance de 2 !"
+        self.periode = periode
+        self.masque = periode - 1
+        self.noeuds = 0
+        self.coupures = []
+        self.appels = dict.fromkeys(FONCTIONS_CHRONOMETREES, 0)
+        self.temps = dict.fromkeys(FONCTIONS_CHRONOMETREES, 0.0)
+        self.profondeur_max = 0
+        self.temps_total = 0.0
+
+    @property
+    def feuilles(self):
+        """
+        Retourne le nombre de feuilles, c'est-à-dire d'évaluations statiques.
+        """
+        return self.appels["evaluate_node"]
+
+    def chronometre(self, nom: str, fonction):
+        """
+        Retourne une fonction appelant 'fonction' en ajoutant à 'self.temps[nom]' la durée de l'appel multipliée par
+        'self.periode'. Elle n'est utilisée que pendant un nœud sur 'self.periode' et ne compte pas les appels (comptés
+        par les algorithmes).
+
+            Paramètres :
+                nom (str) : Le nom de la fonction dans 'FONCTIONS_CHRONOMETREES'.
+                fonction (callable) : La fonction à chronométrer.
+
+            Retourne :
+                callable : La fonction chronométrée, de mêmes paramètres que 'fonction'.
+        """
+        temps = self.temps
+        periode = self.periode
+
+        def fonction_chronometree(*args, **kwargs):
+            debut = perf_counter()
+            resultat = fonction(*args, **kwargs)
+            temps[nom] += (perf_counter() - debut) * periode
+            return resultat
+        return fonction_chronometree
+
+    def coupure(self, indice: int):
+        """
+        Compte une coupure provoquée par le coup d'indice donné.
+
+            Paramètre :
+                indice (int) : L'indice du coup dans l'ordre où les coups du nœud sont testés.
+        """
+        coupures = self.coupures
+        if indice >= len(coupures):
+            coupures.extend([0] * (indice + 1 - len(coupures)))
+        coupures[indice] += 1
+
+    def fusionne(self, autres: "StatistiquesRecherche"):
+        """
+        Ajoute les statistiques d'une autre recherche à ces statistiques (la profondeur maximale est la plus grande
+        des deux et les durées totales sont additionnées).
+
+            Paramètre :
+                autres (StatistiquesRecherche) : Les statistiques à ajouter.
+        """
+        self.noeuds += autres.noeuds
+        self.coupures.extend([0] * (len(autres.coupures) - len(self.coupures)))
+        for indice, nombre in enumerate(autres.coupures):
+            self.coupures[indice] += nombre
+        for nom in FONCTIONS_CHRONOMETREES:
+            self.appels[nom] += autres.appels[nom]
+            self.temps[nom] += autres.temps[nom]
+        self.profondeur_max = max(self.profondeur_max, autres.profondeur_max)
+        self.temps_total += autres.temps_total
+
+    def en_dict(self):
+        """
+        Retourne les statistiques sous forme d'un dictionnaire sérialisable en JSON.
+
+            Retourne :
+                dict : Le dictionnaire des statistiques.
+        """
+        return {"noeuds": self.noeuds, "feuilles": self.feuilles, "coupures": list(self.coupures),
+                "appels": dict(self.appels), "temps": dict(self.temps), "profondeur_max": self.profondeur_max,
+                "temps_total": self.temps_total, "periode": self.periode}
+
+
+def fonctions_recherche(plateau, evaluate_node, statistiques: StatistiquesRecherche | None = None):
+    """
+    Retourne les fonctions du plateau et la fonction d'évaluation appelées par une recherche (les méthodes liées, sans
+    surcoût), et leurs versions chronométrées par 'statistiques' si elles sont données, que la recherche utilise
+    pendant un nœud sur 'statistiques.periode'. Les coups sont écrits sous forme de codes entiers dans les tampons de
+    la recherche ('remplit_coups(...)', puis 'remplit_deplacements(...)' pour la génération par étapes), puis joués
+    et annulés sans vérification ('make_move_code(...)').
+
+        Paramètres :
+            plateau (Board) : Le plateau de la recherche.
+            evaluate_node (callable) : La fonction d'évaluation de l'algorithme.
+            statistiques (StatistiquesRecherche | None) : Les statistiques à remplir, ou None.
+
+        Retourne :
+            tuple : Le couple des fonctions (get_liste_coups_possible, remplit_coups, remplit_deplacements,
+                    make_move_code, unmake_move_rapide, etat, evaluate_node) et de leurs versions chronométrées (None
+                    sans statistiques).
+    """
+    fonctions = (plateau.get_liste_coups_possible, plateau.remplit_coups, plateau.remplit_deplacements,
+                 plateau.make_move_code, plateau.unmake_move_rapide, plateau.etat, evaluate_node)
+    if statistiques is None:
+        return fonctions, None
+    noms = ("generation", "generation") + FONCTIONS_CHRONOMETREES
+    return fonctions, tuple(statistiques.chronometre(nom=nom, fonction=fonction)
+                            for nom, fonction in zip(noms, fonctions))
@@ -0,0 +1,200 @@
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+
+EXACTE = 0
+INFERIEURE = 1
+SUPERIEURE = 2
+
+TAILLE_ENTREE = 16  # octets : un mot de 64 bits pour la clé et un pour les données
+DECALAGE_SCORE = 1 << 15
+
+
+def nombre_compartiments_table(taille_mo: float):
+    """
+    Retourne le nombre de compartiments (une puissance de deux) d'une table de transposition ne dépassant pas la taille
+    donnée.
+
+        Paramètre :
+            taille_mo (float) : La taille maximale de la table en mégaoctets.
+
+        Retourne :
+            int : Le nombre de compartiments de deux entrées de la table.
+    """
+    nombre_compartiments = 1
+    while nombre_compartiments * 4 * TAILLE_ENTREE <= taille_mo * (1 << 20):
+        nombre_compartiments *= 2
+    return nombre_compartiments
+
+
+class TableTransposition:
+    """
+    Classe implémentant une table de transposition de taille fixe, indexée par la clé de Zobrist des positions.
+    La table est découpée en compartiments de deux entrées :
+        * la première n'est remplacée que par une recherche au moins aussi profonde (remplacement par profondeur)
+        * la seconde est toujours remplacée
+    Chaque entrée est stockée sur deux mots de 64 bits (la clé et les données compactées : profondeur, type de borne,
+    score et meilleur coup), ce qui borne la mémoire utilisée. Le premier mot contient la clé combinée aux données par
+    un ou exclusif : une entrée dont les deux mots ont été écrits par deux processus différents n'est donc jamais
+    reconnue, ce qui permet de partager la table entre processus (en mémoire partagée) sans verrou.
+
+        Attributs :
+            taille_mo (float) : La taille maximale de la table en mégaoctets.
+            nombre_compartiments (int) : Le nombre de compartiments de la table (une puissance de deux).
+            entrees (array | memoryview) : Le tableau des mots de 64 bits de la table.
+            memoire (SharedMemory | None) : Le segment de mémoire partagée contenant la table, ou None si la table
+                                            est locale au processus.
+            succes (int) : Le nombre de consultations ayant trouvé la position.
+            echecs (int) : Le nombre de consultations n'ayant pas trouvé la position.
+            collisions (int) : Le nombre d'enregistrements ayant écrasé l'entrée d'une autre position.
+
+        Interface :
+            cree_partagee(...) : Crée une table dans un nouveau segment de mémoire partagée.
+            attache(...) : Retourne une table utilisant un segment de mémoire partagée existant.
+            sonde(...) : Retourne l'entrée associée à une clé si elle est présente dans la table.
+            enregistre(...) : Enregistre le résultat de la recherche d'une position.
+            vide() : Vide la table et remet à zéro les compteurs.
+            statistiques() : Retourne les compteurs de la table.
+            ferme() : Détache la table de la mémoire partagée (et la libère si demandé).
+    """
+
+    def __init__(self, taille_mo: float | None = 16, memoire: SharedMemory | None = None):
+        assert taille_mo > 0, "La taille de la table doit être strictement positive !"
+        self.taille_mo = taille_mo
+        nombre_compartiments = nombre_compartiments_table(taille_mo=taille_mo)
+        self.nombre_compartiments = nombre_compartiments
+        self.masque = nombre_compartiments - 1
+        self.memoire = memoire
+        if memoire is None:
+            self.entrees = array("Q", bytes(nombre_compartiments * 2 * TAILLE_ENTREE))
+        else:
+            self.entrees = memoire.buf[:nombre_compartiments * 2 * TAILLE_ENTREE].cast("Q")
+        self.succes = 0
+        self.echecs = 0
+        self.collisions = 0
+
+    @classmethod
+    def cree_partagee(cls, taille_mo: float | None = 16):
+        """
+        Crée une table de transposition dans un nouveau segment de mémoire partagée, pouvant être utilisé par d'autres
+        processus avec 'attache(...)'.
+
+            Paramètre :
+                taille_mo (float | None) : La taille maximale de la table en mégaoctets.
+
+            Retourne :
+                TableTransposition : La table créée.
+        """
+        memoire = SharedMemory(create=True, size=nombre_compartiments_table(taille_mo=taille_mo) * 2 * TAILLE_ENTREE)
+        memoire.buf[:len(memoire.buf)] = bytes(len(memoire.buf))
+        return cls(taille_mo=taille_mo, memoire=memoire)
+
+    @classmethod
+    def attache(cls, nom: str, taille_mo: float):
+        """
+        Retourne une table de transposition utilisant un segment de mémoire partagée existant.
+
+            Paramètres :
+                nom (str) : Le nom du segment de mémoire partagée ('table.memoire.name').
+                taille_mo (float) : La taille maximale de la table en mégaoctets, identique à celle de la table créée.
+
+            Retourne :
+                TableTransposition : La table attachée au segment.
+        """
+        memoire = SharedMemory(name=nom)
+        return cls(taille_mo=taille_mo, memoire=memoire)
+
+    def sonde(self, cle: int):
+        """
+        Retourne l'entrée associée à la clé d'une position si elle est présente dans la table.
+
+            Paramètre :
+                cle (int) : La clé de Zobrist de la position.
+
+            Retourne :
+                tuple : Le tuple (profondeur, borne, score, coup) avec 'coup' le couple d'indices (origine,
+                        destination) du meilleur coup ou None.
+                NoneType : None si la position n'est pas dans la table.
+        """
+        entrees = self.entrees
+        i = (cle & self.masque) << 2
+        donnees = entrees[i + 1]
+        if not (donnees and entrees[i] ^ donnees == cle):
+            donnees = entrees[i + 3]
+            if not (donnees and entrees[i + 2] ^ donnees == cle):
+                donnees = 0
+        if not donnees:
+            self.echecs += 1
+            return None
+        self.succes += 1
+        origine = (donnees >> 26) & 0x7F
+        coup = ((origine - 1, (donnees >> 33) & 0x7F) if origine else None)
+        return (donnees & 0xFF) - 1, (donnees >> 8) & 0x3, ((donnees >> 10) & 0xFFFF) - DECALAGE_SCORE, coup
+
+    def enregistre(self, cle: int, profondeur: int, borne: int, score: int, coup: tuple | None = None):
+        """
+        Enregistre le résultat de la recherche d'une position. L'entrée à remplacement par profondeur est utilisée si
+        la recherche est au moins aussi profonde que celle qu'elle contient (ou concerne la même position), sinon
+        l'entrée toujours remplacée est utilisée.
+
+            Paramètres :
+                cle (int) : La clé de Zobrist de la position.
+                profondeur (int) : La profondeur de la recherche ayant donné le score.
+                borne (int) : Le type du score, EXACTE, INFERIEURE (score minimal) ou SUPERIEURE (score maximal).
+                score (int) : Le score de la position.
+                coup (tuple | None) : Le couple d'indices (origine, destination) du meilleur coup, ou None.
+        """
+        assert -DECALAGE_SCORE <= score < DECALAGE_SCORE, "Score hors des limites de la table !"
+        donnees = (profondeur + 1) | (borne << 8) | ((score + DECALAGE_SCORE) << 10)
+        if coup is not None:
+            donnees |= ((coup[0] + 1) << 26) | (coup[1] << 33)
+        entrees = self.entrees
+        i = (cle & self.masque) << 2
+        donnees_profondeur = entrees[i + 1]
+        cle_profondeur = entrees[i] ^ donnees_profondeur
+        if not (cle_profondeur == cle or not donnees_profondeur or (donnees_profondeur & 0xFF) <= profondeur + 1):
+            i += 2
+        if entrees[i + 1] and entrees[i] ^ entrees[i + 1] != cle:
+            self.collisions += 1
+        entrees[i] = cle ^ donnees
+        entrees[i + 1] = donnees
+
+    def vide(self):
+        """
+        Vide la table et remet à zéro ses compteurs.
+        """
+        if self.memoire is None:
+            self.entrees = array("Q", bytes(self.nombre_compartiments * 2 * TAILLE_ENTREE))
+        else:
+            self.memoire.buf[:len(self.memoire.buf)] = bytes(len(self.memoire.buf))
+        self.succes = 0
+        self.echecs = 0
+        self.collisions = 0
+
+    def statistiques(self):
+        """
+        Retourne les compteurs de la table.
+
+            Retourne :
+                dict : Un dictionnaire contenant le nombre de succès, d'échecs, de collisions et le taux de succès.
+        """
+        consultations = self.succes + self.echecs
+        return {"succes": self.succes, "echecs": self.echecs, "collisions": self.collisions,
+                "taux_succes": self.succes / consultations if consultations else 0.0}
+
+    def ferme(self, libere: bool | None = False):
+        """
+        Détache la table de son segment de mémoire partagée, et le libère si demandé. Ne fait rien pour une table
+        locale au processus.
+
+            Paramètre :
+                libere (bool | None) : Si True, libère le segment (à faire par le processus l'ayant créé).
+        """
+        if self.memoire is None:
+            return
+        self.entrees.release()
+        self.entrees = None
+        self.memoire.close()
+        if libere:
+            self.memoire.unlink()
+        self.memoire = None
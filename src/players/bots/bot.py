@@ -1,8 +1,24 @@
+import json
+import math
 import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
 
 from src.players.player import BasePlayer
 from src.players.bots.algorithms.minmax import MinMax
 from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.finales import BaseFinales
+from src.players.bots.algorithms.mcts import MCTS, recherche_processus
+from src.players.bots.algorithms.ordre_coups import OrdonnanceurCoups
+from src.players.bots.algorithms.ouvertures import LivreOuvertures, MEILLEUR
+from src.players.bots.algorithms.transposition import TableTransposition
+from src.players.bots.algorithms.parallele import RACINE, recherche_coups_racine, repartit_coups
+from src.players.bots.algorithms.statistiques import StatistiquesRecherche
+from src.utils import TempsEcoule
+
+
+# Les compteurs des recherches AlphaBeta additionnés par Albator pour chaque coup joué.
+COMPTEURS_RECHERCHE = ("recherches_nulles", "re_recherches_pvs", "recherches_aspiration", "re_recherches_aspiration")
 
 
 class RandomBot(BasePlayer):
@@ -36,45 +52,245 @@ class RandomBot(BasePlayer):
         return case_origine, case_destination
 
 
-class MinMaxBot(BasePlayer):
+class BotRecherche(BasePlayer):
     """
-    Classe utilisée pour modéliser un bot jouant utilisant l'algorithme MinMax.
+    Classe utilisée pour modéliser un bot choisissant ses coups avec un algorithme de recherche (MinMax, AlphaBeta).
+    La position actuelle est recherchée en une seule fois depuis la racine par l'algorithme créé par
+    '_cree_algorithme(...)', pour le joueur du bot, qui retourne le meilleur coup, sa valeur et la variante principale.
+    Si 'temps_max' est spécifié, la recherche se fait par approfondissement itératif : la position est recherchée à la
+    profondeur 1, puis 2, etc. en testant en premier le meilleur coup de l'itération précédente, jusqu'à ce que le
+    temps soit écoulé, ou qu'une recherche n'ait atteint sa profondeur maximale sur aucune position non terminale
+    (l'arbre de jeu est alors entièrement exploré). Le meilleur coup de la dernière profondeur terminée est alors joué.
+    Si un livre d'ouvertures est utilisé et contient la position, le coup du livre est joué sans recherche.
+    Si 'statistiques' est True (ou 'fichier_statistiques' donné), les recherches de chaque coup remplissent un objet
+    StatistiquesRecherche, ajouté à 'derniere_recherche' et écrit avec elle en une ligne JSON dans
+    'fichier_statistiques'.
 
         Attributs :
             nom (str) : Le nom du joueur.
             plateau (Board) : Le plateau de jeu sur lequel joue le bot.
             valeur_pion (int) : La valeur du pion du joueur.
-            profondeur (int) : La hauteur du graphe des coups testés (le nombre de coups successifs à tester).
+            profondeur (int) : La hauteur du graphe des coups testés (le nombre de coups successifs à tester), utilisée
+                               si 'temps_max' n'est pas spécifié.
+            temps_max (float | None) : Le temps maximal en secondes accordé à la recherche d'un coup, ou None pour une
+                                       recherche à profondeur fixe.
+            derniere_recherche (dict) : Les informations sur la recherche du dernier coup joué (profondeur atteinte,
+                                        nœuds explorés, temps, nœuds par seconde, coup issu du livre ou non, valeur
+                                        du coup et variante principale).
+            noeuds (int) : Le nombre de nœuds explorés pendant la recherche du dernier coup joué.
+            livre (LivreOuvertures | None) : Le livre d'ouvertures consulté avant chaque recherche (ouvert à partir de
+                                             'fichier_livre' si donné), ou None pour ne pas en utiliser.
+            choix_livre (str) : Le mode de choix des coups du livre, 'meilleur' ou 'aleatoire' (pondéré par le nombre
+                                de parties de chaque coup).
+            statistiques (StatistiquesRecherche | None) : Les statistiques des recherches du dernier coup joué, ou None
+                                                          si elles ne sont pas calculées.
+            fichier_statistiques (str | None) : Le fichier JSON Lines auquel sont ajoutées les informations de chaque
+                                                recherche, ou None.
 
         Interface :
             set_jeu(...) : Met à jour l'attribut 'self.plateau' et 'self.valeur_pion'.
-            joue() : Retourne un coup en suivant l'algorithme MinMax.
+            _cree_algorithme(...) : Retourne l'algorithme de recherche utilisé pour rechercher la position.
+            _informations_recherche() : Retourne les informations propres au bot ajoutées à 'derniere_recherche'.
+            _ecrit_statistiques(...) : Ajoute les informations de la dernière recherche à 'fichier_statistiques'.
+            _recherche_algorithme(...) : Effectue la recherche de la racine avec l'algorithme créé.
+            _recherche(...) : Retourne le meilleur coup, sa valeur et la variante principale pour une profondeur.
+            joue() : Retourne le coup du livre ou le meilleur coup trouvé par l'algorithme de recherche.
+            ferme() : Ferme le livre d'ouvertures ouvert par le bot.
     """
 
-    def __init__(self, nom: str | None = "MinMaxBot", profondeur: int | None = 3):
+    PROFONDEUR_MAX = 100
+
+    def __init__(self, nom: str, profondeur: int | None = 3, temps_max: float | None = None,
+                 fichier_livre: str | None = None, livre: LivreOuvertures | None = None,
+                 choix_livre: str | None = MEILLEUR, statistiques: bool | None = False,
+                 fichier_statistiques: str | None = None):
         super().__init__(nom)
         self.profondeur = profondeur
+        self.temps_max = temps_max
+        self.derniere_recherche = {}
+        self.noeuds = 0
+        self._score_precedent = None
+        self._limite_atteinte = True
+        self._livre_ouvert = livre is None and fichier_livre is not None
+        if self._livre_ouvert:
+            livre = LivreOuvertures(chemin=fichier_livre)
+        self.livre = livre
+        self.choix_livre = choix_livre
+        self._calcule_statistiques = statistiques or fichier_statistiques is not None
+        self.statistiques = None
+        self.fichier_statistiques = fichier_statistiques
+
+    def _cree_algorithme(self, profondeur: int, limite_temps: float | None):
+        raise NotImplementedError("Un bot abstrait ne possède pas d'algorithme de recherche")
+
+    def _recherche_algorithme(self, algorithme, coups: list):
+        """
+        Effectue la recherche de la racine avec l'algorithme de recherche créé pour la profondeur en cours.
+
+            Paramètres :
+                algorithme (MinMax | AlphaBeta) : L'algorithme de recherche.
+                coups (list) : Les coups de la racine, dans l'ordre où ils sont testés.
+
+            Retourne :
+                tuple : Le meilleur coup, sa valeur et la variante principale.
+        """
+        return algorithme.recherche_racine(coups=coups)
+
+    def _informations_recherche(self):
+        """
+        Retourne les informations propres au bot ajoutées à 'self.derniere_recherche' après chaque recherche.
+
+            Retourne :
+                dict : Les informations supplémentaires (aucune pour un bot de recherche quelconque).
+        """
+        return {}
+
+    def _ecrit_statistiques(self, coup: tuple):
+        """
+        Ajoute au fichier 'self.fichier_statistiques' une ligne JSON contenant le nom du bot, son pion, le numéro du
+        demi-coup, le coup joué et les informations de 'self.derniere_recherche'.
+
+            Paramètre :
+                coup (tuple) : Le coup joué.
+        """
+        ligne = {"nom": self.nom, "joueur": self.valeur_pion, "demi_coup": len(self.plateau.historique) + 1,
+                 "coup": coup, **self.derniere_recherche}
+        with open(self.fichier_statistiques, "a") as sortie:
+            sortie.write(json.dumps(ligne) + "\n")
+
+    def _recherche(self, coups: list, profondeur: int, limite_temps: float | None):
+        """
+        Recherche la position actuelle avec l'algorithme de recherche à la profondeur donnée, et conserve dans
+        'self._limite_atteinte' si la recherche a atteint sa profondeur maximale sur une position non terminale.
+
+            Paramètres :
+                coups (list) : La liste des coups de la racine, dans l'ordre où ils sont testés.
+                profondeur (int) : La profondeur de la recherche.
+                limite_temps (float | None) : L'instant après lequel la recherche est interrompue, ou None.
+
+            Retourne :
+                tuple : Le meilleur coup, sa valeur et la variante principale.
+        """
+        algorithme = self._cree_algorithme(profondeur=profondeur, limite_temps=limite_temps)
+        try:
+            return self._recherche_algorithme(algorithme=algorithme, coups=coups)
+        finally:
+            self.noeuds += algorithme.noeuds
+            self._limite_atteinte = algorithme.limite_atteinte
 
     def joue(self):
         """
-        Retourne un coup au hasard parmi les coups pouvant être joué, c'est-à-dire un couple aléatoire
-        (case_origne, case_destination) provenant des coups possibles du joueur.
+        Retourne le coup du livre d'ouvertures si la position y est présente, sinon le meilleur coup trouvé par
+        l'algorithme de recherche, c'est-à-dire le coup de valeur maximale pour le joueur blanc et de valeur minimale
+        pour le joueur noir, dont la variante principale est conservée dans 'self.derniere_recherche'.
 
             Retourne :
-                tuple : Retourne un tuple (case_origne, case_destination) aléatoire des coups possibles.
+                tuple : Retourne un tuple (case_origne, case_destination) du meilleur coup trouvé.
         """
-        valeurs_coups = {}
-        for coup in self.plateau.get_liste_coups_possible(joueur=self.valeur_pion):
-            self.plateau.joue(case_origine=coup[0], case_destination=coup[1])
-            minmax_algo = MinMax(plateau=self.plateau, profondeur=self.profondeur, joueur_actuel=self.valeur_pion)
-            valeurs_coups[coup] = minmax_algo.evaluate()
-            self.plateau.joue(coup[1], coup[0], True)
-        if self.valeur_pion == 1:
-            return max(valeurs_coups)
-        return min(valeurs_coups)
+        debut = perf_counter()
+        self.noeuds = 0
+        self.statistiques = StatistiquesRecherche() if self._calcule_statistiques else None
+        if self.livre is not None:
+            coup = self.livre.choisit(plateau=self.plateau, joueur=self.valeur_pion, choix=self.choix_livre)
+            if coup is not None:
+                self.derniere_recherche = {"profondeur": 0, "noeuds": 0, "temps": perf_counter() - debut,
+                                           "noeuds_par_seconde": 0.0, "livre": True, "score": None,
+                                           "variante": [coup]}
+                if self.fichier_statistiques is not None:
+                    self._ecrit_statistiques(coup=coup)
+                return coup
+        coups = self.plateau.get_liste_coups_possible(joueur=self.valeur_pion)
+        meilleur_coup = coups[0]
+        meilleur_score = None
+        variante = [meilleur_coup]
+        profondeur_atteinte = 0
+        if self.temps_max is None:
+            profondeurs = [self.profondeur]
+        else:
+            profondeurs = range(1, self.PROFONDEUR_MAX + 1)
+        longueur_historique = len(self.plateau.historique)
+        self._score_precedent = None
+        for profondeur in profondeurs:
+            # La profondeur 1 est toujours terminée pour disposer d'un coup évalué.
+            limite_temps = debut + self.temps_max if self.temps_max is not None and profondeur > 1 else None
+            try:
+                meilleur_coup, meilleur_score, variante = self._recherche(coups=coups, profondeur=profondeur,
+                                                                          limite_temps=limite_temps)
+            except TempsEcoule:
+                while len(self.plateau.historique) > longueur_historique:
+                    self.plateau.unmake_move_rapide(enregistrement=self.plateau.historique[-1])
+                break
+            self._score_precedent = meilleur_score
+            profondeur_atteinte = profondeur
+            if not self._limite_atteinte:  # l'arbre de jeu est entièrement exploré
+                break
+            if limite_temps is not None and perf_counter() > limite_temps:
+                break
+            coups = [meilleur_coup] + [coup for coup in coups if coup != meilleur_coup]
+        temps = perf_counter() - debut
+        self.derniere_recherche = {"profondeur": profondeur_atteinte, "noeuds": self.noeuds, "temps": temps,
+                                   "noeuds_par_seconde": self.noeuds / temps if temps > 0 else 0.0, "livre": False,
+                                   "score": meilleur_score, "variante": variante, **self._informations_recherche()}
+        if self.statistiques is not None:
+            self.derniere_recherche["statistiques"] = self.statistiques.en_dict()
+        if self.fichier_statistiques is not None:
+            self._ecrit_statistiques(coup=meilleur_coup)
+        return meilleur_coup
 
+    def ferme(self):
+        """
+        Ferme le livre d'ouvertures ouvert par le bot.
+        """
+        if self.livre is not None and self._livre_ouvert:
+            self.livre.ferme()
+            self.livre = None
+
+
+class MinMaxBot(BotRecherche):
+    """
+    Classe utilisée pour modéliser un bot jouant utilisant l'algorithme MinMax.
+
+        Attributs :
+            nom (str) : Le nom du joueur.
+            plateau (Board) : Le plateau de jeu sur lequel joue le bot.
+            valeur_pion (int) : La valeur du pion du joueur.
+            profondeur (int) : La hauteur du graphe des coups testés (le nombre de coups successifs à tester).
+            temps_max (float | None) : Le temps maximal en secondes accordé à la recherche d'un coup, ou None.
+            derniere_recherche (dict) : Les informations sur la recherche du dernier coup joué.
+            livre (LivreOuvertures | None) : Le livre d'ouvertures consulté avant chaque recherche, ou None.
+            choix_livre (str) : Le mode de choix des coups du livre, 'meilleur' ou 'aleatoire'.
+            statistiques (StatistiquesRecherche | None) : Les statistiques des recherches du dernier coup joué, ou None.
+            fichier_statistiques (str | None) : Le fichier JSON Lines des informations de chaque recherche, ou None.
+
+        Interface :
+            set_jeu(...) : Met à jour l'attribut 'self.plateau' et 'self.valeur_pion'.
+            joue() : Retourne un coup en suivant l'algorithme MinMax.
+            ferme() : Ferme le livre d'ouvertures ouvert par le bot.
+    """
+
+    def __init__(self, nom: str | None = "MinMaxBot", profondeur: int | None = 3, temps_max: float | None = None,
+                 fichier_livre: str | None = None, livre: LivreOuvertures | None = None,
+                 choix_livre: str | None = MEILLEUR, statistiques: bool | None = False,
+                 fichier_statistiques: str | None = None):
+        super().__init__(nom, profondeur=profondeur, temps_max=temps_max, fichier_livre=fichier_livre, livre=livre,
+                         choix_livre=choix_livre, statistiques=statistiques, fichier_statistiques=fichier_statistiques)
+
+    def _cree_algorithme(self, profondeur: int, limite_temps: float | None):
+        """
+        Retourne l'algorithme MinMax utilisé pour rechercher la position.
+
+            Paramètres :
+                profondeur (int) : La profondeur de la recherche.
+                limite_temps (float | None) : L'instant après lequel la recherche est interrompue, ou None.
+
+            Retourne :
+                MinMax : L'algorithme de recherche.
+        """
+        return MinMax(plateau=self.plateau, profondeur=profondeur, joueur_actuel=self.valeur_pion,
+                      limite_temps=limite_temps, statistiques=self.statistiques)
 
-class Albator(BasePlayer):
+
+class Albator(BotRecherche):
     """
     Classe utilisée pour modéliser un bot jouant utilisant l'algorithme AlphaBeta.
 
@@ -83,29 +299,344 @@ class Albator(BasePlayer):
             plateau (Board) : Le plateau de jeu sur lequel joue le bot.
             valeur_pion (int) : La valeur du pion du joueur.
             profondeur (int) : La hauteur du graphe des coups testés (le nombre de coups successifs à tester).
+            temps_max (float | None) : Le temps maximal en secondes accordé à la recherche d'un coup, ou None.
+            derniere_recherche (dict) : Les informations sur la recherche du dernier coup joué.
+            table (TableTransposition | None) : La table de transposition partagée par toutes les recherches de la
+                                                partie, ou None pour ne pas en utiliser. Avec plusieurs processus, la
+                                                table créée avec 'taille_table' est placée en mémoire partagée.
+            workers (int) : Le nombre de processus utilisés pour la recherche (1 pour une recherche séquentielle).
+            mode_parallele (str) : Le mode de parallélisation avec plusieurs processus, 'racine' (répartition des
+                                   coups de la racine) ou 'lazy_smp' (tous les processus recherchent tous les coups
+                                   dans un ordre différent en partageant la table de transposition).
+            ordonnanceur (OrdonnanceurCoups | None) : L'ordonnanceur des coups (prises, coup de la table, coups
+                                                      meurtriers et historique) conservé pendant toute la partie,
+                                                      ou None pour tester les coups dans l'ordre de leur génération.
+            quiescence (bool) : Si True, les feuilles sont évaluées par une recherche de quiescence (prises seules).
+            noeuds_quiescence_max (int) : Le nombre maximal de nœuds des recherches de quiescence de chaque recherche.
+            base_finales (BaseFinales | None) : La base de finales consultée par les recherches (ouverte à partir de
+                                                'fichier_finales' si donné), ou None pour ne pas en utiliser.
+            livre (LivreOuvertures | None) : Le livre d'ouvertures consulté avant chaque recherche (ouvert à partir de
+                                             'fichier_livre' si donné), ou None pour ne pas en utiliser.
+            choix_livre (str) : Le mode de choix des coups du livre, 'meilleur' ou 'aleatoire'.
+            pvs (bool) : Si True, les recherches suivent la variante PVS (fenêtre nulle pour les coups suivant le
+                         premier).
+            aspiration (bool) : Si True, lors de l'approfondissement itératif ('temps_max'), la racine est recherchée
+                                dans une fenêtre d'aspiration centrée sur sa valeur à la profondeur précédente
+                                (recherche séquentielle uniquement).
+            fenetre_aspiration (int) : La demi-largeur initiale des fenêtres d'aspiration.
+            compteurs (dict) : Les nombres de recherches à fenêtre nulle et d'aspiration et de nouvelles recherches
+                               de la recherche séquentielle du dernier coup joué (aussi ajoutés à
+                               'derniere_recherche').
+            statistiques (StatistiquesRecherche | None) : Les statistiques des recherches du dernier coup joué
+                                                          (additionnées sur les processus), ou None.
+            fichier_statistiques (str | None) : Le fichier JSON Lines des informations de chaque recherche, ou None.
 
         Interface :
             set_jeu(...) : Met à jour l'attribut 'self.plateau' et 'self.valeur_pion'.
             joue() : Retourne un coup en suivant l'algorithme AlphaBeta.
+            ferme() : Arrête les processus de la recherche parallèle, libère la table partagée et ferme la base de
+                      finales et le livre d'ouvertures ouverts par le bot.
     """
-    def __init__(self, nom: str | None = "Albator", profondeur: int | None = 3):
-        super().__init__(nom)
-        self.profondeur = profondeur
+    def __init__(self, nom: str | None = "Albator", profondeur: int | None = 3, temps_max: float | None = None,
+                 taille_table: float | None = None, table: TableTransposition | None = None,
+                 workers: int | None = 1, mode_parallele: str | None = RACINE, ordonne_coups: bool | None = False,
+                 quiescence: bool | None = False, noeuds_quiescence_max: int | None = 10000,
+                 fichier_finales: str | None = None, base_finales: BaseFinales | None = None,
+                 fichier_livre: str | None = None, livre: LivreOuvertures | None = None,
+                 choix_livre: str | None = MEILLEUR, pvs: bool | None = False, aspiration: bool | None = False,
+                 fenetre_aspiration: int | None = 2, statistiques: bool | None = False,
+                 fichier_statistiques: str | None = None):
+        super().__init__(nom, profondeur=profondeur, temps_max=temps_max, fichier_livre=fichier_livre, livre=livre,
+                         choix_livre=choix_livre, statistiques=statistiques, fichier_statistiques=fichier_statistiques)
+        assert workers >= 1, "Le nombre de processus doit être strictement positif !"
+        self.workers = workers
+        self.mode_parallele = mode_parallele
+        self._reserve = None
+        self._table_creee = table is None and taille_table is not None
+        if self._table_creee:
+            if workers > 1:
+                table = TableTransposition.cree_partagee(taille_mo=taille_table)
+            else:
+                table = TableTransposition(taille_mo=taille_table)
+        self.table = table
+        self.ordonnanceur = OrdonnanceurCoups() if ordonne_coups else None
+        self.quiescence = quiescence
+        self.noeuds_quiescence_max = noeuds_quiescence_max
+        self._base_finales_ouverte = base_finales is None and fichier_finales is not None
+        if self._base_finales_ouverte:
+            base_finales = BaseFinales(chemin=fichier_finales)
+        self.base_finales = base_finales
+        self.pvs = pvs
+        self.aspiration = aspiration
+        self.fenetre_aspiration = fenetre_aspiration
+        self.compteurs = dict.fromkeys(COMPTEURS_RECHERCHE, 0)
+
+    def _cree_algorithme(self, profondeur: int, limite_temps: float | None):
+        """
+        Retourne l'algorithme AlphaBeta utilisé pour rechercher la position.
+
+            Paramètres :
+                profondeur (int) : La profondeur de la recherche.
+                limite_temps (float | None) : L'instant après lequel la recherche est interrompue, ou None.
+
+            Retourne :
+                AlphaBeta : L'algorithme de recherche.
+        """
+        return AlphaBeta(plateau=self.plateau, profondeur=profondeur, joueur_actuel=self.valeur_pion, table=self.table,
+                         limite_temps=limite_temps, ordonnanceur=self.ordonnanceur, statistiques=self.statistiques,
+                         **self._options_algorithme())
+
+    def _options_algorithme(self):
+        """
+        Retourne les options de l'algorithme AlphaBeta communes à la recherche séquentielle et parallèle.
+
+            Retourne :
+                dict : Les paramètres nommés passés à AlphaBeta.
+        """
+        return {"quiescence": self.quiescence, "noeuds_quiescence_max": self.noeuds_quiescence_max,
+                "base_finales": self.base_finales, "pvs": self.pvs}
+
+    def _recherche_algorithme(self, algorithme: AlphaBeta, coups: list):
+        """
+        Effectue la recherche de la racine, dans une fenêtre d'aspiration centrée sur sa valeur à la profondeur
+        précédente si 'self.aspiration' est True et que cette valeur est connue, et ajoute les compteurs de la
+        recherche à 'self.compteurs'.
+
+            Paramètres :
+                algorithme (AlphaBeta) : L'algorithme de recherche.
+                coups (list) : Les coups de la racine, dans l'ordre où ils sont testés.
+
+            Retourne :
+                tuple : Le meilleur coup, sa valeur et la variante principale.
+        """
+        try:
+            if self.aspiration and self._score_precedent is not None:
+                return algorithme.recherche_racine(coups=coups, score_estime=self._score_precedent,
+                                                   fenetre=self.fenetre_aspiration)
+            return algorithme.recherche_racine(coups=coups)
+        finally:
+            for compteur in COMPTEURS_RECHERCHE:
+                self.compteurs[compteur] += getattr(algorithme, compteur)
 
     def joue(self):
         """
-        Retourne un coup au hasard parmi les coups pouvant être joué, c'est-à-dire un couple aléatoire
-        (case_origne, case_destination) provenant des coups possibles du joueur.
+        Retourne un coup en suivant l'algorithme AlphaBeta (voir 'BotRecherche.joue()').
 
             Retourne :
-                tuple : Retourne un tuple (case_origne, case_destination) aléatoire des coups possibles.
+                tuple : Retourne un tuple (case_origne, case_destination) du meilleur coup trouvé.
+        """
+        if self.ordonnanceur is not None:
+            self.ordonnanceur.nouvelle_recherche()
+        self.compteurs = dict.fromkeys(COMPTEURS_RECHERCHE, 0)
+        return super().joue()
+
+    def _informations_recherche(self):
+        """
+        Retourne les compteurs de recherches à fenêtre nulle et d'aspiration ajoutés à 'self.derniere_recherche'.
+
+            Retourne :
+                dict : Une copie de 'self.compteurs'.
+        """
+        return dict(self.compteurs)
+
+    def _recherche(self, coups: list, profondeur: int, limite_temps: float | None):
+        """
+        Recherche la position actuelle, en répartissant les coups de la racine entre plusieurs processus si
+        'self.workers' est supérieur à 1. Chaque processus reçoit sa propre copie du plateau et effectue une recherche
+        de la racine avec ses coups : en mode 'racine', le meilleur des résultats des processus ayant terminé est
+        retenu (le premier processus l'emportant en cas d'égalité), en mode 'lazy_smp', le résultat du premier
+        processus (dans l'ordre de création) ayant terminé sa recherche dans le temps imparti.
+        En mode 'racine', si le temps est écoulé avant que tous les processus aient terminé, le meilleur résultat des
+        processus ayant terminé n'est retenu que si le premier processus a terminé : il recherche le premier coup de
+        la racine (le meilleur coup de la profondeur précédente), et le coup retenu est alors ce coup ou un coup qui
+        lui est meilleur à cette profondeur. Sinon, 'TempsEcoule' est levée et le résultat de la profondeur précédente
+        est conservé.
+
+            Paramètres :
+                coups (list) : La liste des coups de la racine, dans l'ordre où ils sont testés.
+                profondeur (int) : La profondeur de la recherche.
+                limite_temps (float | None) : L'instant après lequel la recherche est interrompue, ou None.
+
+            Retourne :
+                tuple : Le meilleur coup, sa valeur et la variante principale.
         """
-        valeurs_coups = {}
-        for coup in self.plateau.get_liste_coups_possible(joueur=self.valeur_pion):
-            self.plateau.joue(case_origine=coup[0], case_destination=coup[1])
-            alphabeta_algo = AlphaBeta(plateau=self.plateau, profondeur=self.profondeur, joueur_actuel=self.valeur_pion)
-            valeurs_coups[coup] = alphabeta_algo.evaluate()
-            self.plateau.joue(coup[1], coup[0], True)
+        if self.workers == 1:
+            return super()._recherche(coups=coups, profondeur=profondeur, limite_temps=limite_temps)
+        if self._reserve is None:
+            self._reserve = ProcessPoolExecutor(max_workers=self.workers)
+        duree_max = max(0.0, limite_temps - perf_counter()) if limite_temps is not None else None
+        memoire = self.table.memoire if self.table is not None else None
+        nom_table = memoire.name if memoire is not None else None
+        taille_table = self.table.taille_mo if memoire is not None else None
+        taches = [self._reserve.submit(recherche_coups_racine, self.plateau, coups_processus, profondeur,
+                                       self.valeur_pion, duree_max, nom_table, taille_table,
+                                       self.ordonnanceur is not None, self._options_algorithme(),
+                                       self.statistiques is not None)
+                  for coups_processus in repartit_coups(coups=coups, workers=self.workers, mode=self.mode_parallele)]
+        resultats = []
+        self._limite_atteinte = False
+        for tache in taches:
+            resultat, noeuds, statistiques, limite_atteinte = tache.result()
+            self.noeuds += noeuds
+            self._limite_atteinte |= limite_atteinte
+            if statistiques is not None:
+                self.statistiques.fusionne(autres=statistiques)
+            if resultat is not None:
+                resultats.append(resultat)
+        premier_termine = taches[0].result()[0] is not None
+        if not resultats or (self.mode_parallele == RACINE and not premier_termine):
+            raise TempsEcoule()
+        if self.mode_parallele != RACINE:
+            return resultats[0]
         if self.valeur_pion == 1:
-            return max(valeurs_coups)
-        return min(valeurs_coups)
+            return max(resultats, key=lambda resultat_processus: resultat_processus[1])
+        return min(resultats, key=lambda resultat_processus: resultat_processus[1])
+
+    def ferme(self):
+        """
+        Arrête les processus de la recherche parallèle, libère la table de transposition partagée créée par le bot et
+        ferme la base de finales et le livre d'ouvertures ouverts par le bot.
+        """
+        if self._reserve is not None:
+            self._reserve.shutdown()
+            self._reserve = None
+        if self.table is not None and self.table.memoire is not None and self._table_creee:
+            self.table.ferme(libere=True)
+            self.table = None
+        if self.base_finales is not None and self._base_finales_ouverte:
+            self.base_finales.ferme()
+            self.base_finales = None
+        super().ferme()
+
+
+class MCTSBot(BasePlayer):
+    """
+    Classe utilisée pour modéliser un bot utilisant la recherche arborescente Monte-Carlo (UCT) : chaque coup est
+    choisi après 'playouts' simulations de parties aléatoires ou après 'temps_max' secondes (la première limite
+    atteinte arrête la recherche). Le sous-arbre de la position atteinte après le coup joué et la réponse de
+    l'adversaire est conservé pour la recherche suivante.
+    Avec plusieurs processus, chacun construit son propre arbre depuis la position actuelle (parallélisation à la
+    racine) et les visites des coups de la racine sont additionnées ; l'arbre n'est alors pas réutilisé.
+
+        Attributs :
+            nom (str) : Le nom du joueur.
+            plateau (Board) : Le plateau de jeu sur lequel joue le bot.
+            valeur_pion (int) : La valeur du pion du joueur.
+            playouts (int | None) : Le nombre de simulations effectuées pour choisir un coup, ou None pour ne limiter
+                                    que le temps.
+            temps_max (float | None) : Le temps maximal en secondes accordé à la recherche d'un coup, ou None.
+            constante_uct (float) : La constante d'exploration de la formule UCT.
+            reutilise_arbre (bool) : Si True, l'arbre de la recherche précédente est réutilisé quand c'est possible.
+            workers (int) : Le nombre de processus effectuant les simulations (1 pour une recherche séquentielle).
+            derniere_recherche (dict) : Les informations sur la recherche du dernier coup joué (simulations, temps,
+                                        simulations par seconde, nœuds de l'arbre, octets par nœud et nombre de
+                                        simulations de l'arbre réutilisé).
+
+        Interface :
+            set_jeu(...) : Met à jour l'attribut 'self.plateau' et 'self.valeur_pion'.
+            joue() : Retourne le coup le plus visité par la recherche Monte-Carlo.
+            ferme() : Arrête les processus de la recherche parallèle.
+    """
+
+    def __init__(self, nom: str | None = "MCTSBot", playouts: int | None = 1000, temps_max: float | None = None,
+                 constante_uct: float = math.sqrt(2), reutilise_arbre: bool | None = True,
+                 workers: int | None = 1):
+        super().__init__(nom)
+        assert playouts is not None or temps_max is not None, "La recherche doit être limitée !"
+        assert workers >= 1, "Le nombre de processus doit être strictement positif !"
+        self.playouts = playouts
+        self.temps_max = temps_max
+        self.constante_uct = constante_uct
+        self.reutilise_arbre = reutilise_arbre
+        self.workers = workers
+        self.derniere_recherche = {}
+        self._reserve = None
+        self._arbre = None
+
+    def _racine_reutilisee(self):
+        """
+        Retourne le nœud de la position actuelle dans l'arbre conservé après le coup précédent du bot, si les deux
+        derniers coups joués sont ce coup puis une réponse de l'adversaire déjà essayée dans l'arbre.
+
+            Retourne :
+                NoeudMCTS | None : Le nœud de la position actuelle, ou None.
+        """
+        if self._arbre is None:
+            return None
+        noeud, cle = self._arbre
+        self._arbre = None
+        historique = self.plateau.historique
+        if len(historique) < 2 or historique[-2][0] != noeud.coup or historique[-2][-1] != cle:
+            return None
+        for enfant in noeud.enfants:
+            if enfant.coup == historique[-1][0]:
+                return enfant
+        return None
+
+    def _recherche_parallele(self, limite_temps: float | None):
+        """
+        Effectue les simulations dans plusieurs processus et additionne les statistiques des coups de la racine.
+
+            Paramètre :
+                limite_temps (float | None) : L'instant de fin de la recherche, ou None.
+
+            Retourne :
+                tuple : Le dictionnaire {coup: (visites, score), ...}, le nombre de simulations, le nombre de nœuds et
+                        la mémoire qu'ils occupent en octets.
+        """
+        if self._reserve is None:
+            self._reserve = ProcessPoolExecutor(max_workers=self.workers)
+        duree_max = max(0.0, limite_temps - perf_counter()) if limite_temps is not None else None
+        playouts = -(-self.playouts // self.workers) if self.playouts is not None else None
+        taches = [self._reserve.submit(recherche_processus, self.plateau, self.valeur_pion, playouts, duree_max,
+                                       self.constante_uct, random.getrandbits(64))
+                  for _ in range(self.workers)]
+        statistiques = {}
+        total_playouts = noeuds = octets = 0
+        for tache in as_completed(taches):
+            statistiques_processus, playouts_processus, noeuds_processus, octets_processus = tache.result()
+            for coup, (visites, score) in statistiques_processus.items():
+                visites_totales, score_total = statistiques.get(coup, (0, 0.0))
+                statistiques[coup] = (visites_totales + visites, score_total + score)
+            total_playouts += playouts_processus
+            noeuds += noeuds_processus
+            octets += octets_processus
+        return statistiques, total_playouts, noeuds, octets
+
+    def joue(self):
+        """
+        Retourne le coup le plus visité par la recherche Monte-Carlo depuis la position actuelle.
+
+            Retourne :
+                tuple : Retourne un tuple (case_origne, case_destination) du coup choisi.
+        """
+        debut = perf_counter()
+        limite_temps = debut + self.temps_max if self.temps_max is not None else None
+        racine = self._racine_reutilisee() if self.reutilise_arbre else None
+        playouts_reutilises = racine.visites if racine is not None else 0
+        if self.workers == 1:
+            mcts = MCTS(plateau=self.plateau, joueur_actuel=self.valeur_pion, constante_uct=self.constante_uct,
+                        racine=racine)
+            mcts.recherche(playouts=self.playouts, limite_temps=limite_temps)
+            coup = mcts.meilleur_coup()
+            playouts = mcts.playouts
+            noeuds, octets = mcts.memoire()
+            if self.reutilise_arbre:
+                self._arbre = (mcts.enfant(coup=coup), self.plateau.cle)
+        else:
+            statistiques, playouts, noeuds, octets = self._recherche_parallele(limite_temps=limite_temps)
+            coup = max(statistiques, key=lambda coup_racine: statistiques[coup_racine][0])
+        temps = perf_counter() - debut
+        self.derniere_recherche = {"playouts": playouts, "temps": temps,
+                                   "playouts_par_seconde": playouts / temps if temps > 0 else 0.0,
+                                   "noeuds": noeuds, "octets_par_noeud": octets / noeuds if noeuds else 0.0,
+                                   "playouts_reutilises": playouts_reutilises}
+        return coup
+
+    def ferme(self):
+        """
+        Arrête les processus de la recherche parallèle.
+        """
+        if self._reserve is not None:
+            self._reserve.shutdown()
+            self._reserve = None
@@ -1 +1,7 @@
 # Contiendra toutes les fonctions utilitaires
+
+
+class TempsEcoule(Exception):
+    """
+    Exception levée par un algorithme de recherche lorsque le temps qui lui est accordé est écoulé.
+    """
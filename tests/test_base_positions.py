@@ -0,0 +1,68 @@
+# Tests du fichier binaire de positions (écriture en ajout, lecture mmap).
+# Lancement depuis la racine du dépôt : python -m unittest
+import os
+import tempfile
+import unittest
+
+from src.game_engine.board import Board
+
+try:
+    import numpy as np
+    from src.game_engine.base_positions import EcrivainPositions, LecteurPositions
+except ImportError:  # NumPy n'est pas installé
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestLecteurPositions(unittest.TestCase):
+    """
+    Vérifie la relecture des positions écrites et la fermeture du lecteur, avec ou sans vues encore utilisées.
+    """
+
+    def setUp(self):
+        descripteur, self.chemin = tempfile.mkstemp(suffix=".bin")
+        os.close(descripteur)
+        os.remove(self.chemin)
+        self.plateaux = []
+        plateau = Board(taille=8)
+        ecrivain = EcrivainPositions(chemin=self.chemin)
+        for _ in range(5):
+            coup = plateau.get_liste_coups_possible(joueur=plateau.trait)[0]
+            ecrivain.ajoute(plateau=plateau, resultat=1, coup=coup)
+            self.plateaux.append((plateau.cle, coup))
+            plateau.make_move(coup=coup)
+        ecrivain.ferme()
+
+    def tearDown(self):
+        os.remove(self.chemin)
+
+    def test_relecture(self):
+        with LecteurPositions(chemin=self.chemin) as lecteur:
+            self.assertEqual(len(lecteur), len(self.plateaux))
+            for i, (cle, coup) in enumerate(self.plateaux):
+                self.assertEqual(lecteur.plateau(indice=i).cle, cle)
+                self.assertEqual(lecteur.coup(indice=i), coup)
+
+    def test_fermeture_sans_vue(self):
+        lecteur = LecteurPositions(chemin=self.chemin)
+        self.assertEqual(int(lecteur[0]["resultat"]), 1)
+        self.assertTrue(lecteur.ferme())
+        self.assertIsNone(lecteur.enregistrements)
+        self.assertTrue(lecteur.ferme())
+
+    def test_fermeture_avec_vues(self):
+        # La sortie du bloc 'with' ne lève pas de BufferError malgré la vue encore référencée.
+        with LecteurPositions(chemin=self.chemin) as lecteur:
+            vue = lecteur[1:3]
+            copie = np.copy(lecteur[1:3])
+        self.assertIsNone(lecteur.enregistrements)
+        self.assertEqual(copie["cle"].tolist(), [cle for cle, _ in self.plateaux[1:3]])
+        del vue
+        lecteur = LecteurPositions(chemin=self.chemin)
+        enregistrement = lecteur[0]
+        self.assertFalse(lecteur.ferme())
+        del enregistrement
+
+
+if __name__ == "__main__":
+    unittest.main()
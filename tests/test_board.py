@@ -0,0 +1,287 @@
+# Vérification de la génération des coups du plateau (bitboards) : valeurs de référence de perft et parties aléatoires
+# comparées au plateau de référence à base de dictionnaire (implémentation antérieure aux bitboards).
+# Lancement depuis la racine du dépôt : python -m unittest
+import random
+import unittest
+
+from src.game_engine.board import Board
+
+
+# Nombre de suites de coups depuis la position de départ de chaque taille de plateau, pour les profondeurs 1, 2, ...
+# (valeurs calculées avec l'implémentation du plateau à base de dictionnaire, antérieure aux bitboards).
+REFERENCES_PERFT = {
+    4: (3, 9, 16, 29, 41, 62, 65, 57, 37, 0),
+    6: (5, 25, 141, 770, 4222, 22223, 114894),
+    8: (7, 49, 379, 2872, 23582, 189143, 1585096),
+    10: (9, 81, 793, 7654, 79010, 801609)
+}
+
+
+class PlateauReference:
+    """
+    Plateau de référence reprenant les règles de l'implémentation à base de dictionnaire antérieure aux bitboards :
+    les coups possibles sont recalculés en parcourant toutes les cases après chaque coup.
+
+        Attributs :
+            taille (int) : Taille du plateau.
+            cases (dict) : Le dictionnaire {(x, y): valeur, ...} des cases du plateau.
+            coups_possible (dict) : Les coups possibles de chaque joueur {case_origine: [case_destination, ...], ...}.
+
+        Interface :
+            get_liste_coups_possible(...) : Retourne les coups possibles d'un joueur sous forme de liste.
+            nombre_pions(...) : Retourne le nombre de pions d'un joueur.
+            etat() : Retourne l'état du plateau, c'est-à-dire si un joueur a gagné ou non.
+            joue(...) : Applique un coup (ou l'annule avec 'coup_inverse').
+    """
+
+    def __init__(self, taille: int):
+        self.taille = taille
+        self.cases = {}
+        for i in range(taille):
+            for j in range(taille):
+                if (0 <= i <= (((taille - 2) // 2) - 1)) and ((j + (i % 2)) % 2):
+                    self.cases[(i, j)] = -1
+                elif (i >= ((taille // 2) + 1)) and ((j + (i % 2)) % 2):
+                    self.cases[(i, j)] = 1
+                else:
+                    self.cases[(i, j)] = 0
+        self.coups_possible = {1: {}, -1: {}}
+        self._update_coups_possible()
+
+    def _etat_case(self, case: tuple):
+        if 0 <= case[0] < self.taille and 0 <= case[1] < self.taille:
+            return self.cases[case]
+        return None
+
+    def _update_coups_possible(self):
+        for joueur in (1, -1):
+            coups = {}
+            for case, valeur_case in self.cases.items():
+                if valeur_case != joueur:
+                    continue
+                destinations = []
+                for dy in (-1, 1):
+                    voisine = (case[0] - joueur, case[1] + dy)
+                    saut = (voisine[0] - joueur, voisine[1] + dy)
+                    etat_voisine = self._etat_case(case=voisine)
+                    if etat_voisine == 0:
+                        destinations.append(voisine)
+                    elif etat_voisine == -joueur and self._etat_case(case=saut) == 0:
+                        destinations.append(saut)
+                if destinations:
+                    coups[case] = destinations
+            self.coups_possible[joueur] = coups
+
+    def get_liste_coups_possible(self, joueur: int):
+        return [(origine, destination) for origine, destinations in self.coups_possible[joueur].items()
+                for destination in destinations]
+
+    def nombre_pions(self, joueur: int):
+        return sum(1 for valeur in self.cases.values() if valeur == joueur)
+
+    def etat(self):
+        blancs_mobiles = len(self.coups_possible[1]) > 0
+        noirs_mobiles = len(self.coups_possible[-1]) > 0
+        if not blancs_mobiles and not noirs_mobiles:
+            return 0
+        if self.nombre_pions(joueur=1) <= 0 or not blancs_mobiles:
+            return -1
+        if self.nombre_pions(joueur=-1) <= 0 or not noirs_mobiles:
+            return 1
+        return None
+
+    def joue(self, case_origine: tuple, case_destination: tuple, coup_inverse: bool | None = False):
+        valeur = self.cases[case_origine]
+        self.cases[case_destination] = valeur
+        self.cases[case_origine] = 0
+        if abs(case_destination[0] - case_origine[0]) == 2:
+            case_milieu = ((case_origine[0] + case_destination[0]) // 2, (case_origine[1] + case_destination[1]) // 2)
+            self.cases[case_milieu] = -valeur if coup_inverse else 0
+        self._update_coups_possible()
+
+    def perft(self, profondeur: int, joueur: int):
+        if profondeur == 0:
+            return 1
+        if self.etat() is not None:
+            return 0
+        noeuds = 0
+        for origine, destination in self.get_liste_coups_possible(joueur=joueur):
+            self.joue(case_origine=origine, case_destination=destination)
+            noeuds += self.perft(profondeur=profondeur - 1, joueur=-joueur)
+            self.joue(case_origine=destination, case_destination=origine, coup_inverse=True)
+        return noeuds
+
+
+def perft_codes(plateau: Board, profondeur: int, tampons: list):
+    """
+    Perft utilisant le chemin des recherches : coups codés écrits par 'remplit_coups(...)' dans un tampon par ply,
+    joués avec 'make_move_code(...)' et annulés avec 'unmake_move_rapide(...)'.
+
+        Paramètres :
+            plateau (Board) : Le plateau.
+            profondeur (int) : Le nombre de coups successifs.
+            tampons (list) : Les tampons de coups, un par ply restant.
+
+        Retourne :
+            int : Le nombre de suites de coups.
+    """
+    if profondeur == 0:
+        return 1
+    if plateau.etat() is not None:
+        return 0
+    tampon = tampons[profondeur]
+    nombre = plateau.remplit_coups(joueur=plateau.trait, tampon=tampon)
+    if profondeur == 1:
+        return nombre
+    noeuds = 0
+    for i in range(nombre):
+        enregistrement = plateau.make_move_code(code=tampon[i])
+        noeuds += perft_codes(plateau=plateau, profondeur=profondeur - 1, tampons=tampons)
+        plateau.unmake_move_rapide(enregistrement=enregistrement)
+    return noeuds
+
+
+class TestPerft(unittest.TestCase):
+    """
+    Compare perft depuis la position de départ aux valeurs de référence, avec la génération des coups de l'interface
+    ('get_liste_coups_possible(...)' et 'joue(...)') et avec celle des recherches (tampons de codes entiers).
+    """
+
+    def test_references(self):
+        for taille, references in REFERENCES_PERFT.items():
+            plateau = Board(taille=taille)
+            for profondeur, reference in enumerate(references, start=1):
+                with self.subTest(taille=taille, profondeur=profondeur):
+                    self.assertEqual(plateau.perft(profondeur=profondeur), reference)
+
+    def test_references_coups_codes(self):
+        for taille, references in REFERENCES_PERFT.items():
+            plateau = Board(taille=taille)
+            tampons = [[0] * plateau.tables.coups_max for _ in range(len(references) + 1)]
+            for profondeur, reference in enumerate(references, start=1):
+                with self.subTest(taille=taille, profondeur=profondeur):
+                    self.assertEqual(perft_codes(plateau=plateau, profondeur=profondeur, tampons=tampons), reference)
+            self.assertEqual(plateau.historique, [])
+
+    def test_plateau_reference(self):
+        for taille in (4, 6, 8, 10):
+            with self.subTest(taille=taille):
+                self.assertEqual(PlateauReference(taille=taille).perft(profondeur=4, joueur=1),
+                                 REFERENCES_PERFT[taille][3])
+
+    def test_divise(self):
+        for taille, references in REFERENCES_PERFT.items():
+            with self.subTest(taille=taille):
+                self.assertEqual(sum(Board(taille=taille).perft(profondeur=4, divise=True).values()), references[3])
+
+
+class TestPartiesAleatoires(unittest.TestCase):
+    """
+    Joue des parties aléatoires, avec des coups annulés, simultanément sur le plateau et sur le plateau de référence,
+    et vérifie après chaque coup les cases, les coups possibles (ordre compris), le nombre de pions, l'état, la clé de
+    Zobrist et les chemins rapides des recherches ('remplit_coups(...)', 'make_move_rapide(...)' et
+    'make_move_code(...)').
+    """
+
+    NOMBRE_PARTIES = 60
+
+    def verifie_position(self, plateau: Board, reference: PlateauReference):
+        self.assertEqual(dict(plateau.get_cases()), reference.cases)
+        self.assertEqual(plateau.etat(), reference.etat())
+        self.assertTrue(plateau.verifie_hash())
+        tables = plateau.tables
+        tampon = [0] * tables.coups_max
+        for joueur in (1, -1):
+            coups = plateau.get_liste_coups_possible(joueur=joueur)
+            self.assertEqual(coups, reference.get_liste_coups_possible(joueur=joueur))
+            self.assertEqual(plateau.get_nombre_pions(joueur=joueur), reference.nombre_pions(joueur=joueur))
+            self.assertEqual(plateau.a_des_coups(joueur=joueur), bool(coups))
+            prises = [coup for coup in coups if abs(coup[1][0] - coup[0][0]) == 2]
+            nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon)
+            codes = [tables.coups_codes[code] for code in tampon[:nombre]]
+            self.assertEqual(codes, prises + [coup for coup in coups if coup not in prises])
+            nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon, prises_seules=True)
+            self.assertEqual([tables.coups_codes[code] for code in tampon[:nombre]], prises)
+            if coups:
+                (x_origine, y_origine), (x_destination, y_destination) = coup = coups[-1]
+                prioritaire = (x_origine * plateau.taille + y_origine, x_destination * plateau.taille + y_destination)
+                nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=prioritaire)
+                self.assertEqual(tables.coups_codes[tampon[0]], coup)
+                self.assertEqual(sorted(tampon[:nombre]), sorted(tables.codes_coups[c] for c in coups))
+                # Génération par étapes : les déplacements écrits à la suite donnent les mêmes coups dans le même ordre.
+                attendus = tampon[:nombre]
+                nombre = plateau.remplit_coups(joueur=joueur, tampon=tampon, coup_prioritaire=prioritaire,
+                                               prises_seules=True)
+                nombre = plateau.remplit_deplacements(joueur=joueur, tampon=tampon, debut=nombre, exclu=tampon[0])
+                self.assertEqual(tampon[:nombre], attendus)
+
+    @staticmethod
+    def etat_plateau(plateau: Board):
+        # Les listes des bitboards des coups possibles sont copiées : elles sont réécrites à chaque coup et annulation.
+        return (dict(plateau.pions), {joueur: list(masques) for joueur, masques in plateau.masques_coups.items()},
+                plateau.resultat, plateau.cle, plateau.trait)
+
+    def verifie_chemins_rapides(self, plateau: Board):
+        attendu = self.etat_plateau(plateau=plateau)
+        for coup in plateau.get_liste_coups_possible(joueur=plateau.trait):
+            apres = []
+            for joue in (plateau.make_move, plateau.make_move_rapide,
+                         lambda coup: plateau.make_move_code(code=plateau.tables.codes_coups[coup])):
+                enregistrement = joue(coup)
+                apres.append((self.etat_plateau(plateau=plateau), dict(plateau.nombre_pions)))
+                plateau.unmake_move_rapide(enregistrement=enregistrement)
+                self.assertEqual(self.etat_plateau(plateau=plateau), attendu)
+            self.assertEqual(apres[0], apres[1])
+            self.assertEqual(apres[0], apres[2])
+
+    def test_parties_aleatoires(self):
+        rng = random.Random(0)
+        for partie in range(self.NOMBRE_PARTIES):
+            taille = (4, 6, 8, 10)[partie % 4]
+            plateau = Board(taille=taille)
+            reference = PlateauReference(taille=taille)
+            joues = []
+            with self.subTest(partie=partie, taille=taille):
+                while plateau.etat() is None:
+                    self.verifie_chemins_rapides(plateau=plateau)
+                    coup = rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait))
+                    plateau.make_move(coup=coup)
+                    reference.joue(case_origine=coup[0], case_destination=coup[1])
+                    joues.append(coup)
+                    if rng.random() < 0.25:
+                        coup = joues.pop()
+                        plateau.unmake_move(enregistrement=plateau.historique[-1])
+                        reference.joue(case_origine=coup[1], case_destination=coup[0], coup_inverse=True)
+                    self.verifie_position(plateau=plateau, reference=reference)
+                self.assertEqual(len(plateau.historique), len(joues))
+
+    def test_coups_inverses(self):
+        rng = random.Random(1)
+        for taille in (6, 8, 10):
+            plateau = Board(taille=taille)
+            reference = PlateauReference(taille=taille)
+            joues = []
+            with self.subTest(taille=taille):
+                while plateau.etat() is None:
+                    coup = rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait))
+                    plateau.joue(case_origine=coup[0], case_destination=coup[1])
+                    reference.joue(case_origine=coup[0], case_destination=coup[1])
+                    joues.append(coup)
+                    self.verifie_position(plateau=plateau, reference=reference)
+                while joues:
+                    coup = joues.pop()
+                    plateau.joue(case_origine=coup[1], case_destination=coup[0], coup_inverse=True)
+                    reference.joue(case_origine=coup[1], case_destination=coup[0], coup_inverse=True)
+                    self.verifie_position(plateau=plateau, reference=reference)
+                self.assertEqual(plateau.cle, Board(taille=taille).cle)
+
+    def test_cases_lecture_seule(self):
+        plateau = Board(taille=8)
+        with self.assertRaises(TypeError):
+            plateau.cases[(0, 1)] = 0
+        with self.assertRaises(TypeError):
+            plateau.get_cases()[(0, 1)] = 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# Tests de l'évaluation vectorisée d'un lot de plateaux comparée à l'évaluation de référence.
+# Lancement depuis la racine du dépôt : python -m unittest
+import random
+import unittest
+
+from src.game_engine.board import Board, TAILLES_VALIDES
+
+try:
+    import numpy as np
+    from src.game_engine.encodage import decode_plateau, encode_plateaux
+    from src.players.bots.algorithms.evaluation import criteres_lot, criteres_plateau, evalue_lot, evalue_plateau
+except ImportError:  # NumPy n'est pas installé
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestEvaluationVectorisee(unittest.TestCase):
+    """
+    Vérifie, pour chaque taille de plateau, que l'évaluation vectorisée d'un lot donne les mêmes critères et les mêmes
+    valeurs que l'évaluation de référence, sur des positions de parties aléatoires et sur des positions aléatoires
+    (pions placés au hasard sur les cases jouables, parties terminées comprises).
+    """
+
+    NOMBRE_POSITIONS = 200
+
+    @staticmethod
+    def positions_parties(taille: int, nombre: int, rng: random.Random):
+        plateaux = []
+        plateau = Board(taille=taille)
+        while len(plateaux) < nombre:
+            if plateau.etat() is not None:
+                plateau = Board(taille=taille)
+            plateaux.append(Board.depuis_bitboards(taille=taille, blancs=plateau.pions[1], noirs=plateau.pions[-1],
+                                                   trait=plateau.trait))
+            plateau.make_move(coup=rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait)))
+        return plateaux
+
+    @staticmethod
+    def positions_aleatoires(taille: int, nombre: int, rng: random.Random):
+        cases_jouables = [x * taille + y for x in range(taille) for y in range(taille) if (x + y) % 2]
+        plateaux = []
+        for _ in range(nombre):
+            cases = rng.sample(cases_jouables, rng.randint(0, len(cases_jouables)))
+            nombre_blancs = rng.randint(0, len(cases))
+            plateaux.append(Board.depuis_bitboards(taille=taille, blancs=sum(1 << i for i in cases[:nombre_blancs]),
+                                                   noirs=sum(1 << i for i in cases[nombre_blancs:]),
+                                                   trait=rng.choice((1, -1))))
+        return plateaux
+
+    def verifie_lot(self, plateaux: list):
+        cases = encode_plateaux(plateaux=plateaux)
+        criteres = criteres_lot(cases=cases)
+        valeurs = evalue_lot(cases=cases)
+        self.assertEqual(criteres.shape, (len(plateaux), 4))
+        for i, plateau in enumerate(plateaux):
+            self.assertEqual(criteres[i].tolist(), criteres_plateau(plateau=plateau))
+            self.assertEqual(int(valeurs[i]), evalue_plateau(plateau=plateau))
+            self.assertEqual(decode_plateau(cases=cases[i]).pions, plateau.pions)
+
+    def test_parties_aleatoires(self):
+        rng = random.Random(0)
+        for taille in TAILLES_VALIDES:
+            with self.subTest(taille=taille):
+                self.verifie_lot(plateaux=self.positions_parties(taille=taille, nombre=self.NOMBRE_POSITIONS, rng=rng))
+
+    def test_positions_aleatoires(self):
+        rng = random.Random(1)
+        for taille in TAILLES_VALIDES:
+            with self.subTest(taille=taille):
+                self.verifie_lot(plateaux=self.positions_aleatoires(taille=taille, nombre=self.NOMBRE_POSITIONS,
+                                                                    rng=rng))
+
+
+if __name__ == "__main__":
+    unittest.main()
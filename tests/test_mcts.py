@@ -0,0 +1,87 @@
+# Tests des simulations de la recherche Monte-Carlo comparées au plateau.
+# Lancement depuis la racine du dépôt : python -m unittest
+import random
+import unittest
+
+from src.game_engine.board import Board, TAILLES_VALIDES
+from src.players.bots.algorithms.mcts import simule
+
+
+class AleaPlateau:
+    """
+    Générateur aléatoire remplaçant celui de 'simule(...)' : à chaque tirage d'un coup parmi 'total', vérifie que le
+    plateau suivant la simulation a exactement 'total' coups possibles, puis y joue le coup tiré. Les coups sont
+    numérotés dans l'ordre de 'simule(...)' : déplacements à gauche, déplacements à droite, prises à gauche puis
+    prises à droite, chaque groupe par indice de case d'origine croissant.
+    """
+
+    def __init__(self, test: unittest.TestCase, plateau: Board, rng: random.Random):
+        self.test = test
+        self.plateau = plateau
+        self.rng = rng
+        self.coups_joues = 0
+
+    def ordre(self, coup: tuple):
+        (x_origine, y_origine), (x_destination, y_destination) = coup
+        prise = abs(x_destination - x_origine) == 2
+        return prise, y_destination > y_origine, x_origine * self.plateau.taille + y_origine
+
+    def randrange(self, total: int):
+        plateau = self.plateau
+        self.test.assertIsNone(plateau.etat())
+        coups = sorted(plateau.get_liste_coups_possible(joueur=plateau.trait), key=self.ordre)
+        self.test.assertEqual(total, len(coups))
+        r = self.rng.randrange(total)
+        plateau.make_move(coup=coups[r])
+        self.coups_joues += 1
+        return r
+
+
+class TestSimulation(unittest.TestCase):
+    """
+    Vérifie, pour chaque taille de plateau, que les simulations jouées directement sur les bitboards suivent les coups
+    possibles de 'Board.get_liste_coups_possible(...)' à chaque coup et se terminent avec le résultat de
+    'Board.etat()', à partir de positions de parties aléatoires et de positions aléatoires.
+    """
+
+    NOMBRE_POSITIONS = 60
+
+    def verifie_simulation(self, plateau: Board, rng: random.Random):
+        alea = AleaPlateau(test=self, plateau=plateau, rng=rng)
+        resultat = simule(taille=plateau.taille, blancs=plateau.pions[1], noirs=plateau.pions[-1],
+                          joueur=plateau.trait, alea=alea)
+        self.assertIsNotNone(plateau.etat())
+        self.assertEqual(resultat, plateau.etat())
+        return alea.coups_joues
+
+    def test_parties_aleatoires(self):
+        rng = random.Random(0)
+        for taille in TAILLES_VALIDES:
+            with self.subTest(taille=taille):
+                coups_joues = 0
+                for _ in range(self.NOMBRE_POSITIONS):
+                    plateau = Board(taille=taille)
+                    for _ in range(rng.randint(0, 4 * taille)):
+                        if plateau.etat() is not None:
+                            break
+                        plateau.make_move(coup=rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait)))
+                    coups_joues += self.verifie_simulation(plateau=Board.depuis_bitboards(
+                        taille=taille, blancs=plateau.pions[1], noirs=plateau.pions[-1], trait=plateau.trait), rng=rng)
+                self.assertGreater(coups_joues, 0)
+
+    def test_positions_aleatoires(self):
+        rng = random.Random(1)
+        for taille in TAILLES_VALIDES:
+            cases_jouables = [x * taille + y for x in range(taille) for y in range(taille) if (x + y) % 2]
+            with self.subTest(taille=taille):
+                for _ in range(self.NOMBRE_POSITIONS):
+                    cases = rng.sample(cases_jouables, rng.randint(0, len(cases_jouables)))
+                    nombre_blancs = rng.randint(0, len(cases))
+                    plateau = Board.depuis_bitboards(taille=taille, blancs=sum(1 << i for i in cases[:nombre_blancs]),
+                                                     noirs=sum(1 << i for i in cases[nombre_blancs:]),
+                                                     trait=rng.choice((1, -1)))
+                    self.verifie_simulation(plateau=plateau, rng=rng)
+
+
+if __name__ == "__main__":
+    unittest.main()
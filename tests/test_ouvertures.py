@@ -0,0 +1,130 @@
+# Tests du livre d'ouvertures (construction à partir de parties JSONL, recherche dichotomique dans le fichier projeté
+# en mémoire et choix du coup).
+# Lancement depuis la racine du dépôt : python -m unittest
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from src.game_engine.board import Board
+from src.players.bots.algorithms.ouvertures import (ALEATOIRE, FORMAT_ENTETE, FORMAT_ENTREE, MEILLEUR, SIGNATURE,
+                                                    VERSION, LivreOuvertures, construit_livre)
+
+
+class TestLivreOuvertures(unittest.TestCase):
+    """
+    Vérifie qu'un livre construit à partir de parties aléatoires contient les statistiques de chaque coup joué, que la
+    recherche dichotomique trouve les entrées d'une clé (première et dernière entrées du livre comprises) et aucune
+    entrée pour une clé absente ou un livre vide, et le choix du coup selon le mode MEILLEUR ou ALEATOIRE.
+    """
+
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.livres = []
+
+    def tearDown(self):
+        for livre in self.livres:
+            livre.ferme()
+        self.dossier.cleanup()
+
+    def ouvre(self, chemin: str, parties_min: int | None = 1):
+        livre = LivreOuvertures(chemin=chemin, parties_min=parties_min)
+        self.livres.append(livre)
+        return livre
+
+    def ecrit_livre(self, taille: int, entrees: list):
+        """
+        Écrit directement un livre dont les entrées (cle, origine, destination, parties, victoires, nulles) sont
+        données triées, et retourne le livre ouvert.
+        """
+        chemin = os.path.join(self.dossier.name, "livre_ecrit.bin")
+        with open(chemin, "wb") as fichier:
+            fichier.write(FORMAT_ENTETE.pack(SIGNATURE, VERSION, taille, len(entrees)))
+            for entree in entrees:
+                fichier.write(FORMAT_ENTREE.pack(*entree))
+        return self.ouvre(chemin=chemin)
+
+    def test_construction(self):
+        rng = random.Random(0)
+        taille, coups_max = 6, 8
+        chemin_parties = os.path.join(self.dossier.name, "parties.jsonl")
+        attendu = {}
+        with open(chemin_parties, "w", encoding="utf-8") as parties:
+            for _ in range(40):
+                plateau = Board(taille=taille)
+                coups = []
+                while plateau.etat() is None:
+                    coups.append(rng.choice(plateau.get_liste_coups_possible(joueur=plateau.trait)))
+                    plateau.make_move(coup=coups[-1])
+                gagnant = plateau.etat()
+                parties.write(json.dumps({"taille": taille, "gagnant": gagnant,
+                                          "coups": [[list(origine), list(destination)]
+                                                    for origine, destination in coups]}) + "\n")
+                plateau = Board(taille=taille)
+                for (x_origine, y_origine), (x_destination, y_destination) in coups[:coups_max]:
+                    statistiques = attendu.setdefault(plateau.cle, {}).setdefault(
+                        (x_origine * taille + y_origine, x_destination * taille + y_destination), [0, 0, 0])
+                    statistiques[0] += 1
+                    statistiques[1] += gagnant == plateau.trait
+                    statistiques[2] += gagnant == 0
+                    plateau.make_move(coup=((x_origine, y_origine), (x_destination, y_destination)))
+        chemin = os.path.join(self.dossier.name, "livre.bin")
+        nombre_entrees = construit_livre(fichiers=[chemin_parties], chemin=chemin, coups_max=coups_max)
+        self.assertEqual(nombre_entrees, sum(len(coups) for coups in attendu.values()))
+        livre = self.ouvre(chemin=chemin)
+        self.assertEqual((livre.taille, livre.nombre_entrees), (taille, nombre_entrees))
+        for cle, coups in attendu.items():
+            self.assertEqual(livre.coups(cle=cle), [(coup, *statistiques)
+                                                    for coup, statistiques in sorted(coups.items())])
+
+    def test_recherche_dichotomique(self):
+        cle_max = (1 << 64) - 1
+        entrees = [(5, 1, 2, 3, 1, 1), (5, 3, 4, 1, 0, 0), (7, 5, 6, 2, 2, 0), (9, 1, 2, 1, 0, 1),
+                   (9, 3, 4, 4, 2, 1), (cle_max, 7, 8, 6, 3, 0)]
+        livre = self.ecrit_livre(taille=8, entrees=entrees)
+        for cle in (5, 7, 9, cle_max):
+            with self.subTest(cle=cle):
+                self.assertEqual(livre.coups(cle=cle), [((origine, destination), parties, victoires, nulles)
+                                                        for c, origine, destination, parties, victoires, nulles
+                                                        in entrees if c == cle])
+        for cle in (0, 4, 6, 8, 10, cle_max - 1):
+            with self.subTest(cle=cle):
+                self.assertEqual(livre.coups(cle=cle), [])
+
+    def test_livre_vide(self):
+        chemin = os.path.join(self.dossier.name, "vide.bin")
+        self.assertEqual(construit_livre(fichiers=[], chemin=chemin), 0)
+        livre = self.ouvre(chemin=chemin)
+        self.assertEqual(livre.nombre_entrees, 0)
+        self.assertEqual(livre.coups(cle=0), [])
+        self.assertEqual(livre.coups(cle=Board(taille=8).cle), [])
+        self.assertIsNone(self.ecrit_livre(taille=8, entrees=[]).choisit(plateau=Board(taille=8), joueur=1))
+
+    def test_choix(self):
+        plateau = Board(taille=8)
+        taille = plateau.taille
+        a, b, c = [(x_origine * taille + y_origine, x_destination * taille + y_destination)
+                   for (x_origine, y_origine), (x_destination, y_destination)
+                   in plateau.get_liste_coups_possible(joueur=1)[:3]]
+        # Le coup (0, 1) n'est pas possible : il est ignoré même s'il a le meilleur score.
+        entrees = sorted([(plateau.cle, *a, 10, 5, 0), (plateau.cle, *b, 30, 20, 10), (plateau.cle, *c, 2, 2, 0),
+                          (plateau.cle, 0, 1, 50, 50, 0)])
+        livre = self.ecrit_livre(taille=taille, entrees=entrees)
+        coordonnees = plateau.tables.coordonnees
+        coup_a, coup_b, coup_c = [(coordonnees[origine], coordonnees[destination])
+                                  for origine, destination in (a, b, c)]
+        self.assertEqual(livre.choisit(plateau=plateau, joueur=1, choix=MEILLEUR), coup_c)
+        livre.parties_min = 5
+        self.assertEqual(livre.choisit(plateau=plateau, joueur=1, choix=MEILLEUR), coup_b)
+        random.seed(0)
+        tirages = [livre.choisit(plateau=plateau, joueur=1, choix=ALEATOIRE) for _ in range(4000)]
+        self.assertEqual(set(tirages), {coup_a, coup_b})
+        self.assertAlmostEqual(tirages.count(coup_a) / len(tirages), 10 / 40, delta=0.03)
+        # La clé d'une position où c'est à l'autre joueur de jouer n'est pas dans le livre.
+        self.assertIsNone(livre.choisit(plateau=plateau, joueur=-1, choix=MEILLEUR))
+        self.assertIsNone(livre.choisit(plateau=Board(taille=6), joueur=1, choix=MEILLEUR))
+
+
+if __name__ == "__main__":
+    unittest.main()
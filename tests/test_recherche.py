@@ -0,0 +1,254 @@
+# Tests des algorithmes de recherche et des bots qui les utilisent.
+# Lancement depuis la racine du dépôt : python -m unittest
+import os
+import random
+import tempfile
+import unittest
+from concurrent.futures import Future
+
+from src.game_engine.board import Board
+from src.players.bots.algorithms.alpha_beta import AlphaBeta
+from src.players.bots.algorithms.finales import BaseFinales, SCORE_GAIN, genere_base_finales
+from src.players.bots.algorithms.minmax import MinMax
+from src.players.bots.algorithms.ordre_coups import OrdonnanceurCoups
+from src.players.bots.algorithms.parallele import LAZY_SMP, RACINE
+from src.players.bots.algorithms.statistiques import StatistiquesRecherche
+from src.players.bots.algorithms.transposition import TableTransposition
+from src.players.bots.bot import Albator, MinMaxBot
+from src.utils import TempsEcoule
+
+
+class TestApprofondissementIteratif(unittest.TestCase):
+    """
+    Vérifie que l'approfondissement itératif ne s'arrête avant la limite de temps que lorsque l'arbre de jeu est
+    entièrement exploré.
+    """
+
+    def test_limite_atteinte(self):
+        for classe in (MinMax, AlphaBeta):
+            with self.subTest(classe=classe.__name__):
+                algorithme = classe(plateau=Board(taille=8), joueur_actuel=1, profondeur=2)
+                algorithme.recherche_racine()
+                self.assertTrue(algorithme.limite_atteinte)
+                # Sur un plateau de taille 4, toutes les parties se terminent en moins de 10 demi-coups.
+                algorithme = classe(plateau=Board(taille=4), joueur_actuel=1, profondeur=10)
+                algorithme.recherche_racine()
+                self.assertFalse(algorithme.limite_atteinte)
+
+    def test_arret_arbre_explore(self):
+        for bot in (MinMaxBot(temps_max=30), Albator(temps_max=30), Albator(temps_max=30, quiescence=True)):
+            with self.subTest(bot=bot.nom):
+                plateau = Board(taille=4)
+                bot.set_jeu(plateau=plateau, valeur_pion=1)
+                bot.joue()
+                profondeur = bot.derniere_recherche["profondeur"]
+                self.assertLess(profondeur, bot.PROFONDEUR_MAX)
+                algorithme = MinMax(plateau=plateau, joueur_actuel=1, profondeur=profondeur - 1)
+                algorithme.recherche_racine()
+                self.assertTrue(algorithme.limite_atteinte)
+                self.assertEqual(plateau.historique, [])
+
+
+class TestVariantePrincipale(unittest.TestCase):
+    """
+    Vérifie que la variante principale retournée par la recherche commence par le meilleur coup et mène à une position
+    dont la valeur est celle de la racine.
+    """
+
+    def test_variante_valeur(self):
+        rng = random.Random(0)
+        for classe, profondeur in ((MinMax, 3), (AlphaBeta, 5)):
+            for taille in (6, 8):
+                plateau = Board(taille=taille)
+                while plateau.etat() is None:
+                    joueur = plateau.trait
+                    with self.subTest(classe=classe.__name__, taille=taille, coups=len(plateau.historique)):
+                        coup, valeur, variante = classe(plateau=plateau, joueur_actuel=joueur,
+                                                        profondeur=profondeur).recherche_racine()
+                        self.assertEqual(variante[0], coup)
+                        self.assertLessEqual(len(variante), profondeur)
+                        for coup_variante in variante:
+                            plateau.make_move(coup=coup_variante)
+                        feuille = classe(plateau=plateau, joueur_actuel=joueur * (-1) ** len(variante), profondeur=0)
+                        self.assertEqual(feuille.evaluate(), valeur)
+                        for _ in variante:
+                            plateau.unmake_move(enregistrement=plateau.historique[-1])
+                    plateau.make_move(coup=rng.choice(plateau.get_liste_coups_possible(joueur=joueur)))
+
+
+class ReserveFactice:
+    """
+    Réserve de processus remplaçant 'ProcessPoolExecutor' : chaque tâche soumise retourne le résultat suivant de la
+    liste donnée, dans l'ordre de soumission.
+    """
+
+    def __init__(self, resultats: list):
+        self.resultats = list(resultats)
+
+    def submit(self, fonction, *arguments):
+        tache = Future()
+        tache.set_result(self.resultats.pop(0))
+        return tache
+
+    def shutdown(self):
+        pass
+
+
+class TestRechercheParallele(unittest.TestCase):
+    """
+    Vérifie le choix du résultat de la recherche parallèle d'Albator lorsque des processus n'ont pas terminé.
+    """
+
+    def recherche(self, resultats: list, mode: str | None = RACINE):
+        plateau = Board(taille=8)
+        bot = Albator(workers=2, mode_parallele=mode)
+        bot.set_jeu(plateau=plateau, valeur_pion=1)
+        bot._reserve = ReserveFactice(resultats=[(resultat, 10, None, True) for resultat in resultats])
+        return bot._recherche(coups=plateau.get_liste_coups_possible(joueur=1), profondeur=3, limite_temps=None)
+
+    def test_tous_termines(self):
+        resultat = self.recherche(resultats=[("a", 0, ["a"]), ("b", 2, ["b"])])
+        self.assertEqual(resultat, ("b", 2, ["b"]))
+
+    def test_premier_termine(self):
+        resultat = self.recherche(resultats=[("a", 0, ["a"]), None])
+        self.assertEqual(resultat, ("a", 0, ["a"]))
+
+    def test_premier_interrompu(self):
+        with self.assertRaises(TempsEcoule):
+            self.recherche(resultats=[None, ("b", 2, ["b"])])
+        with self.assertRaises(TempsEcoule):
+            self.recherche(resultats=[None, None])
+
+    def test_lazy_smp(self):
+        resultat = self.recherche(resultats=[None, ("b", 2, ["b"])], mode=LAZY_SMP)
+        self.assertEqual(resultat, ("b", 2, ["b"]))
+
+
+class TestTableFinales(unittest.TestCase):
+    """
+    Vérifie qu'AlphaBeta avec une table de transposition et une base de finales retourne la même valeur que sans table
+    lorsque la table a été remplie par la recherche d'une position précédente (comme Albator, qui conserve la table
+    d'un coup à l'autre) : les scores de gain de la base ne doivent pas dépendre du ply auquel ils ont été enregistrés.
+    Vérifie aussi qu'un gain immédiat est préféré aux gains plus lents trouvés dans la base.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dossier = tempfile.TemporaryDirectory()
+        chemin = os.path.join(cls.dossier.name, "finales.bin")
+        genere_base_finales(taille=6, pions_max=3, chemin=chemin)
+        cls.base = BaseFinales(chemin=chemin)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.base.ferme()
+        cls.dossier.cleanup()
+
+    def positions(self, nombre: int, nombre_pions: int):
+        rng = random.Random(0)
+        cases_jouables = self.base.index.cases_jouables
+        positions = []
+        while len(positions) < nombre:
+            cases = rng.sample(cases_jouables, nombre_pions)
+            nombre_blancs = rng.randint(1, nombre_pions - 1)
+            joueur = rng.choice((1, -1))
+            plateau = Board.depuis_bitboards(taille=6, blancs=sum(1 << i for i in cases[:nombre_blancs]),
+                                             noirs=sum(1 << i for i in cases[nombre_blancs:]), trait=joueur)
+            if plateau.etat() is None:
+                positions.append((plateau, joueur))
+        return positions
+
+    def test_table_conservee(self):
+        for nombre_pions, profondeur in ((4, 4), (5, 6)):
+            for plateau, joueur in self.positions(nombre=60, nombre_pions=nombre_pions):
+                table = TableTransposition(taille_mo=1)
+                AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=profondeur, table=table,
+                          base_finales=self.base).evaluate()
+                for coup in plateau.get_liste_coups_possible(joueur=joueur):
+                    enregistrement = plateau.make_move(coup=coup)
+                    if plateau.etat() is None:
+                        avec_table = AlphaBeta(plateau=plateau, joueur_actuel=-joueur, profondeur=profondeur - 1,
+                                               table=table, base_finales=self.base).evaluate()
+                        sans_table = AlphaBeta(plateau=plateau, joueur_actuel=-joueur, profondeur=profondeur - 1,
+                                               base_finales=self.base).evaluate()
+                        self.assertEqual(avec_table, sans_table)
+                    plateau.unmake_move(enregistrement=enregistrement)
+
+    def test_gain_immediat(self):
+        gains_immediats = 0
+        for nombre_pions in (3, 4):
+            for plateau, joueur in self.positions(nombre=300, nombre_pions=nombre_pions):
+                gagnants = []
+                for coup in plateau.get_liste_coups_possible(joueur=joueur):
+                    enregistrement = plateau.make_move(coup=coup)
+                    if plateau.etat() == joueur:
+                        gagnants.append(coup)
+                    plateau.unmake_move(enregistrement=enregistrement)
+                if not gagnants:
+                    continue
+                gains_immediats += 1
+                coup, valeur, _ = AlphaBeta(plateau=plateau, joueur_actuel=joueur, profondeur=3, quiescence=True,
+                                            base_finales=self.base).recherche_racine()
+                self.assertIn(coup, gagnants)
+                self.assertEqual(valeur, joueur * (SCORE_GAIN - 1))
+        self.assertGreater(gains_immediats, 0)
+
+
+class TestStatistiques(unittest.TestCase):
+    """
+    Vérifie que les appels comptés directement par les recherches sont ceux des fonctions du plateau et de la fonction
+    d'évaluation, et que les statistiques ne modifient pas les valeurs trouvées.
+    """
+
+    @staticmethod
+    def compte_appels(plateau: Board, classe: type, appels: dict):
+        """
+        Remplace les fonctions du plateau appelées par les recherches par des fonctions comptant leurs appels, et
+        retourne une sous-classe de l'algorithme comptant les appels de sa fonction d'évaluation.
+        """
+        noms = {"get_liste_coups_possible": "generation", "remplit_coups": "generation",
+                "remplit_deplacements": "generation", "make_move_code": "make_move", "unmake_move_rapide": "unmake_move",
+                "etat": "etat"}
+        for methode, nom in noms.items():
+            def fonction_comptee(*args, fonction=getattr(plateau, methode), nom=nom, **kwargs):
+                appels[nom] += 1
+                return fonction(*args, **kwargs)
+            setattr(plateau, methode, fonction_comptee)
+
+        class AlgorithmeCompte(classe):
+            def evaluate_node(self):
+                appels["evaluate_node"] += 1
+                return super().evaluate_node()
+        return AlgorithmeCompte
+
+    def test_appels(self):
+        configurations = {
+            "MinMax": (MinMax, {"profondeur": 3}),
+            "AlphaBeta": (AlphaBeta, {"profondeur": 4}),
+            "AlphaBeta complet": (AlphaBeta, {"profondeur": 4, "ordonnanceur": OrdonnanceurCoups(), "quiescence": True,
+                                              "noeuds_quiescence_max": 200, "pvs": True}),
+        }
+        for nom, (classe, parametres) in configurations.items():
+            for periode in (1, 64):
+                with self.subTest(algorithme=nom, periode=periode):
+                    plateau = Board(taille=8)
+                    for coup in ((5, 0), (4, 1)), ((2, 3), (3, 2)), ((5, 2), (4, 3)):
+                        plateau.joue(*coup)
+                    table = {"table": TableTransposition(taille_mo=1)} if classe is AlphaBeta else {}
+                    valeur_sans = classe(plateau=plateau, joueur_actuel=plateau.trait, **table,
+                                         **parametres).recherche_racine()[1]
+                    appels = dict.fromkeys(("generation", "make_move", "unmake_move", "etat", "evaluate_node"), 0)
+                    classe_comptee = self.compte_appels(plateau=plateau, classe=classe, appels=appels)
+                    statistiques = StatistiquesRecherche(periode=periode)
+                    table = {"table": TableTransposition(taille_mo=1)} if classe is AlphaBeta else {}
+                    valeur = classe_comptee(plateau=plateau, joueur_actuel=plateau.trait, statistiques=statistiques,
+                                            **table, **parametres).recherche_racine()[1]
+                    self.assertEqual(valeur, valeur_sans)
+                    self.assertEqual(statistiques.appels, appels)
+                    self.assertEqual(statistiques.feuilles, appels["evaluate_node"])
+                    self.assertGreater(statistiques.temps["make_move"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
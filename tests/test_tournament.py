@@ -0,0 +1,51 @@
+# Tests des statistiques des tournois.
+# Lancement depuis la racine du dépôt : python -m unittest
+import math
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from src.game_engine.tournament import statistiques
+
+
+class TestStatistiques(unittest.TestCase):
+    """
+    Vérifie les statistiques d'un tournoi, en particulier sans partie et pour un score parfait ou nul.
+    """
+
+    def test_aucune_partie(self):
+        resultats = statistiques(scores=[], duree=1.0)
+        self.assertEqual(resultats["parties"], 0)
+        self.assertIsNone(resultats["score"])
+        self.assertIsNone(resultats["elo"])
+
+    def test_score_parfait(self):
+        resultats = statistiques(scores=[1] * 10, duree=1.0)
+        self.assertTrue(math.isfinite(resultats["elo"]) and resultats["elo"] > 0)
+        self.assertTrue(math.isfinite(resultats["elo_min"]))
+        self.assertIsNone(resultats["elo_max"])
+
+    def test_score_nul(self):
+        resultats = statistiques(scores=[0] * 10, duree=1.0)
+        self.assertTrue(math.isfinite(resultats["elo"]) and resultats["elo"] < 0)
+        self.assertIsNone(resultats["elo_min"])
+        self.assertTrue(math.isfinite(resultats["elo_max"]))
+
+    def test_intervalle(self):
+        resultats = statistiques(scores=[1, 0, 0.5, 1, 0, 1, 0.5, 0.5], duree=2.0)
+        self.assertEqual((resultats["victoires"], resultats["nulles"], resultats["defaites"]), (3, 3, 2))
+        self.assertLess(resultats["elo_min"], resultats["elo"])
+        self.assertLess(resultats["elo"], resultats["elo_max"])
+        self.assertEqual(resultats["parties_par_seconde"], 4.0)
+
+    def test_sans_numpy(self):
+        # Le module de base de positions (NumPy) n'est importé que pour enregistrer les positions.
+        sortie = subprocess.run([sys.executable, "-c", "import sys, src.game_engine.tournament; "
+                                                       "print('numpy' in sys.modules)"],
+                                cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True, check=True)
+        self.assertEqual(sortie.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Tests de la table de transposition (entrées compactées sur deux mots de 64 bits).
+# Lancement depuis la racine du dépôt : python -m unittest
+import random
+import unittest
+
+from src.players.bots.algorithms.transposition import (DECALAGE_SCORE, EXACTE, INFERIEURE, SUPERIEURE,
+                                                       TableTransposition)
+
+
+class TestTableTransposition(unittest.TestCase):
+    """
+    Vérifie que les entrées enregistrées sont relues à l'identique (scores négatifs et extrêmes, sans coup, clés de 0
+    à 2^64 - 1), et qu'une entrée déchirée (mots écrits par deux enregistrements différents) ou d'une autre clé du
+    même compartiment n'est pas reconnue.
+    """
+
+    def setUp(self):
+        self.table = TableTransposition(taille_mo=1)
+
+    def indice(self, cle: int):
+        return (cle & self.table.masque) << 2
+
+    def test_aller_retour(self):
+        rng = random.Random(0)
+        scores = [-DECALAGE_SCORE, -DECALAGE_SCORE + 1, -1000, -1, 0, 1, 1000, DECALAGE_SCORE - 1]
+        coups = [None, (0, 0), (0, 99), (99, 0), (63, 54), (126, 127)]
+        cles = [0, 1, (1 << 64) - 1] + [rng.getrandbits(64) for _ in range(300)]
+        for n, cle in enumerate(cles):
+            score = scores[n] if n < len(scores) else rng.randrange(-DECALAGE_SCORE, DECALAGE_SCORE)
+            entree = (rng.choice((0, 1, 254, rng.randrange(255))), rng.choice((EXACTE, INFERIEURE, SUPERIEURE)), score,
+                      coups[n % len(coups)])
+            with self.subTest(cle=cle, entree=entree):
+                self.table.vide()
+                self.table.enregistre(cle, *entree)
+                self.assertEqual(self.table.sonde(cle=cle), entree)
+
+    def test_sans_coup(self):
+        self.table.enregistre(cle=12345, profondeur=3, borne=SUPERIEURE, score=-250)
+        self.assertEqual(self.table.sonde(cle=12345), (3, SUPERIEURE, -250, None))
+        self.table.enregistre(cle=12345, profondeur=3, borne=EXACTE, score=-250, coup=(0, 9))
+        self.assertEqual(self.table.sonde(cle=12345), (3, EXACTE, -250, (0, 9)))
+
+    def test_score_hors_limites(self):
+        for score in (-DECALAGE_SCORE - 1, DECALAGE_SCORE):
+            with self.assertRaises(AssertionError):
+                self.table.enregistre(cle=1, profondeur=1, borne=EXACTE, score=score)
+
+    def test_deux_entrees_par_compartiment(self):
+        cle = 0x123456789ABCDEF0
+        autre_cle = cle + self.table.nombre_compartiments  # même compartiment
+        self.table.enregistre(cle=cle, profondeur=6, borne=EXACTE, score=-40, coup=(10, 19))
+        self.table.enregistre(cle=autre_cle, profondeur=2, borne=INFERIEURE, score=-7)
+        self.assertEqual(self.table.sonde(cle=cle), (6, EXACTE, -40, (10, 19)))
+        self.assertEqual(self.table.sonde(cle=autre_cle), (2, INFERIEURE, -7, None))
+        self.assertIsNone(self.table.sonde(cle=cle + 2 * self.table.nombre_compartiments))
+
+    def test_cle_differente(self):
+        self.assertIsNone(self.table.sonde(cle=0))
+        cle = 0xFEDCBA9876543210
+        self.table.enregistre(cle=cle, profondeur=4, borne=EXACTE, score=-12, coup=(3, 12))
+        for autre_cle in (cle ^ 1, cle ^ (1 << 63), cle + self.table.nombre_compartiments):
+            with self.subTest(cle=autre_cle):
+                self.assertIsNone(self.table.sonde(cle=autre_cle))
+        self.assertEqual(self.table.statistiques()["succes"], 0)
+
+    def test_entree_dechiree(self):
+        entrees = self.table.entrees
+        cle = 0x0F0F0F0F0F0F0F0F
+        autre_cle = cle + self.table.nombre_compartiments  # même compartiment
+        i = self.indice(cle=cle)
+        self.table.enregistre(cle=cle, profondeur=5, borne=EXACTE, score=-300, coup=(20, 29))
+        mot_cle, mot_donnees = entrees[i], entrees[i + 1]
+        # Les deux mots d'une entrée proviennent de deux enregistrements de la même position (écritures concurrentes de
+        # deux processus) : l'entrée n'est pas reconnue.
+        self.table.enregistre(cle=cle, profondeur=7, borne=INFERIEURE, score=150, coup=(29, 38))
+        entrees[i] = mot_cle
+        self.assertIsNone(self.table.sonde(cle=cle))
+        # De même lorsque les deux mots proviennent des enregistrements de deux positions différentes.
+        self.table.enregistre(cle=autre_cle, profondeur=9, borne=EXACTE, score=-1, coup=(1, 10))
+        self.assertEqual(self.table.sonde(cle=autre_cle), (9, EXACTE, -1, (1, 10)))
+        entrees[i + 1] = mot_donnees
+        self.assertIsNone(self.table.sonde(cle=autre_cle))
+        self.assertIsNone(self.table.sonde(cle=cle))
+
+
+if __name__ == "__main__":
+    unittest.main()